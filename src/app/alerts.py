@@ -3,6 +3,16 @@
 from datetime import datetime
 
 
+def timestamp() -> str:
+    """Return the current local time for log prefixes.
+    
+    Returns:
+        Time formatted as YYYY-MM-DD HH:MM:SS
+    """
+    # isoformat skips strftime's format parsing and locale handling
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
 def send_alert(msg: str) -> None:
     """Send an alert message.
     
@@ -11,6 +21,5 @@ def send_alert(msg: str) -> None:
     Args:
         msg: Alert message to send
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[ALERT {timestamp}] {msg}")
+    print(f"[ALERT {timestamp()}] {msg}")
 
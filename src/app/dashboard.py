@@ -1,21 +1,27 @@
 """Main Streamlit dashboard for Argentina Reform Investment Analysis."""
 
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import duckdb
 
+from src.config.settings import get_settings
 from src.data.db import connect
 from src.features.fx_gap import compute as compute_fx_gap
 from src.features.reserves_momentum import compute as compute_reserves_momentum
-from src.features.cpi_corridors import compute as compute_cpi_corridor, corridor
+from src.features.cpi_corridors import compute as compute_cpi_corridor, corridor, latest_core_cpi_3m_ann
 from src.features.embi_bands import compute as compute_embi_bands
 from src.triggers.gates import evaluate_states
 from src.models.sharpe_engine import FXState
-import subprocess
-import sys
 
 
 def get_latest_embi_and_trend(conn: "duckdb.DuckDBPyConnection") -> tuple[float, float]:
@@ -24,38 +30,26 @@ def get_latest_embi_and_trend(conn: "duckdb.DuckDBPyConnection") -> tuple[float,
     Returns:
         Tuple of (current_level, trend_30d) in basis points
     """
-    # Get latest EMBI
-    latest_query = """
-        SELECT ts, value 
-        FROM fact_series 
-        WHERE series_id = 'EMBI_AR'
-        ORDER BY ts DESC 
-        LIMIT 1
+    # Latest level and the last observation at least 30 days earlier, in one scan
+    query = """
+        WITH s AS (
+            SELECT ts, value 
+            FROM fact_series 
+            WHERE series_id = 'EMBI_AR'
+        )
+        SELECT 
+            arg_max(value, ts) AS latest_value,
+            arg_max(value, ts) FILTER (
+                WHERE ts <= (SELECT MAX(ts) FROM s) - INTERVAL 30 DAY
+            ) AS value_30d_ago
+        FROM s
     """
-    latest_result = conn.execute(latest_query).fetchone()
+    latest_value, value_30d_ago = conn.execute(query).fetchone()
     
-    if not latest_result:
+    if latest_value is None:
         return None, None
     
-    latest_ts, latest_value = latest_result
-    
-    # Get value 30 days ago
-    date_30d_ago = latest_ts - timedelta(days=30)
-    trend_query = """
-        SELECT value 
-        FROM fact_series 
-        WHERE series_id = 'EMBI_AR'
-            AND ts <= ?
-        ORDER BY ts DESC 
-        LIMIT 1
-    """
-    trend_result = conn.execute(trend_query, [date_30d_ago]).fetchone()
-    
-    if trend_result:
-        value_30d_ago = trend_result[0]
-        trend = latest_value - value_30d_ago
-    else:
-        trend = None
+    trend = latest_value - value_30d_ago if value_30d_ago is not None else None
     
     return latest_value, trend
 
@@ -66,33 +60,10 @@ def get_latest_core_cpi_3m_ann(conn: "duckdb.DuckDBPyConnection") -> tuple[float
     Returns:
         Tuple of (3m_annualized_rate, corridor_dict) or (None, None)
     """
-    # Get latest two CPI values for 3-month calculation
-    cpi_query = """
-        SELECT ts, value 
-        FROM fact_series 
-        WHERE series_id = 'CPI_CORE'
-        ORDER BY ts DESC 
-        LIMIT 2
-    """
-    results = conn.execute(cpi_query).fetchall()
-    
-    if len(results) < 2:
-        return None, None
-    
-    latest_ts, latest_value = results[0]
-    prev_ts, prev_value = results[1]
-    
-    # Calculate months between readings
-    days_diff = (latest_ts - prev_ts).days
-    months = days_diff / 30.0
-    
-    if months == 0:
+    annualized_3m = latest_core_cpi_3m_ann(conn)
+    if annualized_3m is None:
         return None, None
     
-    # Calculate 3-month annualized rate
-    monthly_rate = (latest_value / prev_value) - 1
-    annualized_3m = ((1 + monthly_rate) ** (3 / months)) - 1
-    
     # Get corridor (using placeholder fx_pass for now)
     # For now, use simple corridor function with placeholder inputs
     corridor_dict = corridor(fx_pass=0.5)  # 50% fx_pass placeholder
@@ -100,69 +71,227 @@ def get_latest_core_cpi_3m_ann(conn: "duckdb.DuckDBPyConnection") -> tuple[float
     return annualized_3m, corridor_dict
 
 
-def refresh_data():
-    """Trigger data refresh."""
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "src.data.refresh_all"],
-            capture_output=True,
-            text=True,
-            timeout=300
+def get_data_version() -> str:
+    """Return a cheap cache key that changes whenever the database is written.
+    
+    Uses the modification times of the DuckDB file and its WAL, so cached reads
+    are invalidated after any refresh without opening a connection.
+    
+    Returns:
+        Version string (empty if the database does not exist yet)
+    """
+    db_path = get_settings().DUCKDB_PATH
+    mtimes = []
+    for path in (db_path, f"{db_path}.wal"):
+        try:
+            mtimes.append(str(os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+    return ":".join(mtimes)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_metrics(data_version: str) -> dict:
+    """Compute all dashboard metrics from DuckDB, memoized per data version.
+    
+    Opens a short-lived read-only connection per cache miss, so the dashboard
+    never holds the database lock between reruns and the watcher and pullers
+    can write in the meantime.
+    
+    Args:
+        data_version: Cache key from get_data_version(); a new value forces a re-read
+        
+    Returns:
+        Dictionary with fx_gap, reserves_mom, cpi_3m_ann, cpi_corridor,
+        embi_level and embi_trend entries (all None before the first refresh)
+    """
+    if not data_version:
+        # No database file yet; a read-only connection cannot create one
+        return dict.fromkeys(
+            ["fx_gap", "reserves_mom", "cpi_3m_ann", "cpi_corridor", "embi_level", "embi_trend"]
         )
-        if result.returncode == 0:
-            return True, result.stdout
-        else:
-            return False, result.stderr
-    except Exception as e:
-        return False, str(e)
+    
+    conn = connect(read_only=True)
+    try:
+        fx_gap_result = compute_fx_gap(conn=conn)
+        reserves_mom_result = compute_reserves_momentum(conn=conn)
+        cpi_3m_ann, cpi_corridor = get_latest_core_cpi_3m_ann(conn)
+        embi_level, embi_trend = get_latest_embi_and_trend(conn)
+    finally:
+        conn.close()
+    
+    return {
+        "fx_gap": fx_gap_result,
+        "reserves_mom": reserves_mom_result,
+        "cpi_3m_ann": cpi_3m_ann,
+        "cpi_corridor": cpi_corridor,
+        "embi_level": embi_level,
+        "embi_trend": embi_trend,
+    }
 
 
-def run_tests():
-    """Run test suite."""
+def _stream_subprocess(cmd: list[str], timeout: float, max_lines: int = 200) -> tuple[bool, str]:
+    """Run a command, streaming its combined output into the page as it arrives.
+    
+    Only the last max_lines lines are kept, so chatty commands do not grow
+    the Streamlit process's memory.
+    
+    Args:
+        cmd: Command argv
+        timeout: Seconds before the process is killed
+        max_lines: Number of trailing output lines to keep and display
+        
+    Returns:
+        Tuple of (success, trailing output)
+    """
+    placeholder = st.empty()
+    tail = deque(maxlen=max_lines)
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "src/tests", "-v"],
-            capture_output=True,
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=60
+            bufsize=1,
         )
-        return result.returncode == 0, result.stdout + result.stderr
     except Exception as e:
         return False, str(e)
+    
+    # Kill on timeout even if the process stops producing output
+    timed_out = threading.Event()
+    
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            tail.append(line)
+            placeholder.code("".join(tail), language="text")
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    placeholder.empty()
+    
+    output = "".join(tail)
+    if timed_out.is_set():
+        output += f"\nTimed out after {timeout:.0f}s"
+    return returncode == 0, output
 
 
-# Page config
-st.set_page_config(
-    page_title="Argentina Reform Investment Analysis",
-    page_icon="📊",
-    layout="wide",
-)
+def refresh_data():
+    """Trigger data refresh."""
+    return _stream_subprocess([sys.executable, "-m", "src.data.refresh_all"], timeout=300)
 
-# Initialize session state
-if "last_refresh" not in st.session_state:
-    st.session_state.last_refresh = "Never"
 
-# Sidebar
-with st.sidebar:
-    st.title("📊 Dashboard")
-    st.divider()
+def run_tests():
+    """Run test suite, in parallel when pytest-xdist is installed."""
+    cmd = [sys.executable, "-m", "pytest", "src/tests", "-q"]
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += ["-n", "auto"]
+    return _stream_subprocess(cmd, timeout=60)
+
+
+@st.fragment
+def render_fx_card(data_version: str) -> None:
+    """Render the FX metric card; reruns independently of the rest of the page."""
+    fx_gap_result = load_metrics(data_version)["fx_gap"]
     
-    st.markdown("**Last refresh:**")
-    st.text(st.session_state.last_refresh)
+    st.markdown("### 💱 FX")
+    if fx_gap_result:
+        # Format source tags
+        official_source = "BCRA" if fx_gap_result.used_official == "USDARS_OFFICIAL" else "Bluelytics"
+        parallel_source = "Bluelytics"  # Both USDARS_PARALLEL and USDARS_BLUE come from Bluelytics
     
-    st.divider()
+        st.metric(
+            label="Official / Parallel",
+            value=f"${fx_gap_result.official_rate:.2f} / ${fx_gap_result.parallel_rate:.2f}" if fx_gap_result.parallel_rate else "N/A",
+        )
     
-    if st.button("🔄 Refresh Data", use_container_width=True):
-        with st.spinner("Refreshing data..."):
-            success, output = refresh_data()
-            if success:
-                st.session_state.last_refresh = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                st.success("Data refreshed successfully!")
-                st.code(output, language="text")
-            else:
-                st.error("Refresh failed!")
-                st.code(output, language="text")
+        # Show source tags
+        st.caption(f"Official: {fx_gap_result.official_rate:.1f} ({official_source})")
+        if fx_gap_result.parallel_rate:
+            st.caption(f"Parallel: {fx_gap_result.parallel_rate:.1f} ({parallel_source})")
+    
+        gap_pct = (fx_gap_result.gap * 100) if fx_gap_result.gap is not None else None
+        if gap_pct is not None:
+            st.metric(
+                label="Gap",
+                value=f"{gap_pct:.2f}%",
+                delta=None,
+            )
+        else:
+            st.warning("Gap calculation unavailable")
+    else:
+        st.warning("No FX data")
+
+
+@st.fragment
+def render_reserves_card(data_version: str) -> None:
+    """Render the reserves metric card; reruns independently of the rest of the page."""
+    reserves_mom_result = load_metrics(data_version)["reserves_mom"]
+    
+    st.markdown("### 💰 Reserves")
+    if reserves_mom_result:
+        mom_pct = reserves_mom_result.value * 100
+        st.metric(
+            label="4W Momentum",
+            value=f"{mom_pct:.2f}%",
+            delta=f"{mom_pct:+.2f}%" if mom_pct else None,
+        )
+        if reserves_mom_result.reserves_current:
+            st.caption(f"Current: ${reserves_mom_result.reserves_current:.0f}M")
+    else:
+        st.warning("No reserves data")
+
+
+@st.fragment
+def render_cpi_card(data_version: str) -> None:
+    """Render the CPI metric card; reruns independently of the rest of the page."""
+    metrics = load_metrics(data_version)
+    cpi_3m_ann, cpi_corridor = metrics["cpi_3m_ann"], metrics["cpi_corridor"]
+    
+    st.markdown("### 📈 CPI")
+    if cpi_3m_ann is not None:
+        cpi_pct = cpi_3m_ann * 100
+        st.metric(
+            label="Core 3M Annualized",
+            value=f"{cpi_pct:.1f}%",
+        )
+        if cpi_corridor:
+            st.caption(f"Corridor: {cpi_corridor['low']*100:.1f}% - {cpi_corridor['high']*100:.1f}%")
+    else:
+        st.warning("No CPI data")
+
+
+@st.fragment
+def render_embi_card(data_version: str) -> None:
+    """Render the EMBI metric card; reruns independently of the rest of the page."""
+    metrics = load_metrics(data_version)
+    embi_level, embi_trend = metrics["embi_level"], metrics["embi_trend"]
     
+    st.markdown("### 📊 EMBI")
+    if embi_level is not None:
+        st.metric(
+            label="Level",
+            value=f"{embi_level:.0f} bps",
+        )
+        if embi_trend is not None:
+            st.metric(
+                label="Δ 30d",
+                value=f"{embi_trend:+.0f} bps",
+                delta=f"{embi_trend:+.0f} bps" if embi_trend != 0 else None,
+            )
+    else:
+        st.warning("No EMBI data")
+
+
+@st.fragment
+def render_test_runner() -> None:
+    """Render the test-runner button; clicking it does not rerun the metric cards."""
     if st.button("🧪 Run Tests", use_container_width=True):
         with st.spinner("Running tests..."):
             success, output = run_tests()
@@ -172,111 +301,70 @@ with st.sidebar:
                 st.warning("Some tests failed or had errors")
             st.code(output, language="text")
 
-# Main content
-st.title("Argentina Reform Investment Analysis")
-st.markdown("---")
-
-# Connect to database
-try:
-    conn = connect()
-    
-    # Compute features
-    fx_gap_result = compute_fx_gap(conn=conn)
-    reserves_mom_result = compute_reserves_momentum(conn=conn)
-    cpi_3m_ann, cpi_corridor = get_latest_core_cpi_3m_ann(conn)
-    embi_level, embi_trend = get_latest_embi_and_trend(conn)
-    
-    # Close connection after reading
-    conn.close()
-    
-    # Metric cards
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("### 💱 FX")
-        if fx_gap_result:
-            # Format source tags
-            official_source = "BCRA" if fx_gap_result.used_official == "USDARS_OFFICIAL" else "Bluelytics"
-            parallel_source = "Bluelytics"  # Both USDARS_PARALLEL and USDARS_BLUE come from Bluelytics
-            
-            st.metric(
-                label="Official / Parallel",
-                value=f"${fx_gap_result.official_rate:.2f} / ${fx_gap_result.parallel_rate:.2f}" if fx_gap_result.parallel_rate else "N/A",
-            )
-            
-            # Show source tags
-            st.caption(f"Official: {fx_gap_result.official_rate:.1f} ({official_source})")
-            if fx_gap_result.parallel_rate:
-                st.caption(f"Parallel: {fx_gap_result.parallel_rate:.1f} ({parallel_source})")
-            
-            gap_pct = (fx_gap_result.gap * 100) if fx_gap_result.gap is not None else None
-            if gap_pct is not None:
-                st.metric(
-                    label="Gap",
-                    value=f"{gap_pct:.2f}%",
-                    delta=None,
-                )
-            else:
-                st.warning("Gap calculation unavailable")
-        else:
-            st.warning("No FX data")
-    
-    with col2:
-        st.markdown("### 💰 Reserves")
-        if reserves_mom_result:
-            mom_pct = reserves_mom_result.value * 100
-            st.metric(
-                label="4W Momentum",
-                value=f"{mom_pct:.2f}%",
-                delta=f"{mom_pct:+.2f}%" if mom_pct else None,
-            )
-            if reserves_mom_result.reserves_current:
-                st.caption(f"Current: ${reserves_mom_result.reserves_current:.0f}M")
-        else:
-            st.warning("No reserves data")
-    
-    with col3:
-        st.markdown("### 📈 CPI")
-        if cpi_3m_ann is not None:
-            cpi_pct = cpi_3m_ann * 100
-            st.metric(
-                label="Core 3M Annualized",
-                value=f"{cpi_pct:.1f}%",
-            )
-            if cpi_corridor:
-                st.caption(f"Corridor: {cpi_corridor['low']*100:.1f}% - {cpi_corridor['high']*100:.1f}%")
-        else:
-            st.warning("No CPI data")
-    
-    with col4:
-        st.markdown("### 📊 EMBI")
-        if embi_level is not None:
-            st.metric(
-                label="Level",
-                value=f"{embi_level:.0f} bps",
-            )
-            if embi_trend is not None:
-                st.metric(
-                    label="Δ 30d",
-                    value=f"{embi_trend:+.0f} bps",
-                    delta=f"{embi_trend:+.0f} bps" if embi_trend != 0 else None,
-                )
-        else:
-            st.warning("No EMBI data")
-    
-    st.markdown("---")
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_evaluation(data_version: str) -> Optional[dict]:
+    """Evaluate gate states from the cached metrics.
     
-    # Overall state and evaluation
-    if all([fx_gap_result, fx_gap_result.gap is not None, reserves_mom_result, cpi_3m_ann is not None, embi_level is not None, embi_trend is not None]):
-        # Prepare inputs for gate evaluation
-        evaluation = evaluate_states(
-            fx_gap=fx_gap_result.gap,
-            reserves_mom_4w=reserves_mom_result.value,
-            core_cpi_3m_ann=cpi_3m_ann,
-            embi_level=embi_level,
-            embi_trend_30d=embi_trend,
-        )
+    Args:
+        data_version: Cache key from get_data_version()
         
+    Returns:
+        evaluate_states() result, or None if any input is missing
+    """
+    metrics = load_metrics(data_version)
+    fx_gap_result = metrics["fx_gap"]
+    reserves_mom_result = metrics["reserves_mom"]
+    if not all([
+        fx_gap_result,
+        fx_gap_result and fx_gap_result.gap is not None,
+        reserves_mom_result,
+        metrics["cpi_3m_ann"] is not None,
+        metrics["embi_level"] is not None,
+        metrics["embi_trend"] is not None,
+    ]):
+        return None
+    
+    return evaluate_states(
+        fx_gap=fx_gap_result.gap,
+        reserves_mom_4w=reserves_mom_result.value,
+        core_cpi_3m_ann=metrics["cpi_3m_ann"],
+        embi_level=metrics["embi_level"],
+        embi_trend_30d=metrics["embi_trend"],
+    )
+
+
+def render_sidebar() -> None:
+    """Render the sidebar with refresh and test controls."""
+    with st.sidebar:
+        st.title("📊 Dashboard")
+        st.divider()
+
+        st.markdown("**Last refresh:**")
+        st.text(st.session_state.last_refresh)
+
+        st.divider()
+
+        if st.button("🔄 Refresh Data", use_container_width=True):
+            with st.spinner("Refreshing data..."):
+                success, output = refresh_data()
+                if success:
+                    st.session_state.last_refresh = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    load_metrics.clear()
+                    load_evaluation.clear()
+                    st.success("Data refreshed successfully!")
+                    st.code(output, language="text")
+                else:
+                    st.error("Refresh failed!")
+                    st.code(output, language="text")
+
+        render_test_runner()
+
+
+def render_overall_state(data_version: str) -> None:
+    """Render the overall state badge, action bar and dimension states."""
+    evaluation = load_evaluation(data_version)
+    if evaluation is not None:
         # Overall state badge
         state = evaluation["overall_state"]
         if state == FXState.GREEN:
@@ -288,32 +376,32 @@ try:
         else:
             badge = "🔴 RED"
             color = "red"
-        
+
         st.markdown("### Overall State")
         st.markdown(f'<div style="font-size: 24px; color: {color}; font-weight: bold;">{badge}</div>', unsafe_allow_html=True)
-        
+
         st.markdown("---")
-        
+
         # Action bar
         st.markdown("### Action Bar")
         action_col1, action_col2, action_col3 = st.columns([1, 1, 2])
-        
+
         with action_col1:
             st.metric(
                 label="Suggested Macro Weight",
                 value=f"{evaluation['macro_weight']:.1%}",
             )
-        
+
         with action_col2:
             st.metric(
                 label="Hedge %",
                 value=f"{evaluation['hedge_pct']:.0%}",
             )
-        
+
         with action_col3:
             st.markdown("**Rationale:**")
             st.info(evaluation["action_note"])
-        
+
         # Dimension states detail
         with st.expander("View Dimension States"):
             dim_states = evaluation["dimension_states"]
@@ -325,12 +413,57 @@ try:
                 else:
                     state_emoji = "🔴"
                 st.markdown(f"- **{dim_name.replace('_', ' ').title()}:** {state_emoji} {dim_state.value}")
-    
+
     else:
         st.warning("⚠️ Incomplete data - cannot compute overall state. Please refresh data.")
         st.info("Missing data for one or more metrics. Click 'Refresh Data' in the sidebar to pull latest data.")
 
-except Exception as e:
-    st.error(f"Error loading dashboard: {e}")
-    st.exception(e)
 
+def render() -> None:
+    """Render the full dashboard page."""
+    st.set_page_config(
+        page_title="Argentina Reform Investment Analysis",
+        page_icon="📊",
+        layout="wide",
+    )
+    
+    # Initialize session state
+    if "last_refresh" not in st.session_state:
+        st.session_state.last_refresh = "Never"
+    
+    render_sidebar()
+    
+    # Main content
+    st.title("Argentina Reform Investment Analysis")
+    st.markdown("---")
+    
+    try:
+        # Queries run only when the data version changes; reruns hit the cache
+        data_version = get_data_version()
+        
+        # Metric cards
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            render_fx_card(data_version)
+        
+        with col2:
+            render_reserves_card(data_version)
+        
+        with col3:
+            render_cpi_card(data_version)
+        
+        with col4:
+            render_embi_card(data_version)
+        
+        st.markdown("---")
+        
+        # Overall state and evaluation
+        render_overall_state(data_version)
+    
+    except Exception as e:
+        st.error(f"Error loading dashboard: {e}")
+        st.exception(e)
+
+
+render()
@@ -1,16 +1,16 @@
 """Watcher script to monitor state changes and send alerts."""
 
+import argparse
 import time
 from datetime import datetime
 
 import schedule
 
 from ..data.db import connect
-from ..features.fx_gap import compute as compute_fx_gap
-from ..features.reserves_momentum import compute as compute_reserves_momentum
+from ..features.cpi_corridors import CORE_CPI_3M_ANN_QUERY
 from ..triggers.gates import evaluate_states
 from ..models.sharpe_engine import FXState
-from .alerts import send_alert
+from .alerts import send_alert, timestamp
 
 
 def get_last_saved_state(conn) -> str | None:
@@ -58,84 +58,82 @@ def save_state(conn, state: str) -> None:
     conn.commit()
 
 
-def get_latest_embi_and_trend(conn) -> tuple[float | None, float | None]:
-    """Get latest EMBI level and 30-day trend.
-    
-    Returns:
-        Tuple of (current_level, trend_30d) in basis points
-    """
-    from datetime import timedelta
-    
-    # Get latest EMBI
-    latest_query = """
-        SELECT ts, value 
-        FROM fact_series 
-        WHERE series_id = 'EMBI_AR'
-        ORDER BY ts DESC 
-        LIMIT 1
-    """
-    latest_result = conn.execute(latest_query).fetchone()
-    
-    if not latest_result:
-        return None, None
-    
-    latest_ts, latest_value = latest_result
-    
-    # Get value 30 days ago
-    date_30d_ago = latest_ts - timedelta(days=30)
-    trend_query = """
-        SELECT value 
-        FROM fact_series 
-        WHERE series_id = 'EMBI_AR'
-            AND ts <= ?
-        ORDER BY ts DESC 
-        LIMIT 1
-    """
-    trend_result = conn.execute(trend_query, [date_30d_ago]).fetchone()
-    
-    if trend_result:
-        value_30d_ago = trend_result[0]
-        trend = latest_value - value_30d_ago
-    else:
-        trend = None
-    
-    return latest_value, trend
-
-
-def get_latest_core_cpi_3m_ann(conn) -> float | None:
-    """Get latest core CPI 3-month annualized rate.
+# All gate inputs in one query: each CTE is a single-series scan and every
+# output column is a scalar subquery, so missing series yield NULL, not no row
+STATE_INPUTS_QUERY = f"""
+    WITH embi AS (
+        SELECT ts, value FROM fact_series WHERE series_id = 'EMBI_AR'
+    ),
+    res AS (
+        SELECT ts, value FROM fact_series WHERE series_id = 'RESERVES_USD'
+    ),
+    fx AS (
+        SELECT series_id, arg_max(value, ts) AS value
+        FROM fact_series
+        WHERE series_id IN ('USDARS_PARALLEL', 'USDARS_OFFICIAL', 'USDARS_OFFICIAL_BLUELYTICS')
+        GROUP BY series_id
+    )
+    SELECT
+        (SELECT value FROM fx WHERE series_id = 'USDARS_PARALLEL') AS fx_parallel,
+        COALESCE(
+            (SELECT value FROM fx WHERE series_id = 'USDARS_OFFICIAL'),
+            (SELECT value FROM fx WHERE series_id = 'USDARS_OFFICIAL_BLUELYTICS')
+        ) AS fx_official,
+        (SELECT arg_max(value, ts) FROM res) AS reserves_current,
+        (
+            SELECT arg_max(value, ts) FROM res
+            WHERE ts <= (SELECT MAX(ts) FROM res) - INTERVAL 28 DAY
+        ) AS reserves_4w_ago,
+        ({CORE_CPI_3M_ANN_QUERY}) AS core_cpi_3m_ann,
+        (SELECT arg_max(value, ts) FROM embi) AS embi_level,
+        (
+            SELECT arg_max(value, ts) FROM embi
+            WHERE ts <= (SELECT MAX(ts) FROM embi) - INTERVAL 30 DAY
+        ) AS embi_30d_ago
+"""
+
+
+def get_state_inputs(conn) -> dict[str, float | None]:
+    """Get every gate input from DuckDB in a single query.
+    
+    Mirrors the FX gap, reserves momentum, core CPI and EMBI trend features.
     
+    Args:
+        conn: DuckDB connection
+        
     Returns:
-        3-month annualized rate or None
+        Dictionary keyed like evaluate_states() arguments (fx_gap, reserves_mom_4w,
+        core_cpi_3m_ann, embi_level, embi_trend_30d); values are None when missing
     """
-    # Get latest two CPI values for 3-month calculation
-    cpi_query = """
-        SELECT ts, value 
-        FROM fact_series 
-        WHERE series_id = 'CPI_CORE'
-        ORDER BY ts DESC 
-        LIMIT 2
-    """
-    results = conn.execute(cpi_query).fetchall()
-    
-    if len(results) < 2:
-        return None
-    
-    latest_ts, latest_value = results[0]
-    prev_ts, prev_value = results[1]
-    
-    # Calculate months between readings
-    days_diff = (latest_ts - prev_ts).days
-    months = days_diff / 30.0
-    
-    if months == 0:
-        return None
-    
-    # Calculate 3-month annualized rate
-    monthly_rate = (latest_value / prev_value) - 1
-    annualized_3m = ((1 + monthly_rate) ** (3 / months)) - 1
-    
-    return annualized_3m
+    (
+        fx_parallel,
+        fx_official,
+        reserves_current,
+        reserves_4w_ago,
+        core_cpi_3m_ann,
+        embi_level,
+        embi_30d_ago,
+    ) = conn.execute(STATE_INPUTS_QUERY).fetchone()
+    
+    fx_gap = None
+    if fx_parallel is not None and fx_official is not None:
+        fx_gap = (fx_parallel - fx_official) / fx_official
+    
+    reserves_mom_4w = None
+    if reserves_current is not None and reserves_4w_ago is not None:
+        reserves_mom_4w = (reserves_current - reserves_4w_ago) / reserves_4w_ago
+    
+    embi_trend_30d = None
+    if embi_level is not None and embi_30d_ago is not None:
+        embi_trend_30d = embi_level - embi_30d_ago
+    
+    return {
+        "fx_gap": fx_gap,
+        "reserves_mom_4w": reserves_mom_4w,
+        "core_cpi_3m_ann": core_cpi_3m_ann,
+        "embi_level": embi_level,
+        "embi_trend_30d": embi_trend_30d,
+    }
 
 
 def check_and_alert() -> None:
@@ -145,25 +143,15 @@ def check_and_alert() -> None:
         
         try:
             # Compute current state
-            fx_gap_result = compute_fx_gap(conn=conn)
-            reserves_mom_result = compute_reserves_momentum(conn=conn)
-            cpi_3m_ann = get_latest_core_cpi_3m_ann(conn)
-            embi_level, embi_trend = get_latest_embi_and_trend(conn)
+            inputs = get_state_inputs(conn)
             
             # Check if we have all required data
-            if not all([fx_gap_result, reserves_mom_result, cpi_3m_ann is not None, 
-                       embi_level is not None, embi_trend is not None]):
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Insufficient data for state evaluation")
+            if any(value is None for value in inputs.values()):
+                print(f"[{timestamp()}] Insufficient data for state evaluation")
                 return
             
             # Evaluate current state
-            evaluation = evaluate_states(
-                fx_gap=fx_gap_result.value,
-                reserves_mom_4w=reserves_mom_result.value,
-                core_cpi_3m_ann=cpi_3m_ann,
-                embi_level=embi_level,
-                embi_trend_30d=embi_trend,
-            )
+            evaluation = evaluate_states(**inputs)
             
             current_state = evaluation["overall_state"].value
             
@@ -173,7 +161,7 @@ def check_and_alert() -> None:
             if last_state is None:
                 # First time, just save the state
                 save_state(conn, current_state)
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Initial state saved: {current_state}")
+                print(f"[{timestamp()}] Initial state saved: {current_state}")
             elif last_state != current_state:
                 # State changed - send alert
                 alert_msg = (
@@ -188,20 +176,38 @@ def check_and_alert() -> None:
                 save_state(conn, current_state)
             else:
                 # State unchanged
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] State check: {current_state} (unchanged)")
+                print(f"[{timestamp()}] State check: {current_state} (unchanged)")
         
         finally:
             conn.close()
             
     except Exception as e:
         error_msg = f"Error during state check: {e}"
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {error_msg}")
+        print(f"[{timestamp()}] {error_msg}")
         send_alert(error_msg)
 
 
-def main():
-    """Main watcher loop - checks state every 10 minutes."""
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting state watcher (checks every 10 minutes)")
+def main(argv: list[str] | None = None):
+    """Main watcher loop - checks state every 10 minutes.
+    
+    With --once, runs a single check and exits; use this from cron or a systemd
+    timer so nothing stays resident between checks. Otherwise the loop sleeps
+    until the next scheduled run. Each check opens and closes its own DuckDB
+    connection, so the database file is not locked between checks and the
+    refresh jobs and dashboard can write to it.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Monitor overall state changes and send alerts.")
+    parser.add_argument("--once", action="store_true", help="run a single check and exit")
+    args = parser.parse_args(argv)
+    
+    if args.once:
+        check_and_alert()
+        return
+    
+    print(f"[{timestamp()}] Starting state watcher (checks every 10 minutes)")
     print("Press Ctrl+C to stop")
     
     # Schedule checks every 10 minutes
@@ -214,9 +220,10 @@ def main():
     try:
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute for pending jobs
+            # Sleep until the next job is due instead of polling every minute
+            time.sleep(max(schedule.idle_seconds() or 0, 1))
     except KeyboardInterrupt:
-        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Watcher stopped")
+        print(f"\n[{timestamp()}] Watcher stopped")
 
 
 if __name__ == "__main__":
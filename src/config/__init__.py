@@ -1,11 +1,12 @@
 """Configuration management."""
 
-from .settings import Settings, settings
+from .settings import Settings, get_settings, settings
 from .series_registry import SeriesSpec, REGISTRY, get_series_spec, list_all_series
 
 __all__ = [
     "Settings",
     "settings",
+    "get_settings",
     "SeriesSpec",
     "REGISTRY",
     "get_series_spec",
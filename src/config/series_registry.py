@@ -1,7 +1,8 @@
 """Series registry for economic and financial indicators."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 
 @dataclass
@@ -16,7 +17,7 @@ class SeriesSpec:
 
 
 # Registry of all available data series
-REGISTRY: Dict[str, SeriesSpec] = {
+_REGISTRY: Dict[str, SeriesSpec] = {
     "USDARS_OFFICIAL": SeriesSpec(
         name="USDARS_OFFICIAL",
         code="USDARS_OFFICIAL",
@@ -191,6 +192,12 @@ REGISTRY: Dict[str, SeriesSpec] = {
     ),
 }
 
+# Read-only view so callers cannot mutate the registry at runtime
+REGISTRY: Mapping[str, SeriesSpec] = MappingProxyType(_REGISTRY)
+
+# Sorted once at import; list_all_series() is called from refresh loops
+_ALL_SERIES: Tuple[str, ...] = tuple(sorted(_REGISTRY))
+
 
 def get_series_spec(name: str) -> Optional[SeriesSpec]:
     """Get series specification by name.
@@ -204,11 +211,11 @@ def get_series_spec(name: str) -> Optional[SeriesSpec]:
     return REGISTRY.get(name)
 
 
-def list_all_series() -> List[str]:
+def list_all_series() -> Tuple[str, ...]:
     """List all registered series names.
     
     Returns:
-        List of series names
+        Sorted tuple of series names
     """
-    return sorted(REGISTRY.keys())
+    return _ALL_SERIES
 
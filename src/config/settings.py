@@ -1,5 +1,6 @@
 """Application settings using Pydantic BaseSettings."""
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -9,6 +10,10 @@ class Settings(BaseSettings):
 
     DATA_PATH: str = "data"
     DUCKDB_PATH: str = "data/macro.duckdb"
+    DUCKDB_THREADS: Optional[int] = None  # None lets DuckDB use all cores
+    DUCKDB_MEMORY_LIMIT: Optional[str] = None  # e.g. "2GB"; None keeps DuckDB's default
+    PROVIDER_CACHE_TTL: int = 3600  # seconds to reuse parsed provider results; 0 disables
+    WGB_CACHE_TTL_SEC: int = 900  # seconds to serve cached worldgovernmentbonds.com pages; 0 revalidates
     ALERT_EMAIL: Optional[str] = None
     ENVIRONMENT: str = "development"
 
@@ -20,6 +25,12 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, parsing the environment once."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
@@ -1,13 +1,23 @@
 """Data collection and management."""
 
-from .db import connect, create_schema, upsert_series_meta, upsert_timeseries
-from .provider_router import fetch_series
+from .db import connect, create_schema, upsert_series_meta, upsert_timeseries, append_timeseries, get_latest
 
 __all__ = [
     "connect",
     "create_schema",
     "upsert_series_meta",
     "upsert_timeseries",
+    "append_timeseries",
+    "get_latest",
     "fetch_series",
 ]
 
+
+def __getattr__(name):
+    # The router imports every provider; defer it so db-only callers stay light
+    if name == "fetch_series":
+        from .provider_router import fetch_series
+
+        globals()[name] = fetch_series
+        return fetch_series
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,38 @@
 """DuckDB database operations."""
 
 import duckdb
+import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
-from ..config.settings import settings
+from ..config.settings import get_settings
 from ..config.series_registry import SeriesSpec
 
 
-def connect() -> duckdb.DuckDBPyConnection:
+def connect(read_only: bool = False) -> duckdb.DuckDBPyConnection:
     """Create and return a DuckDB connection.
     
+    Args:
+        read_only: Open without write access. Read-only connections take a
+            shared lock, so several reader processes can use the file at once;
+            the database file must already exist.
+    
     Returns:
         DuckDB connection to the configured database path
     """
+    settings = get_settings()
     db_path = Path(settings.DUCKDB_PATH)
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    return duckdb.connect(str(db_path))
+    
+    # Size the executor to the host when configured
+    config = {}
+    if settings.DUCKDB_THREADS:
+        config["threads"] = settings.DUCKDB_THREADS
+    if settings.DUCKDB_MEMORY_LIMIT:
+        config["memory_limit"] = settings.DUCKDB_MEMORY_LIMIT
+    
+    return duckdb.connect(str(db_path), read_only=read_only, config=config)
 
 
 def create_schema(conn: duckdb.DuckDBPyConnection) -> None:
@@ -37,20 +52,45 @@ def create_schema(conn: duckdb.DuckDBPyConnection) -> None:
         )
     """)
     
-    # Create fact table for time series data
+    # Create fact table for time series data.
+    # The primary key's ART index already covers (series_id, ts) lookups;
+    # upserts insert rows in ts order so zone maps stay tight for range scans.
+    # No foreign key to dim_series: upsert_timeseries checks the series once
+    # per batch instead of paying constraint bookkeeping on every row.
     conn.execute("""
         CREATE TABLE IF NOT EXISTS fact_series (
             series_id VARCHAR NOT NULL,
             ts TIMESTAMP NOT NULL,
             value DOUBLE NOT NULL,
-            PRIMARY KEY (series_id, ts),
-            FOREIGN KEY (series_id) REFERENCES dim_series(series_id)
+            PRIMARY KEY (series_id, ts)
         )
     """)
     
+    # Latest observation per series, maintained by upsert_timeseries
+    _ensure_latest_series(conn)
+    conn.execute("""
+        INSERT INTO latest_series (series_id, ts, value)
+        SELECT series_id, ts, value
+        FROM fact_series
+        QUALIFY row_number() OVER (PARTITION BY series_id ORDER BY ts DESC) = 1
+        ON CONFLICT (series_id) 
+        DO UPDATE SET ts = EXCLUDED.ts, value = EXCLUDED.value
+    """)
+    
     conn.commit()
 
 
+def _ensure_latest_series(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create the latest_series table if it does not exist yet."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS latest_series (
+            series_id VARCHAR PRIMARY KEY,
+            ts TIMESTAMP NOT NULL,
+            value DOUBLE NOT NULL
+        )
+    """)
+
+
 def upsert_series_meta(conn: duckdb.DuckDBPyConnection, series_specs: List[SeriesSpec]) -> None:
     """Upsert series metadata into dim_series table.
     
@@ -73,9 +113,11 @@ def upsert_series_meta(conn: duckdb.DuckDBPyConnection, series_specs: List[Serie
         for spec in series_specs
     ]
     
-    # Use DuckDB's INSERT ON CONFLICT for upsert functionality
-    for row in data:
-        conn.execute("""
+    # Use DuckDB's INSERT ON CONFLICT for upsert functionality, sending the
+    # whole parameter list in one executemany call inside a single transaction
+    conn.begin()
+    try:
+        conn.executemany("""
             INSERT INTO dim_series 
             (series_id, name, freq, source, units)
             VALUES (?, ?, ?, ?, ?)
@@ -85,38 +127,188 @@ def upsert_series_meta(conn: duckdb.DuckDBPyConnection, series_specs: List[Serie
                 freq = EXCLUDED.freq,
                 source = EXCLUDED.source,
                 units = EXCLUDED.units
-        """, row)
+        """, data)
+    except Exception:
+        conn.rollback()
+        raise
     
     conn.commit()
 
 
+def _check_series_registered(conn: duckdb.DuckDBPyConnection, series_id: str) -> None:
+    """Raise ValueError if series_id has no row in dim_series."""
+    # Referential check for the whole batch (replaces the per-row FK)
+    if conn.execute("SELECT 1 FROM dim_series WHERE series_id = ?", [series_id]).fetchone() is None:
+        raise ValueError(f"Unknown series_id {series_id!r}; upsert its metadata into dim_series first")
+
+
+# Observations as (datetime, value) tuples, or a float Series indexed by timestamp
+TimeseriesRows = Union[List[tuple[datetime, float]], pd.Series]
+
+
+def _timeseries_batch(series_id: str, rows: TimeseriesRows) -> pd.DataFrame:
+    """Build a fact_series-shaped frame, sorted by ts, from (datetime, value) rows."""
+    # Collapse duplicate timestamps (last value wins, as with row-by-row upserts)
+    # so the batch never conflicts with itself.
+    if isinstance(rows, pd.Series):
+        # Columnar input: no per-row tuples to unpack
+        rows = rows[~rows.index.duplicated(keep="last")]
+        ts = pd.to_datetime(rows.index)
+        values = rows.to_numpy(dtype="float64")
+    else:
+        latest = dict(rows)
+        ts = pd.to_datetime(list(latest.keys()))
+        values = pd.Series(list(latest.values()), dtype="float64")
+    batch = pd.DataFrame({
+        "series_id": series_id,
+        "ts": ts,
+        "value": values,
+    })
+    # Insert in ts order so zone maps stay tight for range scans
+    return batch.sort_values("ts", ignore_index=True)
+
+
+def _refresh_latest(conn: duckdb.DuckDBPyConnection, series_id: str) -> None:
+    """Recompute the latest_series row for series_id from fact_series."""
+    # Refresh the latest-value row from fact_series so backfills of older
+    # history never overwrite a newer observation
+    _ensure_latest_series(conn)
+    conn.execute("""
+        INSERT INTO latest_series (series_id, ts, value)
+        SELECT series_id, ts, value
+        FROM fact_series
+        WHERE series_id = ?
+        ORDER BY ts DESC
+        LIMIT 1
+        ON CONFLICT (series_id) 
+        DO UPDATE SET ts = EXCLUDED.ts, value = EXCLUDED.value
+    """, [series_id])
+
+
+def _upsert_registered_batch(conn: duckdb.DuckDBPyConnection) -> None:
+    """Upsert the frame registered as _fact_series_batch into fact_series."""
+    conn.execute("""
+        INSERT INTO fact_series 
+        (series_id, ts, value)
+        SELECT series_id, ts, value FROM _fact_series_batch
+        ON CONFLICT (series_id, ts) 
+        DO UPDATE SET value = EXCLUDED.value
+    """)
+
+
 def upsert_timeseries(
     conn: duckdb.DuckDBPyConnection,
     series_id: str,
-    rows: List[tuple[datetime, float]]
+    rows: TimeseriesRows
 ) -> None:
     """Upsert time series data into fact_series table.
     
     Args:
         conn: DuckDB connection
         series_id: Series identifier
-        rows: List of (datetime, value) tuples
+        rows: List of (datetime, value) tuples, or a Series of values
+            indexed by timestamp
+        
+    Raises:
+        ValueError: If series_id is not registered in dim_series
     """
-    if not rows:
+    if not len(rows):
         return
     
-    # Prepare data for insertion
-    data = [(series_id, ts, value) for ts, value in rows]
-    
-    # Use DuckDB's INSERT ON CONFLICT for upsert functionality
-    for row in data:
-        conn.execute("""
-            INSERT INTO fact_series 
-            (series_id, ts, value)
-            VALUES (?, ?, ?)
-            ON CONFLICT (series_id, ts) 
-            DO UPDATE SET value = EXCLUDED.value
-        """, row)
+    _check_series_registered(conn, series_id)
     
+    conn.register("_fact_series_batch", _timeseries_batch(series_id, rows))
+    try:
+        _upsert_registered_batch(conn)
+    finally:
+        conn.unregister("_fact_series_batch")
+    
+    _refresh_latest(conn, series_id)
+    conn.commit()
+
+
+def append_timeseries(
+    conn: duckdb.DuckDBPyConnection,
+    series_id: str,
+    rows: TimeseriesRows
+) -> None:
+    """Append time series data to fact_series via DuckDB's appender.
+    
+    Fast path for initial loads and backfills of new history: rows are
+    written without SQL planning or conflict handling. The batch is first
+    checked against fact_series; if any timestamp already exists it is
+    upserted instead, so results match upsert_timeseries(). Nothing is
+    attempted that can fail on a key conflict, so this is safe to call
+    inside an explicit transaction.
+    
+    Args:
+        conn: DuckDB connection
+        series_id: Series identifier
+        rows: List of (datetime, value) tuples, or a Series of values
+            indexed by timestamp
+        
+    Raises:
+        ValueError: If series_id is not registered in dim_series
+    """
+    if not len(rows):
+        return
+    
+    _check_series_registered(conn, series_id)
+    
+    batch = _timeseries_batch(series_id, rows)
+    conn.register("_fact_series_batch", batch)
+    try:
+        # A failed append would abort an enclosing transaction, so look for
+        # overlapping keys up front rather than catching ConstraintException
+        overlaps = conn.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM fact_series
+                JOIN _fact_series_batch USING (series_id, ts)
+            )
+        """).fetchone()[0]
+        if overlaps:
+            _upsert_registered_batch(conn)
+    finally:
+        conn.unregister("_fact_series_batch")
+    if not overlaps:
+        conn.append("fact_series", batch)
+    
+    _refresh_latest(conn, series_id)
     conn.commit()
 
+
+def get_latest(
+    conn: duckdb.DuckDBPyConnection,
+    series_id: str
+) -> tuple[Optional[datetime], Optional[float]]:
+    """Get the latest (ts, value) for a series.
+    
+    Reads the single-row latest_series entry, falling back to a scan of
+    fact_series for databases that predate the table.
+    
+    Args:
+        conn: DuckDB connection
+        series_id: Series identifier
+        
+    Returns:
+        Tuple of (timestamp, value), or (None, None) if the series has no data
+    """
+    try:
+        row = conn.execute(
+            "SELECT ts, value FROM latest_series WHERE series_id = ?", [series_id]
+        ).fetchone()
+    except duckdb.CatalogException:
+        row = None
+    
+    if row is None:
+        row = conn.execute("""
+            SELECT ts, value 
+            FROM fact_series 
+            WHERE series_id = ?
+            ORDER BY ts DESC 
+            LIMIT 1
+        """, [series_id]).fetchone()
+    
+    if not row:
+        return None, None
+    return row[0], row[1]
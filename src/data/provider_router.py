@@ -1,7 +1,9 @@
 """Provider router for fetching data from multiple sources with fallback."""
 
 import os
-from typing import List, Tuple, Optional
+import threading
+import time
+from typing import Dict, List, Tuple, Type, Optional
 from datetime import datetime
 
 from .providers.bcra import BCRAProvider
@@ -15,7 +17,7 @@ from .providers.eod_gbond import GBondProvider
 from .providers.wgb_cds import WGBCDSProvider
 from .providers.ndf_argentina import NDFArgentinaProvider
 from .providers.bcra_policy import BCRAPolicyProvider
-from .providers.base import ProviderError
+from .providers.base import ProviderError, SeriesProvider
 
 # Prefer INDEC via Time Series API (official + fastest), then IMF (stable)
 # Prefer FRED for CPI (stable monthly), then INDEC, then IMF
@@ -23,29 +25,97 @@ from .providers.base import ProviderError
 # WGB_CDS for CDS spreads
 DEFAULT_ORDER = "BCRA,FRED_CPI,INDEC,BLUELYTICS,YAHOOFX,IMF_CPI,EOD_BONDS,GBOND,WGB_CDS,NDF,BCRA_POLICY"
 
-# Provider registry - prefer local official sources first
-PROVIDERS = {
-    "BCRA": BCRAProvider(),
-    "INDEC": INDECProvider(),
-    "YAHOOFX": YahooFXProvider(),
-    "BLUELYTICS": BluelyticsProvider(),
+# Provider registry - prefer local official sources first.
+# Values are classes; instances are created on first use (see get_provider)
+PROVIDERS: Dict[str, Type[SeriesProvider]] = {
+    "BCRA": BCRAProvider,
+    "INDEC": INDECProvider,
+    "YAHOOFX": YahooFXProvider,
+    "BLUELYTICS": BluelyticsProvider,
     # Keep IMF/TE available but de-prioritized if still present
-    # "IMF": IMFProvider(),
-    # "TE": TradingEconomicsProvider(),
+    # "IMF": IMFProvider,
+    # "TE": TradingEconomicsProvider,
 }
 
 # Extend with CPI providers and other providers
 PROVIDERS.update({
-    "FRED_CPI": FREDCPIProvider(),
-    "INDEC": INDECProvider(),
-    "IMF_CPI": IMFProviderCPI(),
-    "EOD_BONDS": EODBondProvider(),
-    "GBOND": GBondProvider(),
-    "WGB_CDS": WGBCDSProvider(),
-    "NDF": NDFArgentinaProvider(),
-    "BCRA_POLICY": BCRAPolicyProvider(),
+    "FRED_CPI": FREDCPIProvider,
+    "IMF_CPI": IMFProviderCPI,
+    "EOD_BONDS": EODBondProvider,
+    "GBOND": GBondProvider,
+    "WGB_CDS": WGBCDSProvider,
+    "NDF": NDFArgentinaProvider,
+    "BCRA_POLICY": BCRAPolicyProvider,
 })
 
+_INSTANCES: Dict[str, SeriesProvider] = {}
+_instances_lock = threading.Lock()
+
+
+def get_provider(name: str, factory: Type[SeriesProvider]) -> SeriesProvider:
+    """Return the shared provider instance for name, creating it on first use.
+    
+    Args:
+        name: Registry name (e.g., "BCRA")
+        factory: Provider class to instantiate if no instance exists yet
+        
+    Returns:
+        Provider instance reused across fetch_series calls
+    """
+    with _instances_lock:
+        provider = _INSTANCES.get(name)
+        if provider is None:
+            provider = _INSTANCES[name] = factory()
+        return provider
+
+
+# Provider order parsed once from PREFERRED_PROVIDERS; see refresh_provider_order()
+PROVIDER_ORDER: Tuple[str, ...] = ()
+PROVIDER_CHAIN: Tuple[Tuple[str, Type[SeriesProvider]], ...] = ()
+# Per-code dispatch built from PROVIDER_CHAIN: codes a provider declares in
+# supported_codes() map to the providers that serve them; any other code only
+# goes to open-ended providers (supported_codes() is None)
+CODE_CHAINS: Dict[str, Tuple[Tuple[str, Type[SeriesProvider]], ...]] = {}
+OPEN_CHAIN: Tuple[Tuple[str, Type[SeriesProvider]], ...] = ()
+
+
+def refresh_provider_order() -> None:
+    """Re-read PREFERRED_PROVIDERS and rebuild the provider chain.
+    
+    Runs at import; call again after changing the environment (e.g. in tests).
+    """
+    global PROVIDER_ORDER, PROVIDER_CHAIN, CODE_CHAINS, OPEN_CHAIN
+    preferred = os.getenv("PREFERRED_PROVIDERS", DEFAULT_ORDER)
+    PROVIDER_ORDER = tuple(p.strip() for p in preferred.split(","))
+    # Providers not in the registry are skipped
+    PROVIDER_CHAIN = tuple((name, PROVIDERS[name]) for name in PROVIDER_ORDER if name in PROVIDERS)
+    
+    supported = {name: factory.supported_codes() for name, factory in PROVIDER_CHAIN}
+    known = set().union(*(codes for codes in supported.values() if codes is not None))
+    CODE_CHAINS = {
+        code: tuple(
+            (name, factory) for name, factory in PROVIDER_CHAIN
+            if supported[name] is None or code in supported[name]
+        )
+        for code in known
+    }
+    OPEN_CHAIN = tuple((name, factory) for name, factory in PROVIDER_CHAIN if supported[name] is None)
+
+
+refresh_provider_order()
+
+# Per-process memo of successful fetches, keyed by (series_code, start, end)
+FETCH_CACHE_TTL = 300  # seconds
+FETCH_CACHE_MAXSIZE = 256
+_fetch_cache: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[float, Tuple[Tuple[datetime, float], ...]]] = {}
+_fetch_cache_lock = threading.Lock()
+
+
+def clear_fetch_cache() -> None:
+    """Drop all memoized fetch_series results."""
+    with _fetch_cache_lock:
+        _fetch_cache.clear()
+
 
 def fetch_series(
     series_code: str,
@@ -54,9 +124,9 @@ def fetch_series(
 ) -> List[Tuple[datetime, float]]:
     """Fetch time series data from providers with fallback.
     
-    Reads PREFERRED_PROVIDERS from environment variable to determine
-    the order of providers to try. Falls back to next provider on
-    ProviderError or empty result.
+    Tries providers in PREFERRED_PROVIDERS order (parsed at import, see
+    refresh_provider_order), skipping those that do not serve series_code.
+    Falls back to next provider on ProviderError or empty result.
     
     Args:
         series_code: Series identifier (e.g., "USDARS_OFFICIAL", "CPI_HEADLINE")
@@ -69,21 +139,28 @@ def fetch_series(
     Raises:
         ProviderError: If all providers fail or series_code not found
     """
-    # Get preferred provider order from env, default to DEFAULT_ORDER
-    preferred = os.getenv("PREFERRED_PROVIDERS", DEFAULT_ORDER)
-    provider_names = [p.strip() for p in preferred.split(",")]
+    # Repeat requests within FETCH_CACHE_TTL skip the provider stack; callers
+    # get their own list so they cannot mutate the cached rows
+    key = (series_code, start, end)
+    now = time.monotonic()
+    with _fetch_cache_lock:
+        hit = _fetch_cache.get(key)
+    if hit is not None and now - hit[0] < FETCH_CACHE_TTL:
+        return list(hit[1])
     
     last_error = None
-    for provider_name in provider_names:
-        # Skip if provider not in registry
-        if provider_name not in PROVIDERS:
-            continue
-            
-        provider = PROVIDERS[provider_name]
+    for provider_name, factory in CODE_CHAINS.get(series_code, OPEN_CHAIN):
         try:
+            provider = get_provider(provider_name, factory)
             result = provider.fetch_timeseries(series_code, start=start, end=end)
             # Check if result is empty
             if result:
+                with _fetch_cache_lock:
+                    _fetch_cache.pop(key, None)
+                    if len(_fetch_cache) >= FETCH_CACHE_MAXSIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        del _fetch_cache[next(iter(_fetch_cache))]
+                    _fetch_cache[key] = (now, tuple(result))
                 return result
             # Empty result, try next provider
             continue
@@ -105,6 +182,6 @@ def fetch_series(
     else:
         raise ProviderError(
             f"No providers available for series_code={series_code}. "
-            f"Tried: {', '.join(provider_names)}"
+            f"Tried: {', '.join(PROVIDER_ORDER)}"
         )
 
@@ -1,12 +1,23 @@
-"""Data providers for external sources."""
+"""Data providers for external sources.
+
+Only the base classes are imported eagerly. Provider classes are imported on
+first attribute access (PEP 562), so loading one provider module does not pay
+for every other provider's dependencies (yfinance, pandas parsing, ...).
+"""
+
+import importlib
 
 from .base import SeriesProvider, ProviderError
-from .bcra import BCRAProvider
-from .indec import INDECProvider
-from .yahoo_fx import YahooFXProvider
-from .bluelytics import BluelyticsProvider
-from .imf_cpi import IMFProviderCPI
-from .fred_cpi import FREDCPIProvider
+
+# Public provider class -> submodule that defines it
+_LAZY_PROVIDERS = {
+    "BCRAProvider": "bcra",
+    "INDECProvider": "indec",
+    "YahooFXProvider": "yahoo_fx",
+    "BluelyticsProvider": "bluelytics",
+    "IMFProviderCPI": "imf_cpi",
+    "FREDCPIProvider": "fred_cpi",
+}
 
 __all__ = [
     "SeriesProvider",
@@ -19,3 +30,15 @@ __all__ = [
     "FREDCPIProvider",
 ]
 
+
+def __getattr__(name):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,52 @@
 """Base provider interface for data sources."""
 
+import os
+import re
+import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Sequence, Tuple, Optional
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ...config.settings import get_settings
+from .http_cache import cached_session
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to requests' stdlib json decoding
+    orjson = None
+
+# BCRA endpoints are fetched with verify=False; silence the per-request warning once
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Concurrent requests per fetch_many call; stays under vendor rate limits (EODHD: 20 req/s)
+FETCH_MANY_WORKERS = 8
+
 
 class SeriesProvider(ABC):
     """Interface for any data provider (IMF, TE, BCRA)."""
 
+    @classmethod
+    def supported_codes(cls) -> Optional[FrozenSet[str]]:
+        """Return the series codes this provider serves, or None if open-ended.
+        
+        The router skips a provider for codes outside its set. Providers that
+        accept arbitrary vendor codes (e.g. EOD bonds) keep the default None
+        and are tried for every code.
+        """
+        return None
+
     @abstractmethod
     def fetch_timeseries(
         self,
@@ -18,8 +57,269 @@ class SeriesProvider(ABC):
         """Return [(timestamp, value)] for the series_code within [start,end]."""
         ...
 
+    def fetch_many(
+        self,
+        series_codes: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict[str, List[Tuple[datetime, float]]]:
+        """Fetch several series from this provider concurrently.
+        
+        Requests overlap on the shared session, so N series cost roughly one
+        round trip instead of N.
+        
+        Args:
+            series_codes: Series identifiers to fetch
+            start: Start date in YYYY-MM-DD format (optional)
+            end: End date in YYYY-MM-DD format (optional)
+            
+        Returns:
+            Dict mapping each series code to its [(timestamp, value)] rows
+            
+        Raises:
+            ProviderError: If any series fails (the first failure in input order)
+        """
+        with ThreadPoolExecutor(max_workers=FETCH_MANY_WORKERS) as pool:
+            futures = {
+                code: pool.submit(self.fetch_timeseries, code, start=start, end=end)
+                for code in series_codes
+            }
+        return {code: fut.result() for code, fut in futures.items()}
+
+    def fetch_arrays(
+        self,
+        series_code: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fetch a series as parallel timestamp/value arrays.
+        
+        Goes through fetch_timeseries, so provider caching still applies;
+        the rows are unpacked into two contiguous arrays for vectorized
+        callers.
+        
+        Args:
+            series_code: Series identifier
+            start: Start date in YYYY-MM-DD format (optional)
+            end: End date in YYYY-MM-DD format (optional)
+            
+        Returns:
+            Tuple of (datetime64[ns] array, float64 array), same order as the rows
+        """
+        rows = self.fetch_timeseries(series_code, start=start, end=end)
+        ts = pd.DatetimeIndex([t for t, _ in rows]).to_numpy(dtype="datetime64[ns]")
+        values = np.fromiter((v for _, v in rows), dtype=np.float64, count=len(rows))
+        return ts, values
+
 
 class ProviderError(RuntimeError):
     """Error raised by data providers."""
     pass
 
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Return the HTTP session shared by all providers.
+    
+    One connection pool and retry policy for every provider, so keep-alive
+    connections (and their TLS handshakes) are reused across calls.
+    """
+    session = cached_session()
+    # Only idempotent GETs are retried; 429/503 honour the server's Retry-After
+    retry_strategy = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        response: HTTP response with a JSON body
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def observation_rows(
+    dates: Sequence[Any],
+    values: Sequence[Any],
+    pct_lag: int = 0,
+) -> List[Tuple[datetime, float]]:
+    """Build date-sorted (datetime, float) rows from parallel date/value lists.
+    
+    Dates are parsed in one vectorized pass; year-only ("2024") and
+    year-month ("2024-03") periods resolve to the first day of the period.
+    With pct_lag set, the percent change is computed on the parsed arrays
+    directly instead of materializing the level rows first.
+    
+    Args:
+        dates: ISO 8601 date strings (or values whose str() is one)
+        values: Numeric values (or numeric strings), same length as dates
+        pct_lag: If > 0, return the percent change over this many observations
+        
+    Returns:
+        List of (datetime, value) tuples sorted by date (stable for ties)
+    """
+    if not len(dates):
+        return []
+    # cache=True parses each distinct date string once
+    ts = pd.to_datetime(pd.Index(dates).astype(str), format="ISO8601", cache=True)
+    arr = np.asarray(values, dtype=np.float64)
+    # FRED, IMF and INDEC already return chronological rows; only reorder when needed
+    if not ts.is_monotonic_increasing:
+        order = np.argsort(ts.asi8, kind="stable")
+        ts, arr = ts[order], arr[order]
+    if pct_lag:
+        return _pct_change(ts.to_pydatetime(), arr, pct_lag)
+    return list(zip(ts.to_pydatetime().tolist(), arr.tolist()))
+
+
+def _pct_change(ts: Sequence[datetime], vals: np.ndarray, k: int) -> List[Tuple[datetime, float]]:
+    """Percent change of vals over k observations, skipping zero bases."""
+    if len(vals) <= k:
+        return []
+    base, cur = vals[:-k], vals[k:]
+    keep = np.flatnonzero(base != 0)
+    pct = (cur[keep] / base[keep] - 1) * 100
+    return [(ts[i + k], p) for i, p in zip(keep.tolist(), pct.tolist())]
+
+
+def pct_change_rows(rows: List[Tuple[datetime, float]], k: int) -> List[Tuple[datetime, float]]:
+    """Percent change over k observations, skipping points whose base is zero.
+    
+    Args:
+        rows: Date-sorted (datetime, value) tuples
+        k: Lag in observations (1 for MoM, 12 for YoY on monthly data)
+        
+    Returns:
+        List of (datetime, pct_change) tuples, pct_change in percent
+    """
+    vals = np.fromiter((v for _, v in rows), dtype=np.float64, count=len(rows))
+    return _pct_change([t for t, _ in rows], vals, k)
+
+
+# Parsed rows per (URL, ETag/Last-Modified); see parse_cached()
+PARSED_CACHE_MAXSIZE = 128
+_parsed_cache: Dict[Tuple[str, str], Tuple[Tuple[datetime, float], ...]] = {}
+_parsed_cache_lock = threading.Lock()
+
+
+def clear_parsed_cache() -> None:
+    """Drop all memoized parse_cached results."""
+    with _parsed_cache_lock:
+        _parsed_cache.clear()
+
+
+def parse_cached(
+    response: requests.Response,
+    parse: Callable[[requests.Response], List[Tuple[datetime, float]]],
+) -> List[Tuple[datetime, float]]:
+    """Parse a response once per URL and validator.
+    
+    When the cached session revalidates and gets a 304, requests-cache replays
+    the stored body with the same ETag/Last-Modified; the rows parsed from it
+    the first time are returned instead of decoding it again. Responses
+    without a validator are always parsed.
+    
+    Args:
+        response: HTTP response to parse
+        parse: Function turning the response into (datetime, value) rows
+        
+    Returns:
+        List of (datetime, value) tuples
+    """
+    validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+    if not validator:
+        return parse(response)
+    
+    key = (response.url, validator)
+    with _parsed_cache_lock:
+        hit = _parsed_cache.get(key)
+    if hit is not None:
+        return list(hit)
+    
+    rows = parse(response)
+    with _parsed_cache_lock:
+        if len(_parsed_cache) >= PARSED_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _parsed_cache[next(iter(_parsed_cache))]
+        _parsed_cache[key] = tuple(rows)
+    return rows
+
+
+def _cache_path(provider: str, series_code: str, start: Optional[str], end: Optional[str]) -> Path:
+    """Return the Parquet file holding a cached fetch_timeseries result."""
+    key = re.sub(r"[^\w.-]", "_", f"{provider}-{series_code}-{start or ''}-{end or ''}")
+    return Path(get_settings().DATA_PATH) / "provider_cache" / f"{key}.parquet"
+
+
+def _load_cached(path: Path, ttl: float) -> Optional[List[Tuple[datetime, float]]]:
+    """Read cached rows if the file is younger than ttl seconds, else None."""
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        df = pd.read_parquet(path)
+    except Exception:
+        # Missing, unreadable, or no Parquet engine: treat as a miss
+        return None
+    return list(zip([ts.to_pydatetime() for ts in df["ts"]], df["value"].tolist()))
+
+
+def _save_cached(path: Path, rows: List[Tuple[datetime, float]]) -> None:
+    """Write rows to path atomically; failures leave the cache untouched."""
+    tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(rows, columns=["ts", "value"]).to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+
+
+def clear_provider_cache() -> None:
+    """Delete every result persisted by parquet_cache.
+    
+    Refresh runs call this so they store fresh data instead of Parquet
+    copies up to PROVIDER_CACHE_TTL old.
+    """
+    shutil.rmtree(Path(get_settings().DATA_PATH) / "provider_cache", ignore_errors=True)
+
+
+def parquet_cache(fetch: Callable) -> Callable:
+    """Persist a provider's fetch_timeseries results to Parquet across runs.
+    
+    Results are keyed by (provider, series_code, start, end) under
+    DATA_PATH/provider_cache and reused for PROVIDER_CACHE_TTL seconds
+    (0 disables). Calls without a date range ask for the latest value
+    and always go to the source.
+    """
+    @wraps(fetch)
+    def wrapper(self, series_code: str, start: Optional[str] = None, end: Optional[str] = None):
+        ttl = get_settings().PROVIDER_CACHE_TTL
+        if ttl <= 0 or (start is None and end is None):
+            return fetch(self, series_code, start=start, end=end)
+        
+        path = _cache_path(type(self).__name__, series_code, start, end)
+        rows = _load_cached(path, ttl)
+        if rows is not None:
+            return rows
+        
+        rows = fetch(self, series_code, start=start, end=end)
+        if rows:
+            _save_cached(path, rows)
+        return rows
+    
+    return wrapper
@@ -1,12 +1,11 @@
 """BCRA (Central Bank of Argentina) data provider."""
 
 import os
+import pandas as pd
 import requests
 from datetime import datetime
-from typing import List, Tuple, Optional
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from .base import SeriesProvider, ProviderError
+from typing import List, Tuple, Optional, FrozenSet
+from .base import SeriesProvider, ProviderError, get_session, parse_cached, parse_json, parquet_cache
 
 BCRA_BASE = os.getenv("BCRA_API_BASE", "https://api.bcra.gob.ar/estadisticas/v4.0/Monetarias")
 
@@ -20,34 +19,98 @@ BCRA_SERIES = {
 }
 
 
-def _bcra_url(series_id: str, start: Optional[str], end: Optional[str]) -> str:
-    # This endpoint ignores date filters, returns full series JSON
+def _bcra_url(series_id: str) -> str:
     return f"{BCRA_BASE}/{series_id}"
 
 
-class BCRAProvider(SeriesProvider):
-    def __init__(self):
-        # Create session with retry strategy and SSL handling
-        self.session = requests.Session()
-        
-        # Retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
+def bcra_date_params(start: Optional[str], end: Optional[str]) -> dict:
+    """Build the desde/hasta query params that restrict BCRA v4 responses to a date range."""
+    params = {}
+    if start:
+        params["desde"] = start[:10]
+    if end:
+        params["hasta"] = end[:10]
+    return params
+
+
+def filter_detalle(detalle: List[dict], start: Optional[str], end: Optional[str]) -> List[dict]:
+    """Keep detalle rows dated within [start, end], inclusive by day.
+    
+    Fallback for when the server ignores desde/hasta. Compares the ISO date
+    prefix of each "fecha" string, which is much cheaper than parsing it.
+    """
+    if not start and not end:
+        return detalle
+    lo = start[:10] if start else ""
+    hi = end[:10] if end else "9999-12-31"
+    return [row for row in detalle if lo <= (row.get("fecha") or "")[:10] <= hi]
+
+
+def parse_detalle(detalle: List[dict]) -> pd.DataFrame:
+    """Parse a BCRA "detalle" array into a date-sorted frame.
+    
+    Rows missing a date or value are dropped.
+    
+    Args:
+        detalle: List of {"fecha": ..., "valor": ...} dicts from the API
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+    Returns:
+        DataFrame with datetime64 "fecha" and float "valor" columns
+    """
+    df = pd.DataFrame(detalle, columns=["fecha", "valor"])
+    # cache=True parses each distinct date string once
+    df["fecha"] = pd.to_datetime(df["fecha"], format="ISO8601", cache=True)
+    df["valor"] = df["valor"].astype(float)
+    return df.dropna().sort_values("fecha", kind="stable", ignore_index=True)
+
+
+def detalle_rows(df: pd.DataFrame) -> List[Tuple[datetime, float]]:
+    """Convert a parse_detalle() frame to (datetime, value) tuples."""
+    return list(zip(df["fecha"].to_numpy("datetime64[us]").tolist(), df["valor"].tolist()))
+
+
+def parse_bcra_response(
+    r: requests.Response,
+    series_code: str,
+    start: Optional[str],
+    end: Optional[str],
+    provider: str = "BCRAProvider",
+) -> List[Tuple[datetime, float]]:
+    """Turn a BCRA v4 series response into date-sorted rows within [start, end].
+    
+    Args:
+        r: Successful API response
+        series_code: Series being fetched (for error messages)
+        start: Start date in YYYY-MM-DD format (optional)
+        end: End date in YYYY-MM-DD format (optional)
+        provider: Provider name used to prefix error messages
         
-        # SSL configuration - disable verification for problematic certificates
-        self.session.verify = False
+    Returns:
+        List of (datetime, value) tuples
         
-        # Disable SSL warnings
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    Raises:
+        ProviderError: If the response holds no results or no detalle rows
+    """
+    js = parse_json(r)
+    # Parse JSON: {"status": 200, "results": [{"idVariable": 5, "detalle": [{"fecha": "...", "valor": ...}, ...]}]}
+    results = js.get("results") or []
+    if not results:
+        raise ProviderError(f"{provider}: No results found in API response for {series_code}")
+    
+    # Get the first result's detalle array
+    detalle = results[0].get("detalle") or []
+    if not detalle:
+        raise ProviderError(f"{provider}: No data found in detalle for {series_code}")
+    
+    return detalle_rows(parse_detalle(filter_detalle(detalle, start, end)))
+
 
+class BCRAProvider(SeriesProvider):
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(BCRA_SERIES)
+    
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
@@ -58,33 +121,15 @@ class BCRAProvider(SeriesProvider):
         if not sid:
             raise ProviderError(f"BCRAProvider: unknown series_code={series_code}")
         
-        url = _bcra_url(sid, start, end)
+        url = _bcra_url(sid)
         
         try:
             # Use longer timeout and disable SSL verification
-            r = self.session.get(url, timeout=60, verify=False)
+            r = get_session().get(url, params=bcra_date_params(start, end), timeout=60, verify=False)
             if r.status_code != 200:
                 raise ProviderError(f"BCRAProvider HTTP {r.status_code} for {url}")
             
-            js = r.json()
-            # Parse JSON: {"status": 200, "results": [{"idVariable": 5, "detalle": [{"fecha": "...", "valor": ...}, ...]}]}
-            results = js.get("results") or []
-            if not results:
-                raise ProviderError(f"BCRAProvider: No results found in API response for {series_code}")
-            
-            # Get the first result's detalle array
-            detalle = results[0].get("detalle") or []
-            if not detalle:
-                raise ProviderError(f"BCRAProvider: No data found in detalle for {series_code}")
-            
-            out: List[Tuple[datetime, float]] = []
-            for row in detalle:
-                dt = row.get("fecha")
-                val = row.get("valor")
-                if not dt or val is None:
-                    continue
-                out.append((datetime.fromisoformat(dt), float(val)))
-            return sorted(out, key=lambda x: x[0])
+            return parse_cached(r, lambda resp: parse_bcra_response(resp, series_code, start, end))
             
         except requests.exceptions.SSLError as e:
             raise ProviderError(f"BCRAProvider SSL error: {e}")
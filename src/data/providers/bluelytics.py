@@ -1,10 +1,15 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+from typing import List, Tuple, Optional, FrozenSet
+from .base import SeriesProvider, ProviderError, get_session, parse_json, parquet_cache
 
 BLUE_API = "https://api.bluelytics.com.ar/v2"
 
+# Concurrent requests for historical ranges (one request per day);
+# must stay within the shared session's pool size
+MAX_WORKERS = 20
+
 # Bluelytics only provides current values via /latest endpoint
 # We'll expose series codes for blue/parallel and official rates
 # Keep the aliases, but add a comment and keep PARALLEL as the canonical key.
@@ -15,21 +20,24 @@ NAME_MAP = {
 }
 
 class BluelyticsProvider(SeriesProvider):
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(NAME_MAP)
+    
+    @parquet_cache
     def fetch_timeseries(self, series_code: str, start: Optional[str]=None, end: Optional[str]=None) -> List[Tuple[datetime, float]]:
         kind = NAME_MAP.get(series_code)
         if not kind:
             raise ProviderError(f"BluelyticsProvider: unknown series_code={series_code}")
         
-        out: List[Tuple[datetime, float]] = []
-        
         # If no date range specified, get latest data
         if not start and not end:
             url = f"{BLUE_API}/latest"
-            r = requests.get(url, timeout=30)
+            r = get_session().get(url, timeout=30)
             if r.status_code != 200:
                 raise ProviderError(f"BluelyticsProvider HTTP {r.status_code}")
             
-            js = r.json()
+            js = parse_json(r)
             if kind not in js:
                 raise ProviderError(f"BluelyticsProvider: {kind} not found in API response")
             
@@ -52,50 +60,60 @@ class BluelyticsProvider(SeriesProvider):
             except:
                 current_time = datetime.now()
             
-            out = [(current_time, float(value))]
-        else:
-            # Get historical data for date range
-            # For simplicity, we'll get data for each day in the range
-            # In practice, you might want to optimize this to avoid too many API calls
-            from datetime import timedelta
-            
-            start_date = datetime.fromisoformat(start) if start else datetime.now() - timedelta(days=30)
-            end_date = datetime.fromisoformat(end) if end else datetime.now()
-            
-            current_date = start_date
-            while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
-                url = f"{BLUE_API}/historical?day={date_str}"
-                
-                try:
-                    r = requests.get(url, timeout=30)
-                    if r.status_code == 200:
-                        js = r.json()
-                        if kind in js:
-                            data = js[kind]
-                            value = data.get("value_avg")
-                            if value is not None:
-                                out.append((current_date, float(value)))
-                    elif r.status_code == 404:
-                        # No data for this date, skip
-                        pass
-                    else:
-                        # Log error but continue
-                        print(f"Warning: HTTP {r.status_code} for {date_str}")
-                except Exception as e:
-                    print(f"Warning: Error fetching {date_str}: {e}")
-                
-                current_date += timedelta(days=1)
+            return [(current_time, float(value))]
+        
+        # Get historical data for date range
+        # The API serves one day per request
+        from datetime import timedelta
         
-        # Apply start/end filtering if provided (redundant but safe)
-        if start:
-            start_dt = datetime.fromisoformat(start)
-            out = [x for x in out if x[0] >= start_dt]
-        if end:
-            end_dt = datetime.fromisoformat(end)
-            out = [x for x in out if x[0] <= end_dt]
+        start_date = datetime.fromisoformat(start) if start else datetime.now() - timedelta(days=30)
+        end_date = datetime.fromisoformat(end) if end else datetime.now()
+        
+        days = []
+        current_date = start_date
+        while current_date <= end_date:
+            days.append(current_date)
+            current_date += timedelta(days=1)
+        
+        # One request per day is pure network wait, so fetch days concurrently.
+        # map() keeps day order and days never leave [start, end], so the
+        # result is already sorted and bounded.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            results = pool.map(lambda day: _fetch_day(get_session(), kind, day), days)
+            out = [row for row in results if row is not None]
         
         if not out:
             raise ProviderError(f"BluelyticsProvider: No data found for {series_code} in date range")
         
-        return sorted(out, key=lambda x: x[0])
+        return out
+
+
+def _fetch_day(session: requests.Session, kind: str, day: datetime) -> Optional[Tuple[datetime, float]]:
+    """Fetch one day's average rate from the historical endpoint.
+    
+    Errors are logged and swallowed so one bad date does not fail the range.
+    
+    Returns:
+        (day, value) tuple, or None if there is no data for that date
+    """
+    date_str = day.strftime("%Y-%m-%d")
+    url = f"{BLUE_API}/historical?day={date_str}"
+    
+    try:
+        r = session.get(url, timeout=30)
+        if r.status_code == 200:
+            js = parse_json(r)
+            if kind in js:
+                value = js[kind].get("value_avg")
+                if value is not None:
+                    return (day, float(value))
+        elif r.status_code == 404:
+            # No data for this date, skip
+            pass
+        else:
+            # Log error but continue
+            print(f"Warning: HTTP {r.status_code} for {date_str}")
+    except Exception as e:
+        print(f"Warning: Error fetching {date_str}: {e}")
+    
+    return None
@@ -1,23 +1,29 @@
-import os, requests
+import os
+import numpy as np
+import pandas as pd
 import yaml
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
 from dotenv import load_dotenv
 from src.quality.embi_checks import price_sanity, daily_jump_ok
-from .base import SeriesProvider, ProviderError
+from .base import SeriesProvider, ProviderError, get_session
 
 load_dotenv()
 
 EOD_BASE = os.getenv("EODHD_BASE", "https://eodhd.com/api")
 EOD_TOKEN = os.getenv("EODHD_API_TOKEN", "")
 
+# Concurrent per-bond requests in fetch_quotes_for_universe
+MAX_WORKERS = 16
+
 class EODBondError(RuntimeError): ...
 
 def _eod(url: str, params: dict) -> dict:
     params = {**params, "api_token": EOD_TOKEN, "fmt": "json"}
-    r = requests.get(url, params=params, timeout=30)
+    r = get_session().get(url, params=params, timeout=30)
     if r.status_code != 200:
         raise EODBondError(f"EOD HTTP {r.status_code}: {r.text[:240]}")
     return r.json()
@@ -38,17 +44,18 @@ def fetch_bond_eod_by_isin(isin: str, start: Optional[str]=None, end: Optional[s
     rows: List[Tuple[datetime, float]] = []
     # Expect array of {date:"YYYY-MM-DD", close: <price>, ...}
     if isinstance(js, list):
-        for it in js:
-            d = it.get("date")
-            px = it.get("close")
-            if d and px is not None:
-                rows.append((datetime.fromisoformat(d), float(px)))
+        items = js
     elif isinstance(js, dict) and "eod" in js:
-        for it in js["eod"]:
-            d = it.get("date")
-            px = it.get("close")
-            if d and px is not None:
-                rows.append((datetime.fromisoformat(d), float(px)))
+        items = js["eod"]
+    else:
+        items = []
+    raw = [(it.get("date"), it.get("close")) for it in items]
+    raw = [(d, px) for d, px in raw if d and px is not None]
+    if raw:
+        # Parse all dates and prices in one vectorized pass
+        dates, pxs = zip(*raw)
+        ts = pd.to_datetime(list(dates), format="ISO8601", cache=True).to_pydatetime()
+        rows = list(zip(ts.tolist(), np.asarray(pxs, dtype=np.float64).tolist()))
     rows.sort(key=lambda x: x[0])
     
     # Apply quality filters
@@ -66,14 +73,21 @@ def fetch_bond_eod_by_isin(isin: str, start: Optional[str]=None, end: Optional[s
     return rows
 
 def fetch_quotes_for_universe(bonds_meta: List[dict], start: Optional[str]=None, end: Optional[str]=None) -> Dict[str, List[Tuple[datetime, float]]]:
+    # One request per bond; overlap them on the shared session's connection pool
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        tasks = {}
+        for b in bonds_meta:
+            isin = b.get("isin")
+            if not isin:
+                continue
+            tkr = (b.get("ticker") or isin).upper()
+            tasks[tkr] = ex.submit(fetch_bond_eod_by_isin, isin, start=start, end=end)
+    
+    # Collect in universe order so the result does not depend on completion order
     data: Dict[str, List[Tuple[datetime, float]]] = {}
-    for b in bonds_meta:
-        isin = b.get("isin")
-        tkr  = (b.get("ticker") or isin).upper()
-        if not isin:
-            continue
+    for tkr, fut in tasks.items():
         try:
-            rows = fetch_bond_eod_by_isin(isin, start=start, end=end)
+            rows = fut.result()
             if rows:
                 data[tkr] = rows
         except Exception as e:
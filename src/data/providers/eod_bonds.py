@@ -1,7 +1,10 @@
-import os, requests
+import os
+import numpy as np
+import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+from .base import SeriesProvider, ProviderError, get_session, parse_json, observation_rows, parquet_cache
+from src.quality.embi_checks import price_sanity, daily_jump_ok
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -12,13 +15,13 @@ class EODBondError(RuntimeError): ...
 
 def _eod(url: str, params: dict) -> list:
     params = {**params, "api_token": EOD_TOKEN, "fmt": "json"}
-    r = requests.get(url, params=params, timeout=30)
+    r = get_session().get(url, params=params, timeout=30)
     if r.status_code != 200:
         hint = ""
         if r.status_code == 403:
             hint = " (403 Forbidden: ensure EUBOND pricing is enabled for your key)"
         raise EODBondError(f"EOD HTTP {r.status_code}: {r.text[:200]}{hint}")
-    js = r.json()
+    js = parse_json(r)
     if not isinstance(js, list):
         return []
     return js
@@ -34,15 +37,44 @@ def fetch_eubond_eod(code: str, start: Optional[str] = None, end: Optional[str]
     if start: params["from"] = start
     if end:   params["to"]   = end
     js = _eod(url, params)
-    out=[]
+    rows=[]
     for it in js:
         d = it.get("date")
         px = it.get("close") or it.get("adjusted_close") or it.get("price")
         y  = it.get("yield") or it.get("Yield")  # some feeds use 'Yield'
         if d and px is not None:
-            out.append((datetime.fromisoformat(d), float(px), float(y) if y not in (None,"") else None))
-    return out
+            rows.append((d, px, float(y) if y not in (None,"") else None))
+    if not rows:
+        return []
+    # Parse all dates and prices in one vectorized pass
+    dates, pxs, ys = zip(*rows)
+    ts = pd.to_datetime(list(dates), format="ISO8601", cache=True).to_pydatetime()
+    return list(zip(ts.tolist(), np.asarray(pxs, dtype=np.float64).tolist(), ys))
+
 
+def fetch_bond_eod_by_isin(isin: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Tuple[datetime, float]]:
+    """
+    Returns [(ts, clean_price)] sorted by date for the bond identified by ISIN
+    (EODHD .BOND exchange), dropping implausible prices and one-day jumps.
+    """
+    if not EOD_TOKEN:
+        raise EODBondError("Missing EODHD_API_TOKEN")
+    url = f"{EOD_BASE}/eod/{isin}.BOND"
+    params = {}
+    if start: params["from"] = start
+    if end:   params["to"]   = end
+    raw = [(it.get("date"), it.get("close")) for it in _eod(url, params)]
+    raw = [(d, px) for d, px in raw if d and px is not None]
+    if not raw:
+        return []
+    dates, pxs = zip(*raw)
+    rows = []
+    prev = None
+    for ts, px in observation_rows(dates, pxs):
+        if price_sanity(px) and daily_jump_ok(prev, px):
+            rows.append((ts, px))
+            prev = px
+    return rows
 
 class EODBondProvider(SeriesProvider):
     """EODHD bond price provider using EUBOND endpoint.
@@ -51,6 +83,7 @@ class EODBondProvider(SeriesProvider):
     Series codes should be in format: BOND_EUBOND_{CODE} or just EUBOND codes.
     """
     
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
@@ -1,7 +1,8 @@
-import os, requests
+import os
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+import numpy as np
+from .base import SeriesProvider, ProviderError, get_session, parse_json, observation_rows, parquet_cache
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -16,18 +17,19 @@ def fetch_gbond_series(code: str, start: str) -> List[Tuple[datetime, float]]:
     code like US10Y, DE10Y, US05Y, DE05Y (if available).
     Returns [(ts, yield_decimal)]
     """
-    r = requests.get(f"{EOD_BASE}/eod/{code}.GBOND",
+    r = get_session().get(f"{EOD_BASE}/eod/{code}.GBOND",
                      params={"api_token": EOD_TOKEN, "fmt":"json", "from": start},
                      timeout=30)
     if r.status_code != 200:
         raise GBondError(f"GBOND HTTP {r.status_code}: {r.text[:200]}")
-    js = r.json()
-    out=[]
-    for it in js:
-        d = it.get("date"); y=it.get("close") or it.get("price")
-        if d and y not in (None,""):
-            out.append((datetime.fromisoformat(d), float(y)/100.0))  # convert % to decimal
-    return out
+    js = parse_json(r)
+    pairs = [(it.get("date"), it.get("close") or it.get("price")) for it in js]
+    pairs = [(d, y) for d, y in pairs if d and y not in (None, "")]
+    if not pairs:
+        return []
+    dates, ys = zip(*pairs)
+    # convert % to decimal on the array, before rows are built
+    return observation_rows(dates, np.asarray(ys, dtype=np.float64) / 100.0)
 
 
 class GBondProvider(SeriesProvider):
@@ -37,6 +39,7 @@ class GBondProvider(SeriesProvider):
     Series codes should be GBOND vendor codes or prefixed with "GBOND_".
     """
     
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
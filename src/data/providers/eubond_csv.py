@@ -4,10 +4,20 @@ from datetime import date
 
 ARG_KEYS = ("argentina", "republic of argentina")
 
+# Normalized columns used downstream (filter_argentina, build_bond_meta); others are not loaded
+EUBOND_COLUMNS = ("code", "name", "country", "currency", "type", "isin",
+                  "issuer", "description", "industry", "sector")
+
+def _normalize_headers(cols: pd.Index) -> pd.Index:
+    return cols.str.strip().str.lower().str.replace(" ", "_", regex=False)
+
 def load_eubond_csv(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    # Read the header alone to pick columns, then let the Arrow CSV reader parse only those
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [raw for raw, col in zip(header, _normalize_headers(header)) if col in EUBOND_COLUMNS]
+    df = pd.read_csv(path, usecols=usecols, engine="pyarrow", dtype_backend="pyarrow")
     # normalize headers
-    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+    df.columns = _normalize_headers(df.columns)
     # common columns in EOD export: Code, Name, Country, Currency, Type, ISIN, ...
     for must in ["code","name"]:
         assert any(must == c for c in df.columns), f"CSV missing '{must}'"
@@ -15,41 +25,59 @@ def load_eubond_csv(path: str) -> pd.DataFrame:
 
 def filter_argentina(df: pd.DataFrame) -> pd.DataFrame:
     cols = [c for c in df.columns if c in ("name","country","issuer","description","industry","sector")]
-    mask = df[cols].astype(str).apply(lambda s: s.str.contains("argentina", case=False, na=False)).any(axis=1)
+    if not cols:
+        return df.iloc[0:0].copy()
+    # Join the text columns once and run a single literal (non-regex) search
+    text = df[cols[0]].fillna("").astype(str)
+    if len(cols) > 1:
+        text = text.str.cat([df[c].fillna("").astype(str) for c in cols[1:]], sep=" ")
+    mask = text.str.lower().str.contains("argentina", regex=False)
     out = df[mask].copy()
     # prefer EUR bonds
     if "currency" in out.columns:
-        out = out[out["currency"].str.upper().fillna("").str.contains("EUR")]
+        out = out[out["currency"].str.upper().str.contains("EUR", regex=False, na=False)]
     return out
 
-_COUPON_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
-_MAT_RE    = re.compile(r"(20\d{2}|19\d{2})$|(\d{2}/\d{2}/\d{2})|(\d{2}/\d{2}/\d{4})")
+# One pass finds the coupon ("5.5%") and the maturity (trailing year or dd/mm/yy[yy])
+_BOND_RE = re.compile(
+    r"(?P<coup>\d+(?:\.\d+)?)\s*%|(?P<year>(?:19|20)\d{2})$|(?P<date>\d{2}/\d{2}/\d{2}(?:\d{2})?)",
+    re.ASCII,
+)
 
 def parse_coupon_maturity(name: str):
     coup = None; mat = None
-    if name:
-        m = _COUPON_RE.search(name)
-        if m:
-            coup = float(m.group(1))
-        m2 = _MAT_RE.search(name.strip())
-        if m2:
-            token = m2.group(0)
-            # normalize to YYYY-MM-DD if possible
-            if re.match(r"^\d{4}$", token):
+    if not name:
+        return coup, mat
+    name = name.strip()
+    # Most names carry neither; skip the regex entirely for those
+    if "%" not in name and "/" not in name and not name[-4:].isdigit():
+        return coup, mat
+    for m in _BOND_RE.finditer(name):
+        kind = m.lastgroup
+        if kind == "coup":
+            if coup is None:
+                coup = float(m.group("coup"))
+        elif mat is None:
+            token = m.group(kind)
+            # normalize to YYYY-MM-DD
+            if kind == "year":
                 mat = f"{token}-12-31"
             else:
-                # try dd/mm/yyyy or dd/mm/yy
-                dd, mm, yy = token.split("/")
-                yy = "20"+yy if len(yy)==2 else yy
-                mat = f"{yy}-{mm}-{dd}"
+                # dd/mm/yyyy or dd/mm/yy; fixed positions, so slice instead of split
+                yy = token[6:] if len(token) == 10 else "20" + token[6:]
+                mat = f"{yy}-{token[3:5]}-{token[:2]}"
     return coup, mat
 
 def build_bond_meta(arg_df: pd.DataFrame) -> list[dict]:
     meta=[]
-    for _, r in arg_df.iterrows():
-        code = str(r["code"]).strip()
-        name = str(r["name"]).strip()
-        cur  = str(r.get("currency","")).upper()
+    # Normalize whole columns up front instead of materializing a Series per row
+    codes = arg_df["code"].astype(str).str.strip().tolist()
+    names = arg_df["name"].astype(str).str.strip().tolist()
+    if "currency" in arg_df.columns:
+        curs = arg_df["currency"].astype(str).str.upper().tolist()
+    else:
+        curs = [""] * len(codes)
+    for code, name, cur in zip(codes, names, curs):
         if not code: continue
         coupon, maturity = parse_coupon_maturity(name)
         meta.append({
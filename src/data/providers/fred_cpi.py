@@ -1,19 +1,24 @@
 import os
 import requests
 from datetime import datetime
-from typing import List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+from functools import lru_cache
+from typing import List, Tuple, Optional, FrozenSet
+from .base import SeriesProvider, ProviderError, get_session, parse_json, observation_rows, pct_change_rows, parquet_cache
 from dotenv import load_dotenv
 
+load_dotenv()
+
 
 FRED_BASE = "https://api.stlouisfed.org/fred/series/observations"
+FRED_API_KEY = os.getenv("FRED_API_KEY", "").strip()
 
 # FRED series used:
 #  - ARGCPICOREAICPIndex: Argentina Core CPI, index (monthly)
 #  - ARGCPITOTLZG: Argentina CPI YoY percent change (monthly)
 
+@lru_cache(maxsize=1)
 def _series_map() -> dict:
-    # Allow overriding via env if needed
+    # Allow overriding via env if needed (read once per process)
     idx = os.getenv("CPI_NATIONAL_INDEX", "ARGCPALTT01IXNBM").strip()
     yoy = os.getenv("CPI_NATIONAL_YOY", "ARGCPALTT01GYM").strip()
     mom = os.getenv("CPI_NATIONAL_MOM", "ARGCPALTT01GPM").strip()
@@ -25,14 +30,11 @@ def _series_map() -> dict:
 
 
 def _build_params(series_id: str, start: Optional[str], end: Optional[str]) -> dict:
-    # Load environment variables from .env file
-    load_dotenv()
-    api_key = os.getenv("FRED_API_KEY", "").strip()
-    if not api_key:
+    if not FRED_API_KEY:
         raise ProviderError("FRED API key missing. Set FRED_API_KEY in environment.")
     params = {
         "series_id": series_id,
-        "api_key": api_key,
+        "api_key": FRED_API_KEY,
         "file_type": "json",
         "observation_start": start or "2016-01-01",
     }
@@ -42,6 +44,11 @@ def _build_params(series_id: str, start: Optional[str], end: Optional[str]) -> d
 
 
 class FREDCPIProvider(SeriesProvider):
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(_series_map())
+    
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
@@ -52,49 +59,30 @@ class FREDCPIProvider(SeriesProvider):
         if not mapped and series_code == "CPI_NATIONAL_MOM":
             # We'll compute MoM locally from the index series
             idx_rows = self.fetch_timeseries("CPI_NATIONAL_INDEX", start=start, end=end)
-            return self._pct_change(idx_rows, k=1)
+            return pct_change_rows(idx_rows, k=1)
         if not mapped:
             raise ProviderError(f"FREDCPIProvider: unknown series_code={series_code}")
 
         params = _build_params(mapped, start, end)
         try:
-            r = requests.get(FRED_BASE, params=params, timeout=45)
+            r = get_session().get(FRED_BASE, params=params, timeout=45)
             if r.status_code != 200:
                 try:
                     detail = r.json()
                 except Exception:
                     detail = r.text
                 raise ProviderError(f"FRED HTTP {r.status_code}: {detail}")
-            js = r.json()
+            js = parse_json(r)
             observations = js.get("observations", [])
-            out: List[Tuple[datetime, float]] = []
-            for o in observations:
-                d = o.get("date")
-                v = o.get("value")
-                if not d or v in (None, "."):
-                    continue
-                try:
-                    ts = datetime.fromisoformat(d)
-                except Exception:
-                    # Monthly without day -> append "-01"
-                    ts = datetime.fromisoformat(str(d) + "-01")
-                out.append((ts, float(v)))
-            out.sort(key=lambda x: x[0])
+            # "." marks a missing observation
+            obs = [(o.get("date"), o.get("value")) for o in observations]
+            obs = [(d, v) for d, v in obs if d and v not in (None, ".")]
+            if not obs:
+                return []
+            dates, values = zip(*obs)
             # Ensure CPI_NATIONAL_MOM computed if requested directly
-            if series_code == "CPI_NATIONAL_MOM":
-                return self._pct_change(out, k=1)
-            return out
+            return observation_rows(dates, values, pct_lag=1 if series_code == "CPI_NATIONAL_MOM" else 0)
         except requests.exceptions.RequestException as e:
             raise ProviderError(f"FRED request error: {e}")
         except Exception as e:
             raise ProviderError(f"FRED unexpected error: {e}")
-
-    @staticmethod
-    def _pct_change(seq: List[Tuple[datetime, float]], k: int) -> List[Tuple[datetime, float]]:
-        out: List[Tuple[datetime, float]] = []
-        for i in range(len(seq)):
-            if i >= k and seq[i - k][1] != 0:
-                out.append((seq[i][0], (seq[i][1] / seq[i - k][1] - 1) * 100))
-        return out
-
-
@@ -0,0 +1,84 @@
+"""Shared HTTP session factory with an on-disk response cache."""
+
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+from ...config.settings import get_settings
+
+try:
+    import requests_cache
+except ImportError:  # optional: fall back to plain, uncached sessions
+    requests_cache = None
+
+# Credentials sent as query parameters; kept out of cache keys and stored responses
+IGNORED_PARAMS = ["api_token", "api_key", "access_token"]
+
+# Credentials whose parameter name is too generic to ignore on every host
+HOST_IGNORED_PARAMS = {
+    "api.tradingeconomics.com": ["c"],  # TradingEconomics key
+}
+
+# Hosts whose data changes slowly enough to serve from cache without revalidating.
+# Everything else expires immediately and is revalidated on each request.
+URLS_EXPIRE_AFTER = {
+    "api.stlouisfed.org": timedelta(hours=24),    # FRED monthly CPI
+    "*.imf.org": timedelta(hours=24),             # IMF monthly CPI
+    "apis.datos.gob.ar": timedelta(hours=24),     # INDEC monthly CPI
+    "eodhd.com": timedelta(minutes=15),           # EODHD daily quotes
+}
+
+# Scraped CDS pages; window is WGB_CACHE_TTL_SEC (setting) since the site rate-limits scrapers
+WGB_HOST = "www.worldgovernmentbonds.com"
+
+
+def cache_key(request: requests.PreparedRequest, ignored_parameters=None, **kwargs) -> str:
+    """Build a requests-cache key, also ignoring HOST_IGNORED_PARAMS for the request's host.
+
+    Args:
+        request: Request being cached
+        ignored_parameters: Parameters ignored for every host (IGNORED_PARAMS)
+        **kwargs: Remaining arguments for requests_cache.create_key
+
+    Returns:
+        Cache key for the request
+    """
+    host_params = HOST_IGNORED_PARAMS.get(urlsplit(request.url).hostname or "", [])
+    ignored = [*(ignored_parameters or []), *host_params]
+    return requests_cache.create_key(request, ignored_parameters=ignored, **kwargs)
+
+
+def cached_session() -> requests.Session:
+    """Create a requests session backed by the shared SQLite response cache.
+
+    Cached responses expire immediately and are revalidated with a conditional
+    GET (ETag/Last-Modified), so unchanged series cost a 304 round trip instead
+    of a full download, and fresh data is never masked by the cache. Hosts in
+    URLS_EXPIRE_AFTER (and WGB_HOST) are served straight from the cache for
+    their window. A stale copy is served if the origin errors. Falls back to requests.Session()
+    when requests-cache is not installed.
+
+    Returns:
+        Session to use in place of requests.Session()
+    """
+    if requests_cache is None:
+        return requests.Session()
+
+    settings = get_settings()
+    cache_path = Path(settings.DATA_PATH) / "http_cache.sqlite"
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    return requests_cache.CachedSession(
+        cache_name=str(cache_path),
+        backend="sqlite",
+        expire_after=0,
+        urls_expire_after={
+            **URLS_EXPIRE_AFTER,
+            WGB_HOST: timedelta(seconds=settings.WGB_CACHE_TTL_SEC),
+        },
+        cache_control=True,
+        stale_if_error=True,
+        ignored_parameters=IGNORED_PARAMS,
+        key_fn=cache_key,
+    )
@@ -1,13 +1,28 @@
 import os
 from datetime import datetime
-from typing import List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+from functools import lru_cache
+from typing import List, Tuple, Optional, FrozenSet
+from .base import SeriesProvider, ProviderError, get_session, observation_rows, parquet_cache
 
 # Use the sdmx1 library to access IMF SDMX-REST services
 # References:
 # - IMF Data Services knowledge base: https://datasupport.imf.org/knowledge?id=knowledge_category&sys_kb_id=b849dc6b47294ad8805d07c4f16d4311&category_id=9959b2bc1b6391903dba646fbd4bcb6a
 # - sdmx1 data sources: https://sdmx1.readthedocs.io/en/v2.22.0/sources.html
-import sdmx
+
+IMF_COMPACT_URL = "https://dataservices.imf.org/REST/SDMX_JSON.svc/CompactData/IFS/ARG.PCPI_IX"
+
+
+@lru_cache(maxsize=4)
+def _client(source: Optional[str]):
+    """Return a cached sdmx Client for source (None for a generic client).
+    
+    Clients reuse the shared provider session instead of opening their own.
+    sdmx is imported here: it takes ~0.5s to import and IMF is a low-priority
+    CPI fallback that most runs never reach.
+    """
+    import sdmx
+
+    return sdmx.Client(source, session=get_session())
 
 
 class IMFProviderCPI(SeriesProvider):
@@ -16,56 +31,49 @@ class IMFProviderCPI(SeriesProvider):
     Exposes CPI_NATIONAL_INDEX (level), CPI_NATIONAL_YOY, CPI_NATIONAL_MOM.
     """
 
-    def _fetch_index(self, start: Optional[str], end: Optional[str]) -> List[Tuple[datetime, float]]:
-        # Prefer the official IMF sources known to sdmx: 'IMF_DATA' (api.imf.org) or generic Client with direct data call
-        force_source = os.getenv("IMF_CPI_SOURCE", "").upper().strip()
-        if force_source == "AR1":
-            try:
-                ar1 = sdmx.Client("AR1")
-                ar1_file = os.getenv("AR1_FILE", "IND.XML")
-                msg = ar1.data(ar1_file)
-            except Exception as e:
-                raise ProviderError(f"AR1 bulk fetch error: {e}")
-        else:
-            try:
-                client = sdmx.Client("IMF_DATA")
-            except Exception:
-                client = sdmx.Client()
-
+    def _fetch_index(self, start: Optional[str], end: Optional[str], pct_lag: int = 0) -> List[Tuple[datetime, float]]:
         params = {}
         if start:
             params["startPeriod"] = start
         if end:
             params["endPeriod"] = end
+        ar1_file = os.getenv("AR1_FILE", "IND.XML")
 
-        # Query IFS dataset, key ARG.PCPI_IX
+        force_source = os.getenv("IMF_CPI_SOURCE", "").upper().strip()
+        if force_source == "AR1":
             try:
-                msg = client.data("IFS", key="ARG.PCPI_IX", params=params)
-            except Exception as e_imf:
-                # Fall back to direct URL via generic client if source alias fails
+                msg = _client("AR1").data(ar1_file)
+            except Exception as e:
+                raise ProviderError(f"AR1 bulk fetch error: {e}")
+        else:
+            attempts = (
+                # Prefer the official IMF source known to sdmx: 'IMF_DATA' (api.imf.org), IFS key ARG.PCPI_IX
+                lambda: _client("IMF_DATA").data("IFS", key="ARG.PCPI_IX", params=params),
+                # Fall back to direct URL via generic client if source alias fails;
+                # params (not a hand-built query) so the cache keys on base URL + params
+                lambda: _client(None).get(url=IMF_COMPACT_URL, params=params),
+                # As a last resort, try AR1 bulk SDMX-ML file (no structure) for INDEC
+                lambda: _client("AR1").data(ar1_file),
+            )
+            first_error = None
+            for attempt in attempts:
                 try:
-                    url = "https://dataservices.imf.org/REST/SDMX_JSON.svc/CompactData/IFS/ARG.PCPI_IX"
-                    if params:
-                        from urllib.parse import urlencode
-                        url = url + "?" + urlencode(params)
-                    msg = client.get(url=url)
-                except Exception:
-                    # As a secondary fallback, try AR1 bulk SDMX-ML file (no structure) for INDEC
-                    try:
-                        ar1 = sdmx.Client("AR1")
-                        ar1_file = os.getenv("AR1_FILE", "IND.XML")
-                        msg = ar1.data(ar1_file)
-                    except Exception:
-                        raise ProviderError(f"IMFProviderCPI query error: {e_imf}")
+                    msg = attempt()
+                    break
+                except Exception as e:
+                    first_error = first_error or e
+            else:
+                raise ProviderError(f"IMFProviderCPI query error: {first_error}")
 
         # Convert SDMX message to (ts, value)
-        rows: List[Tuple[datetime, float]] = []
+        dates: List[str] = []
+        values: List = []
         try:
             # Iterate all series and observations
             # sdmx1 DataMessage: msg.data is a list-like of Series; use .series for dict-like access
             data = getattr(msg, "data", None)
             if data is None:
-                return rows
+                return []
             # Handle both dict-like and iterable series containers
             series_iter = []
             if hasattr(data, "series") and data.series:
@@ -102,35 +110,28 @@ class IMFProviderCPI(SeriesProvider):
                         except Exception:
                             continue
                     if t and v is not None:
-                        # TIME_PERIOD may be YYYY-MM; normalize to month start
-                        t_str = str(t)
-                        if len(t_str) == 7 and t_str.count("-") == 1:
-                            ts = datetime.fromisoformat(t_str + "-01")
-                        else:
-                            ts = datetime.fromisoformat(t_str)
-                        rows.append((ts, float(v)))
+                        dates.append(str(t))
+                        values.append(v)
         except Exception as e:
             raise ProviderError(f"IMFProviderCPI parse error: {e}")
 
-        rows.sort(key=lambda x: x[0])
-        return rows
+        # TIME_PERIOD may be YYYY-MM; observation_rows normalizes to month start
+        try:
+            return observation_rows(dates, values, pct_lag=pct_lag)
+        except Exception as e:
+            raise ProviderError(f"IMFProviderCPI parse error: {e}")
 
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(("CPI_NATIONAL_INDEX", "CPI_NATIONAL_YOY", "CPI_NATIONAL_MOM"))
+    
+    @parquet_cache
     def fetch_timeseries(self, series_code: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Tuple[datetime, float]]:
         if series_code not in ("CPI_NATIONAL_INDEX", "CPI_NATIONAL_YOY", "CPI_NATIONAL_MOM"):
             raise ProviderError("IMFProviderCPI supports CPI series only.")
 
-        rows = self._fetch_index(start, end)
-        if series_code == "CPI_NATIONAL_INDEX":
-            return rows
-
-        # Compute MoM/YoY locally
-        def pct_change(seq: List[Tuple[datetime, float]], k: int) -> List[Tuple[datetime, float]]:
-            out: List[Tuple[datetime, float]] = []
-            for i in range(len(seq)):
-                if i >= k and seq[i - k][1] != 0:
-                    out.append((seq[i][0], (seq[i][1] / seq[i - k][1] - 1) * 100))
-            return out
-
-        return pct_change(rows, 12) if series_code.endswith("YOY") else pct_change(rows, 1)
+        # Compute MoM/YoY locally, straight from the parsed index arrays
+        lag = {"CPI_NATIONAL_INDEX": 0, "CPI_NATIONAL_YOY": 12, "CPI_NATIONAL_MOM": 1}[series_code]
+        return self._fetch_index(start, end, pct_lag=lag)
 
 
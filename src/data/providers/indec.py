@@ -1,7 +1,7 @@
-import requests
+import time
 from datetime import datetime
-from typing import List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+from typing import List, Tuple, Optional, FrozenSet
+from .base import SeriesProvider, ProviderError, get_session, parse_json, observation_rows, parquet_cache
 
 BASE = "https://apis.datos.gob.ar/series/api"
 
@@ -20,9 +20,9 @@ DOCS_EXAMPLE_ID = "101.1_I2NG_2016_M_22"  # National CPI (Dec-2016=100) per API
 
 def _search_first_id() -> Optional[str]:
     for q in CANDIDATE_QUERIES:
-        r = requests.get(f"{BASE}/search", params={"q": q, "limit": 5}, timeout=30)
+        r = get_session().get(f"{BASE}/search", params={"q": q, "limit": 5}, timeout=30)
         r.raise_for_status()
-        js = r.json()
+        js = parse_json(r)
         items = (js.get("data") or {}).get("results") or js.get("results") or []
         # Try to pick "nivel general", monthly, national base 2016
         for it in items:
@@ -35,9 +35,19 @@ def _search_first_id() -> Optional[str]:
     return None
 
 
+# The resolved id is stable, so the /search round trips run at most once per TTL
+SERIES_ID_TTL = 6 * 3600  # seconds
+_series_id_cache: Optional[Tuple[float, str]] = None
+
+
 def _resolve_series_id() -> str:
-    sid = _search_first_id()
-    return sid or DOCS_EXAMPLE_ID
+    global _series_id_cache
+    now = time.monotonic()
+    if _series_id_cache is not None and now - _series_id_cache[0] < SERIES_ID_TTL:
+        return _series_id_cache[1]
+    sid = _search_first_id() or DOCS_EXAMPLE_ID
+    _series_id_cache = (now, sid)
+    return sid
 
 
 def _fetch_series(series_id: str, start: Optional[str], end: Optional[str]) -> List[Tuple[datetime, float]]:
@@ -46,29 +56,28 @@ def _fetch_series(series_id: str, start: Optional[str], end: Optional[str]) -> L
         params["start_date"] = start
     if end:
         params["end_date"] = end
-    r = requests.get(f"{BASE}/series/", params=params, timeout=30)
+    r = get_session().get(f"{BASE}/series/", params=params, timeout=30)
     if r.status_code == 404:
         raise ProviderError(f"INDEC/Series 404 for {series_id}")
     r.raise_for_status()
-    js = r.json()
+    js = parse_json(r)
     data = (js.get("data") or js)  # API returns {data: {series:[...]}} or direct obj
     # Standard shape: {"data":[{"dates":[...],"values":[...]}]} or {"series":[...]} depending on version.
     # Normalize robustly:
-    rows = []
+    pairs = []
     if isinstance(js, dict) and "series" in js:
         series = js["series"]
         for s in series:
-            for t, v in zip(s.get("index", []), s.get("values", [])):
-                if v is not None:
-                    rows.append((datetime.fromisoformat(str(t)), float(v)))
+            pairs.extend((t, v) for t, v in zip(s.get("index", []), s.get("values", [])) if v is not None)
     else:
         # alternative shape (older gateway)
         # try tabular "data" with two columns
         if "data" in js and isinstance(js["data"], list) and len(js["data"]) and isinstance(js["data"][0], list):
-            for t, v in js["data"]:
-                if v is not None:
-                    rows.append((datetime.fromisoformat(str(t)), float(v)))
-    return sorted(rows, key=lambda x: x[0])
+            pairs.extend((t, v) for t, v in js["data"] if v is not None)
+    if not pairs:
+        return []
+    dates, values = zip(*pairs)
+    return observation_rows(dates, values)
 
 
 class INDECProvider(SeriesProvider):
@@ -78,6 +87,11 @@ class INDECProvider(SeriesProvider):
       - CPI_NATIONAL_YOY    (YoY pct change)
       - CPI_NATIONAL_MOM    (MoM pct change)
     """
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(("CPI_NATIONAL_INDEX", "CPI_NATIONAL_YOY", "CPI_NATIONAL_MOM"))
+    
+    @parquet_cache
     def fetch_timeseries(self, series_code: str, start: Optional[str]=None, end: Optional[str]=None):
         sid = _resolve_series_id()
         transform = None
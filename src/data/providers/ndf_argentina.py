@@ -10,12 +10,16 @@ Day-count convention: ACT/365 (actual days / 365) for all calculations.
 """
 
 import os
+import time
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional, Dict
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, FrozenSet
+import numpy as np
+import pandas as pd
 from dotenv import load_dotenv
 
-import requests
-from .base import SeriesProvider, ProviderError
+from .base import SeriesProvider, ProviderError, get_session, parse_json, parquet_cache
+from ...config.settings import get_settings
 
 load_dotenv()
 
@@ -44,6 +48,12 @@ BASE_SPREAD_BPS = {
     "12M": float(os.getenv("NDF_SYNTH_12M_SPREAD_BPS", "600")),  # 600 bps default
 }
 
+# Per-tenor pricing inputs resolved once: (days, ACT/365 year fraction, base spread as a decimal)
+_TENOR_PARAMS = {
+    info["tenor"]: (info["days"], info["days"] / DAY_COUNT_BASIS, BASE_SPREAD_BPS[info["tenor"]] / 10000.0)
+    for info in NDF_SERIES_MAP.values()
+}
+
 # State-dependent spread multipliers
 # Multipliers increase spreads in stressed states (higher CDS/EMBI)
 # Format: (cds_threshold_bps, embi_threshold_bps, multiplier)
@@ -54,6 +64,9 @@ STATE_MULTIPLIERS = [
     (800, 1400, 1.0),   # Normal: CDS <= 800 and EMBI <= 1400 -> 1.0x spread (base)
 ]
 
+# Most stressed state first, sorted once at import
+_STATE_MULTIPLIERS_SORTED = tuple(sorted(STATE_MULTIPLIERS, key=lambda x: x[2], reverse=True))
+
 # Enable state-dependent calibration (can be disabled via env)
 USE_STATE_CALIBRATION = os.getenv("NDF_USE_STATE_CALIBRATION", "true").lower() == "true"
 
@@ -81,11 +94,11 @@ def _fetch_te_ndf(tenor: str, start: Optional[str] = None, end: Optional[str] =
         params["d2"] = end
     
     try:
-        r = requests.get(endpoint, params=params, timeout=30)
+        r = get_session().get(endpoint, params=params, timeout=30)
         if r.status_code != 200:
             raise ProviderError(f"TradingEconomics HTTP {r.status_code}")
         
-        data = r.json()
+        data = parse_json(r)
         out: List[Tuple[datetime, float]] = []
         for row in data:
             # Parse TE response format (adjust based on actual structure)
@@ -118,8 +131,7 @@ def _get_state_multiplier(cds_bps: Optional[float] = None, embi_bps: Optional[fl
         return 1.0  # No data available, use base
     
     # Find first matching state (most stressed first)
-    # Sort by multiplier descending so we check highest risk thresholds first
-    for cds_thresh, embi_thresh, multiplier in sorted(STATE_MULTIPLIERS, key=lambda x: x[2], reverse=True):
+    for cds_thresh, embi_thresh, multiplier in _STATE_MULTIPLIERS_SORTED:
         cds_trigger = cds_bps is not None and cds_bps >= cds_thresh
         embi_trigger = embi_bps is not None and embi_bps >= embi_thresh
         if cds_trigger or embi_trigger:
@@ -128,6 +140,20 @@ def _get_state_multiplier(cds_bps: Optional[float] = None, embi_bps: Optional[fl
     return 1.0  # Default: base multiplier
 
 
+# Latest CDS and EMBI in one round trip; EMBI is the newer of the local and synthetic series
+LATEST_CDS_EMBI_QUERY = """
+    SELECT
+        (
+            SELECT arg_max(value, ts) FROM fact_series
+            WHERE series_id = 'CDS_ARG_5Y_USD'
+        ) AS cds_bps,
+        (
+            SELECT arg_max(value, ts) FROM fact_series
+            WHERE series_id IN ('EMBI_ARG_LOCAL', 'EMBI_ARG_SYNTH_USD')
+        ) AS embi_bps
+"""
+
+
 def _get_latest_cds_embi() -> Tuple[Optional[float], Optional[float]]:
     """Fetch latest CDS and EMBI levels for state calibration.
     
@@ -138,22 +164,7 @@ def _get_latest_cds_embi() -> Tuple[Optional[float], Optional[float]]:
         from src.data.db import connect
         
         with connect() as conn:
-            # Get latest CDS
-            cds_result = conn.execute("""
-                SELECT value FROM fact_series 
-                WHERE series_id = 'CDS_ARG_5Y_USD'
-                ORDER BY ts DESC LIMIT 1
-            """).fetchone()
-            cds_bps = cds_result[0] if cds_result else None
-            
-            # Get latest EMBI (prefer local, fallback to synth)
-            embi_result = conn.execute("""
-                SELECT value FROM fact_series 
-                WHERE series_id IN ('EMBI_ARG_LOCAL', 'EMBI_ARG_SYNTH_USD')
-                ORDER BY ts DESC LIMIT 1
-            """).fetchone()
-            embi_bps = embi_result[0] if embi_result else None
-            
+            cds_bps, embi_bps = conn.execute(LATEST_CDS_EMBI_QUERY).fetchone()
             return (cds_bps, embi_bps)
     except Exception:
         # If database unavailable or series missing, return None
@@ -166,7 +177,8 @@ def _construct_synthetic_ndf(
     ars_rate: Optional[float] = None,
     usd_rate: Optional[float] = None,
     days: int = 90,
-    apply_state_calibration: bool = True
+    apply_state_calibration: bool = True,
+    state_multiplier: Optional[float] = None
 ) -> Optional[float]:
     """Construct synthetic NDF rate from interest rate differential.
     
@@ -183,6 +195,8 @@ def _construct_synthetic_ndf(
         usd_rate: USD interest rate (annualized, decimal, e.g., 0.05 for 5%)
         days: Days to maturity
         apply_state_calibration: If True, apply CDS/EMBI-based state multipliers
+        state_multiplier: Precomputed CDS/EMBI multiplier; looked up in the
+            database when None
         
     Returns:
         Synthetic forward rate, or None if inputs missing
@@ -201,11 +215,11 @@ def _construct_synthetic_ndf(
     # This is a simplified approach - real NDF pricing is more complex
     base_spread_bps = BASE_SPREAD_BPS.get(tenor, 150)
     
-    # Apply state-dependent multiplier if enabled
-    if apply_state_calibration:
-        cds_bps, embi_bps = _get_latest_cds_embi()
-        multiplier = _get_state_multiplier(cds_bps, embi_bps)
-        spread_bps = base_spread_bps * multiplier
+    # Apply state-dependent multiplier if enabled (no database lookup when the flag is off)
+    if apply_state_calibration and USE_STATE_CALIBRATION:
+        if state_multiplier is None:
+            state_multiplier = _get_state_multiplier(*_get_latest_cds_embi())
+        spread_bps = base_spread_bps * state_multiplier
     else:
         spread_bps = base_spread_bps
     
@@ -219,6 +233,61 @@ def _construct_synthetic_ndf(
     return forward_rate
 
 
+def _fetch_spot_rows(start: Optional[str], end: Optional[str]) -> List[Tuple[datetime, float]]:
+    """Official USD/ARS spot from the router's shared BCRA instance."""
+    # Imported here: the router imports this module, and BCRA is only needed for synthetic NDFs
+    from ..provider_router import get_provider
+    from .bcra import BCRAProvider
+    
+    return get_provider("BCRA", BCRAProvider).fetch_timeseries("USDARS_OFFICIAL", start=start, end=end)
+
+
+@lru_cache(maxsize=32)
+def _cached_spot_rows(start: Optional[str], end: Optional[str], bucket: int) -> Tuple[Tuple[datetime, float], ...]:
+    """Memoized _fetch_spot_rows; bucket is the PROVIDER_CACHE_TTL window the call falls in."""
+    return tuple(_fetch_spot_rows(start, end))
+
+
+def _spot_rows(start: Optional[str], end: Optional[str]) -> List[Tuple[datetime, float]]:
+    """Spot history reused in-process for PROVIDER_CACHE_TTL seconds, so the four tenors fetch it once."""
+    ttl = get_settings().PROVIDER_CACHE_TTL
+    if ttl <= 0:
+        return _fetch_spot_rows(start, end)
+    return list(_cached_spot_rows(start, end, int(time.time() // ttl)))
+
+
+def _require_spot_rows(start: Optional[str], end: Optional[str]) -> List[Tuple[datetime, float]]:
+    """Spot history for synthetic construction; ProviderError if unavailable."""
+    # Get spot rate history directly from BCRA (shared across tenors)
+    try:
+        spot_rows = _spot_rows(start, end)
+        if not spot_rows:
+            raise ProviderError("Cannot construct synthetic NDF: no spot rate data available")
+    except Exception as e:
+        raise ProviderError(f"Cannot construct synthetic NDF: failed to fetch spot rate: {e}")
+    return spot_rows
+
+
+def _fetch_synthetic_curve(start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, pd.Series]:
+    """Construct every synthetic NDF tenor from one spot history in a single broadcast.
+    
+    Prices each tenor exactly like _fetch_synthetic_ndf; the state multiplier
+    is looked up once for the whole curve.
+    """
+    spot_rows = _require_spot_rows(start, end)
+    codes = tuple(NDF_SERIES_MAP)
+    # (n_tenors, 2): ACT/365 year fraction and base spread, in NDF_SERIES_MAP order
+    params = np.array([_TENOR_PARAMS[NDF_SERIES_MAP[c]["tenor"]][1:] for c in codes])
+    multiplier = _get_state_multiplier(*_get_latest_cds_embi()) if USE_STATE_CALIBRATION else 1.0
+    premiums = (params[:, 1] * multiplier) * params[:, 0]
+    
+    index = pd.DatetimeIndex([ts for ts, _ in spot_rows])
+    spots = np.fromiter((v for _, v in spot_rows), dtype=np.float64, count=len(spot_rows))
+    # (n_dates, n_tenors) forward matrix
+    forwards = spots[:, None] * (1.0 + premiums)[None, :]
+    return {code: pd.Series(forwards[:, j], index=index, name=code) for j, code in enumerate(codes)}
+
+
 def _fetch_synthetic_ndf(
     series_code: str,
     start: Optional[str] = None,
@@ -229,34 +298,24 @@ def _fetch_synthetic_ndf(
     This requires fetching the spot rate first, then applying forward pricing logic.
     Fetches spot rate directly from BCRA provider to avoid circular dependency.
     """
-    # Import BCRA provider directly to avoid circular dependency with router
-    from .bcra import BCRAProvider
-    
-    # Get spot rate history directly from BCRA
-    bcra = BCRAProvider()
-    try:
-        spot_rows = bcra.fetch_timeseries("USDARS_OFFICIAL", start=start, end=end)
-        if not spot_rows:
-            raise ProviderError("Cannot construct synthetic NDF: no spot rate data available")
-    except Exception as e:
-        raise ProviderError(f"Cannot construct synthetic NDF: failed to fetch spot rate: {e}")
+    spot_rows = _require_spot_rows(start, end)
     
     # Get tenor info
     tenor_info = NDF_SERIES_MAP.get(series_code)
     if not tenor_info:
         raise ProviderError(f"Unknown NDF series: {series_code}")
     
-    tenor = tenor_info["tenor"]
-    days = tenor_info["days"]
+    _, time_fraction, base_spread = _TENOR_PARAMS[tenor_info["tenor"]]
     
-    # Construct forward rates for each spot date
-    out: List[Tuple[datetime, float]] = []
-    for ts, spot_rate in spot_rows:
-        forward_rate = _construct_synthetic_ndf(tenor, spot_rate=spot_rate, days=days)
-        if forward_rate is not None:
-            out.append((ts, forward_rate))
+    # Latest CDS/EMBI state is the same for every spot date; look it up once
+    multiplier = _get_state_multiplier(*_get_latest_cds_embi()) if USE_STATE_CALIBRATION else 1.0
+    spread_decimal = base_spread * multiplier
     
-    return out
+    # Same spot + spread pricing as _construct_synthetic_ndf, over the whole history at once
+    dates = [ts for ts, _ in spot_rows]
+    spots = np.fromiter((v for _, v in spot_rows), dtype=np.float64, count=len(spot_rows))
+    forwards = spots * (1.0 + spread_decimal * time_fraction)
+    return list(zip(dates, forwards.tolist()))
 
 
 class NDFArgentinaProvider(SeriesProvider):
@@ -279,6 +338,11 @@ class NDFArgentinaProvider(SeriesProvider):
     - Day-count: ACT/365
     """
     
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(NDF_SERIES_MAP)
+    
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
@@ -322,3 +386,28 @@ class NDFArgentinaProvider(SeriesProvider):
         # Should be down-weighted (e.g., 0.25) to avoid double-counting FX signal
         return _fetch_synthetic_ndf(series_code, start=start, end=end)
 
+    def fetch_curve(self, start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, pd.Series]:
+        """Fetch every NDF tenor at once.
+        
+        Synthetic curves share one spot fetch and one state lookup, and all
+        tenors are priced in a single vectorized pass. With a TradingEconomics
+        key each tenor goes through fetch_timeseries as usual.
+        
+        Args:
+            start: Start date in YYYY-MM-DD format
+            end: End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict mapping each NDF series code to forward rates indexed by timestamp
+            
+        Raises:
+            ProviderError: If spot data is unavailable
+        """
+        if TE_API_KEY:
+            curve = {}
+            for code in NDF_SERIES_MAP:
+                rows = self.fetch_timeseries(code, start=start, end=end)
+                curve[code] = pd.Series([v for _, v in rows], index=pd.DatetimeIndex([t for t, _ in rows]), name=code, dtype="float64")
+            return curve
+        return _fetch_synthetic_curve(start, end)
+
@@ -1,45 +1,103 @@
+import atexit
 import time
 import random
 import re
+import threading
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, FrozenSet
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
-from .base import SeriesProvider, ProviderError
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from .base import SeriesProvider, ProviderError, get_session, parquet_cache
+
+try:
+    import lxml  # noqa: F401  (C-backed BeautifulSoup tree builder)
+    HTML_PARSER = "lxml"
+except ImportError:  # optional: fall back to the pure-Python parser
+    HTML_PARSER = "html.parser"
 
 WGB_HIST_URL = "https://www.worldgovernmentbonds.com/cds-historical-data/argentina/5-years/"
 WGB_SOVEREIGN_HUB = "https://www.worldgovernmentbonds.com/sovereign-cds/"
 UA = "Mozilla/5.0 (compatible; arg-reform-inv/1.0; +https://example.org)"
+# Longest server-requested wait (seconds) _polite_get will sleep before retrying; beyond it, give up
+MAX_RETRY_AFTER = 60
+
+# Per-request browser-like headers; kept off the shared session, which other providers use
+HEADERS = {
+    "User-Agent": UA,
+    "Accept": "text/html,application/xhtml+xml",
+    # Compressed pages (br too when brotli is installed); requests decodes transparently
+    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+# Patterns compiled once at import; used by the parsers below
+_NUM_RE = re.compile(r"([-+]?\d[\d,]*\.?\d*)")
+# Raw-HTML patterns for the latest value, tried in order. The page structure is
+# data-async-variable="jsGlobalResult|result.ultimoValore">1030.95
+_HTML_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    # Exact match: data-async-variable="jsGlobalResult|result.ultimoValore">number
+    r'data-async-variable=["\']jsGlobalResult\|result\.ultimoValore["\'][^>]*>(\d{3,}[\d,]*\.?\d*)',
+    # With whitespace tolerance
+    r'data-async-variable\s*=\s*["\']jsGlobalResult\|result\.ultimoValore["\'][^>]*>\s*(\d{3,}[\d,]*\.?\d*)',
+    # Simpler: just look for ultimoValore followed by closing tag and number
+    r'ultimoValore["\'][^>]*>\s*(\d{3,}[\d,]*\.?\d*)',
+    # Even simpler: just the number pattern after "ultimoValore"
+    r'ultimoValore[^>]*>([0-9]{3,}[0-9,]*\.[0-9]+)',
+))
+# Text search: "Argentina 5 Years" ... number (require 3+ digits)
+_ARG_5Y_RE = re.compile(r"Argentina.*?5\s*Years.*?(\d{3,}[\d,]*\.?\d*)", re.IGNORECASE)
+_CDS_ARG_RE = re.compile(r"CDS.*?Argentina.*?(\d{3,}[\d,]*\.?\d*)", re.IGNORECASE)
+_ALL_NUMS_RE = re.compile(r"\b(\d{4}\.\d+)\b")
+# Case-insensitive keyword scans, without lowercasing the page
+_KEYWORD_RE = re.compile(r"ultimovalore|argentina|cds", re.IGNORECASE)
+# The number fallback ranks by distance to the first of these; CDS alone is too generic
+_ANCHOR_RE = re.compile(r"ultimovalore|argentina", re.IGNORECASE)
+_TABLE_RE = re.compile(r"<table\b.*?</table\s*>", re.IGNORECASE | re.DOTALL)
 
 class WGBCDSProviderError(RuntimeError):
     ...
 
+def _retry_after(r) -> float:
+    """Seconds the server asked us to wait (Retry-After as seconds or HTTP-date), else 0."""
+    value = r.headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        return Retry().parse_retry_after(value)
+    except Exception:
+        return 0.0
+
 def _polite_get(url: str, tries: int = 3, base_sleep: float = 0.6) -> str:
-    last = None
-    headers = {
-        "User-Agent": UA,
-        "Accept": "text/html,application/xhtml+xml",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Connection": "keep-alive",
-    }
+    # Transport errors and 429/5xx are already retried by the shared session's
+    # urllib3 Retry (honouring Retry-After); this loop only covers responses that
+    # come back but are unusable: other non-200s and Cloudflare challenge pages.
+    session = get_session()
     for i in range(tries):
         try:
-            r = requests.get(url, timeout=30, headers=headers)
-            if r.status_code != 200:
-                raise WGBCDSProviderError(f"HTTP {r.status_code}")
-            text = r.text
-            if "<title>Just a moment" in text or "Please enable JavaScript" in text:
-                raise WGBCDSProviderError("Intermittent JS/CF challenge")
-            return text
+            r = session.get(url, timeout=30, headers=HEADERS)
         except Exception as e:
-            last = e
-            if i == tries - 1:
-                raise WGBCDSProviderError(f"GET failed: {e}")
-            time.sleep(base_sleep * (2**i) + random.random() * 0.25)
-    raise WGBCDSProviderError(str(last))
+            raise WGBCDSProviderError(f"GET failed: {e}")
+        if r.status_code != 200:
+            problem = f"HTTP {r.status_code}"
+        else:
+            text = r.text
+            if "<title>Just a moment" not in text and "Please enable JavaScript" not in text:
+                return text
+            # Drop the challenge page from the HTTP cache so the retry refetches
+            cache = getattr(session, "cache", None)
+            if cache is not None:
+                cache.delete(urls=[r.url])
+            problem = "Intermittent JS/CF challenge"
+        wait = _retry_after(r)
+        if i == tries - 1 or wait > MAX_RETRY_AFTER:
+            raise WGBCDSProviderError(f"GET failed: {problem}")
+        time.sleep(max(wait, base_sleep * (2**i) + random.random() * 0.25))
+    raise WGBCDSProviderError("GET failed: no attempts made")
 
 def _to_float_bps(x) -> Optional[float]:
     if x is None:
@@ -52,7 +110,7 @@ def _to_float_bps(x) -> Optional[float]:
         return float(s)
     except Exception:
         # try to extract numbers like "1,785.10 bps"
-        m = re.search(r"([-+]?\d[\d,]*\.?\d*)", s)
+        m = _NUM_RE.search(s)
         if m:
             try:
                 return float(m.group(1).replace(",", ""))
@@ -60,20 +118,52 @@ def _to_float_bps(x) -> Optional[float]:
                 return None
         return None
 
+def _read_tables(html: str, keyword: str) -> List[pd.DataFrame]:
+    """Parse only the <table> fragments whose markup mentions keyword (case-insensitive).
+    
+    The pages carry many unrelated tables; when none mentions keyword every
+    table is parsed, as before. Markup outside tables is never parsed.
+    """
+    fragments = [m.group(0) for m in _TABLE_RE.finditer(html)]
+    if not fragments:
+        return []
+    matching = [f for f in fragments if keyword in f.lower()] or fragments
+    try:
+        return pd.read_html(StringIO("".join(matching)))
+    except ValueError:
+        return []
+
+def _table_series(dates: pd.Series, values: pd.Series) -> pd.Series:
+    """Vectorized _to_float_bps/pd.to_datetime over a scraped date/value column pair.
+    
+    Returns the parsed values indexed by timestamp, sorted, unparseable rows dropped.
+    """
+    ds = dates.astype(str).str.strip()
+    ts = pd.to_datetime(ds, errors="coerce")
+    bad = ts.isna()
+    if bad.any():
+        # Rows not in the inferred format are parsed one by one, as before
+        ts[bad] = pd.to_datetime(ds[bad], errors="coerce", format="mixed")
+    vs = values.astype(str).str.strip().str.replace(",", "", regex=False)
+    num = pd.to_numeric(vs, errors="coerce")
+    # Values with units ("1785.10 bps") fall back to the leading number
+    num = num.fillna(pd.to_numeric(vs.str.extract(_NUM_RE, expand=False), errors="coerce"))
+    mask = ts.notna() & num.notna()
+    series = pd.Series(num[mask].to_numpy(dtype=float), index=pd.DatetimeIndex(ts[mask]))
+    return series.sort_index(kind="stable")
+
 def fetch_history_argentina_cds_5y_wgb(start: Optional[str] = None, end: Optional[str] = None) -> List[Tuple[datetime, float]]:
     """
     Preferred when the page serves a static table (sometimes it doesn't).
     Returns list of (ts, bps). Falls back to the sovereign hub page if needed.
     """
     out: List[Tuple[datetime, float]] = []
+    hist: Optional[pd.Series] = None
 
     # Try the historical page first
     try:
         html = _polite_get(WGB_HIST_URL)
-        try:
-            tables = pd.read_html(StringIO(html))
-        except ValueError:
-            tables = []
+        tables = _read_tables(html, "date")
         if tables:
             # Pick a table with a Date column
             df = None
@@ -86,70 +176,83 @@ def fetch_history_argentina_cds_5y_wgb(start: Optional[str] = None, end: Optiona
                 date_col = next(c for c in df.columns if "date" in str(c).lower())
                 value_col = next((c for c in df.columns if c != date_col), None)
                 if value_col is not None:
-                    for _, row in df.iterrows():
-                        ds = str(row[date_col]).strip()
-                        try:
-                            dt = pd.to_datetime(ds).to_pydatetime()
-                        except Exception:
-                            continue
-                        v = _to_float_bps(row[value_col])
-                        if v is None:
-                            continue
-                        out.append((dt, v))
+                    hist = _table_series(df[date_col], df[value_col])
     except Exception:
         # ignore and try hub
         pass
 
-    # If still empty, try the sovereign hub page (sometimes has a big country table)
-    if not out:
-        try:
-            hub = _polite_get(WGB_SOVEREIGN_HUB)
-            try:
-                tables = pd.read_html(StringIO(hub))
-            except ValueError:
-                tables = []
-            if tables:
-                # Find a table that lists countries and 5Y CDS
-                chosen = None
-                for t in tables:
-                    cols = [str(c).lower() for c in t.columns]
-                    if any("country" in c for c in cols) and any("5" in c and "cds" in c for c in cols):
-                        chosen = t
-                        break
-                if chosen is None:
-                    # fallback: widest table
-                    chosen = max(tables, key=lambda df: df.shape[0])
-                # filter Argentina rows
-                cols = [str(c).lower() for c in chosen.columns]
-                chosen.columns = cols
-                # guess value column
-                cand_value_cols = [c for c in cols if ("5" in c and "cds" in c) or ("last" in c or "value" in c)]
-                value_col = cand_value_cols[0] if cand_value_cols else cols[-1]
-                country_col = next((c for c in cols if "country" in c), cols[0])
-                arg_rows = chosen[chosen[country_col].astype(str).str.contains("argentina", case=False, na=False)]
-                # No dates on hub; we’ll treat this as latest only with 'now' ts
-                if not arg_rows.empty:
-                    v = _to_float_bps(arg_rows.iloc[0][value_col])
-                    if v is not None:
-                        out.append((datetime.utcnow(), v))
-        except Exception:
-            pass
+    if hist is not None and not hist.empty:
+        # Date filter as an index slice on the sorted series; end includes the whole day
+        hist = hist.loc[start:end]
+        return list(zip(hist.index.to_pydatetime().tolist(), hist.tolist()))
 
-    # Sort & filter
-    out.sort(key=lambda x: x[0])
+    # Otherwise try the sovereign hub page (sometimes has a big country table)
+    try:
+        hub = _polite_get(WGB_SOVEREIGN_HUB)
+        tables = _read_tables(hub, "argentina")
+        if tables:
+            # Find a table that lists countries and 5Y CDS
+            chosen = None
+            for t in tables:
+                cols = [str(c).lower() for c in t.columns]
+                if any("country" in c for c in cols) and any("5" in c and "cds" in c for c in cols):
+                    chosen = t
+                    break
+            if chosen is None:
+                # fallback: widest table
+                chosen = max(tables, key=lambda df: df.shape[0])
+            # filter Argentina rows
+            cols = [str(c).lower() for c in chosen.columns]
+            chosen.columns = cols
+            # guess value column
+            cand_value_cols = [c for c in cols if ("5" in c and "cds" in c) or ("last" in c or "value" in c)]
+            value_col = cand_value_cols[0] if cand_value_cols else cols[-1]
+            country_col = next((c for c in cols if "country" in c), cols[0])
+            arg_rows = chosen[chosen[country_col].astype(str).str.contains("argentina", case=False, na=False)]
+            # No dates on hub; we’ll treat this as latest only with 'now' ts
+            if not arg_rows.empty:
+                v = _to_float_bps(arg_rows.iloc[0][value_col])
+                if v is not None:
+                    out.append((datetime.utcnow(), v))
+    except Exception:
+        pass
+
+    # Filter the hub's single latest row
     if start:
         out = [r for r in out if r[0].date().isoformat() >= start]
     if end:
         out = [r for r in out if r[0].date().isoformat() <= end]
     return out
 
+# Playwright's sync API is bound to the thread that started it, so each thread
+# keeps its own browser; it is launched on first use and closed at exit
+_playwright_local = threading.local()
+
+def _close_browser(pw, browser) -> None:
+    try:
+        browser.close()
+        pw.stop()
+    except Exception:
+        pass
+
+def _playwright_browser():
+    """Return this thread's headless Chromium, launching it on first use."""
+    browser = getattr(_playwright_local, "browser", None)
+    if browser is None or not browser.is_connected():
+        from playwright.sync_api import sync_playwright
+        pw = sync_playwright().start()
+        browser = pw.chromium.launch(headless=True)
+        _playwright_local.browser = browser
+        atexit.register(_close_browser, pw, browser)
+    return browser
+
 def _try_playwright() -> Optional[float]:
     """Try using Playwright to render JavaScript and extract CDS value."""
     try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        # Fresh context per call (no shared cookies/cache); the browser is reused
+        context = _playwright_browser().new_context()
+        try:
+            page = context.new_page()
             page.goto(WGB_HIST_URL, wait_until="networkidle", timeout=30000)
             # Wait for the value to load (check for data-async-loaded="true" or non-placeholder value)
             try:
@@ -161,16 +264,9 @@ def _try_playwright() -> Optional[float]:
             # Extract value using Playwright
             elem = page.query_selector('span.summary-value-number')
             if elem:
-                val_text = elem.inner_text().strip()
-                if val_text and val_text not in ('----', '---', '--', '-', ''):
-                    try:
-                        val = float(val_text.replace(",", ""))
-                        if 500 <= val <= 10000:
-                            browser.close()
-                            return val
-                    except ValueError:
-                        pass
-            browser.close()
+                return _bps_in_range(elem.inner_text())
+        finally:
+            context.close()
     except ImportError:
         # Playwright not installed
         pass
@@ -179,194 +275,101 @@ def _try_playwright() -> Optional[float]:
         pass
     return None
 
+def _bps_in_range(text: str) -> Optional[float]:
+    """Parse a CDS level, rejecting JS placeholders ("----") and implausible values."""
+    try:
+        val = float(text.replace(",", "").strip())
+    except ValueError:
+        return None
+    return val if 500 <= val <= 10000 else None
+
+def _latest_from_raw_html(html: str) -> Optional[float]:
+    # data-async-variable="jsGlobalResult|result.ultimoValore">1030.95, no parse tree needed
+    for pattern in _HTML_PATTERNS:
+        m = pattern.search(html)
+        if m:
+            val = _bps_in_range(m.group(1))
+            if val is not None:
+                return val
+    return None
+
+def _latest_from_dom(soup: BeautifulSoup) -> Optional[float]:
+    # summary-banner -> summary-value -> summary-amount -> summary-value-number first,
+    # then the number span anywhere (class lists like "summary-value borsaInverso" match)
+    for selector in (
+        ".summary-banner .summary-value .summary-amount .summary-value-number",
+        "span.summary-value-number",
+    ):
+        for elem in soup.select(selector):
+            val = _bps_in_range(elem.get_text(strip=True))
+            if val is not None:
+                return val
+    # Any span bound to ultimoValore
+    for span in soup.find_all("span", attrs={"data-async-variable": True}):
+        if "ultimoValore" in span.get("data-async-variable", ""):
+            val = _bps_in_range(span.get_text(strip=True))
+            if val is not None:
+                return val
+    return None
+
+def _latest_from_text(soup: BeautifulSoup) -> Optional[float]:
+    text = soup.get_text(separator=" ", strip=True)
+    m = _ARG_5Y_RE.search(text) or _CDS_ARG_RE.search(text)
+    return _bps_in_range(m.group(1)) if m else None
+
+def _latest_near_keywords(html: str, window: int = 500) -> Optional[float]:
+    # Broadest fallback: a number in the current Argentina CDS range (~1000-1100 bps)
+    # within window chars of any ultimoValore/Argentina/CDS mention, closest to the
+    # first ultimoValore/Argentina mention; only the windows around mentions are scanned
+    spans: List[List[int]] = []
+    for kw in _KEYWORD_RE.finditer(html):
+        lo, hi = max(0, kw.start() - window), kw.end() + window
+        if spans and lo <= spans[-1][1]:
+            spans[-1][1] = hi  # overlapping windows are scanned once
+        else:
+            spans.append([lo, hi])
+    candidates = []
+    for lo, hi in spans:
+        for m in _ALL_NUMS_RE.finditer(html, lo, hi):
+            val = float(m.group(1))
+            if 1000 <= val <= 1100:
+                candidates.append((m.start(), val))
+    if not candidates:
+        return None
+    anchor = _ANCHOR_RE.search(html)
+    if anchor is None:
+        # Only CDS mentions: take the first candidate on the page
+        return candidates[0][1]
+    return min(candidates, key=lambda c: abs(c[0] - anchor.start()))[1]
+
 def fetch_latest_argentina_cds_5y_wgb() -> List[Tuple[datetime, float]]:
     """
     Fast path to get today's (latest) CDS even when there's no table.
-    Navigates the exact HTML structure: summary-banner -> summary-value -> summary-amount -> summary-value-number
     The HTML contains: <span class="summary-value-number" data-async-variable="jsGlobalResult|result.ultimoValore">1030.95</span>
+    Strategies run cheapest first and stop at the first hit; the page is only
+    parsed with BeautifulSoup when the raw-HTML regex misses.
     
     Note: The page loads values via JavaScript, so if static HTML parsing fails, this will try Playwright.
     """
     html = _polite_get(WGB_HIST_URL)
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Quick diagnostic: check if the expected elements exist in the HTML
-    has_summary_banner = 'summary-banner' in html
-    has_summary_value_number = 'summary-value-number' in html
-    has_ultimo_valore = 'ultimoValore' in html or 'ultimovalore' in html
-    
-    # Strategy 1: Navigate the exact HTML structure path
-    # summary-banner -> summary-value -> summary-amount -> summary-value-number
-    # Handle classes that might have multiple values (e.g., "summary-value borsaInverso")
-    summary_banner = soup.find('div', class_=lambda x: x and 'summary-banner' in x)
-    if summary_banner:
-        # summary-value might have additional classes like "borsaInverso"
-        summary_value = summary_banner.find('div', class_=lambda x: x and 'summary-value' in x)
-        if summary_value:
-            summary_amount = summary_value.find('span', class_='summary-amount')
-            if summary_amount:
-                summary_value_number = summary_amount.find('span', class_='summary-value-number')
-                if summary_value_number:
-                    val_text = summary_value_number.get_text(strip=True)
-                    # Handle JavaScript placeholder (---- or similar)
-                    if val_text in ('----', '---', '--', '-', ''):
-                        # Value hasn't been loaded by JavaScript yet - will try other strategies
-                        pass
-                    else:
-                        try:
-                            val = float(val_text.replace(",", ""))
-                            if 500 <= val <= 10000:
-                                return [(datetime.utcnow(), val)]
-                        except ValueError:
-                            pass
-    
-    # Strategy 2: CSS selector for the exact path (multiple variations)
-    css_selectors = [
-        'div.summary-banner div.summary-value span.summary-amount span.summary-value-number',
-        '.summary-banner .summary-value .summary-amount .summary-value-number',
-        'span.summary-value-number',  # Simplest - just find it anywhere
-    ]
-    for selector in css_selectors:
-        try:
-            elems = soup.select(selector)
-            for elem in elems:
-                val_text = elem.get_text(strip=True)
-                # Skip JavaScript placeholders
-                if val_text in ('----', '---', '--', '-', ''):
-                    continue
-                try:
-                    val = float(val_text.replace(",", ""))
-                    if 500 <= val <= 10000:
-                        return [(datetime.utcnow(), val)]
-                except ValueError:
-                    continue
-        except Exception:
-            continue
-
-    # Strategy 3: Look for span with class 'summary-value-number' (simpler fallback)
-    # Try both exact match and checking if class contains the string
-    summary_elem = soup.find('span', class_='summary-value-number')
-    if not summary_elem:
-        # Also try with lambda to handle multiple classes
-        summary_elem = soup.find('span', class_=lambda x: x and ('summary-value-number' in str(x) if isinstance(x, list) else 'summary-value-number' in x))
-    
-    if summary_elem:
-        val_text = summary_elem.get_text(strip=True)
-        try:
-            val = float(val_text.replace(",", ""))
-            if 500 <= val <= 10000:
-                return [(datetime.utcnow(), val)]
-        except ValueError:
-            pass
 
-    # Strategy 4: Look for span with data-async-variable containing 'ultimoValore'
-    all_spans = soup.find_all('span', attrs={'data-async-variable': True})
-    for span in all_spans:
-        data_attr = span.get('data-async-variable', '')
-        if data_attr and 'ultimoValore' in data_attr:
-            val_text = span.get_text(strip=True)
-            try:
-                val = float(val_text.replace(",", ""))
-                if 500 <= val <= 10000:
-                    return [(datetime.utcnow(), val)]
-            except ValueError:
-                continue
-
-    # Strategy 3: Search raw HTML for the pattern directly (most reliable - works even if BeautifulSoup misses it)
-    # The HTML structure: data-async-variable="jsGlobalResult|result.ultimoValore">1030.95
-    # Try multiple patterns with different escaping and whitespace handling
-    html_patterns = [
-        # Exact match: data-async-variable="jsGlobalResult|result.ultimoValore">number
-        r'data-async-variable=["\']jsGlobalResult\|result\.ultimoValore["\'][^>]*>(\d{3,}[\d,]*\.?\d*)',
-        # With whitespace tolerance
-        r'data-async-variable\s*=\s*["\']jsGlobalResult\|result\.ultimoValore["\'][^>]*>\s*(\d{3,}[\d,]*\.?\d*)',
-        # Simpler: just look for ultimoValore followed by closing tag and number
-        r'ultimoValore["\'][^>]*>\s*(\d{3,}[\d,]*\.?\d*)',
-        # Even simpler: just the number pattern after "ultimoValore"
-        r'ultimoValore[^>]*>([0-9]{3,}[0-9,]*\.[0-9]+)',
-    ]
-    for pattern in html_patterns:
-        html_match = re.search(pattern, html, flags=re.IGNORECASE | re.DOTALL)
-        if html_match:
-            val_str = html_match.group(1).replace(",", "").strip()
-            try:
-                val = float(val_str)
-                if 500 <= val <= 10000:
-                    return [(datetime.utcnow(), val)]
-            except ValueError:
-                continue
-
-    # Strategy 4: Fall back to text search
-    text = soup.get_text(separator=" ", strip=True)
-    # Pattern: "Argentina 5 Years" ... number (require 3+ digits)
-    m = re.search(r"Argentina.*?5\s*Years.*?(\d{3,}[\d,]*\.?\d*)", text, flags=re.IGNORECASE)
-    if not m:
-        m = re.search(r"CDS.*?Argentina.*?(\d{3,}[\d,]*\.?\d*)", text, flags=re.IGNORECASE)
-    
-    if m:
-        try:
-            val = float(m.group(1).replace(",", ""))
-            if 500 <= val <= 10000:
-                return [(datetime.utcnow(), val)]
-        except ValueError:
-            pass
-
-    # Strategy 5: Ultimate fallback - find any number in CDS range (1000-1100) near Argentina/CDS keywords
-    # This is a very broad search but should catch the value if it exists anywhere in the HTML
-    # Look for numbers in reasonable CDS range that appear near relevant keywords
-    all_numbers = re.findall(r'\b(\d{4}\.\d+)\b', html)
-    # Filter to numbers in reasonable Argentina CDS range (currently ~1000-1100 bps)
-    candidates = []
-    for num_str in all_numbers:
-        try:
-            val = float(num_str)
-            if 1000 <= val <= 1100:  # Narrow range for current Argentina CDS
-                # Check if it appears near Argentina or CDS in the HTML
-                num_pos = html.find(num_str)
-                if num_pos >= 0:
-                    context_start = max(0, num_pos - 500)
-                    context_end = min(len(html), num_pos + 500)
-                    context = html[context_start:context_end].lower()
-                    if 'argentina' in context or 'cds' in context or 'ultimovalore' in context:
-                        candidates.append((val, num_pos))
-        except ValueError:
-            continue
-    
-    if candidates:
-        # Prefer the one closest to "ultimoValore" or "Argentina"
-        ultimo_pos = html.lower().find('ultimovalore')
-        arg_pos = html.lower().find('argentina')
-        if ultimo_pos >= 0 or arg_pos >= 0:
-            min_ref_pos = min([p for p in [ultimo_pos, arg_pos] if p >= 0], default=-1)
-            if min_ref_pos >= 0:
-                candidates.sort(key=lambda x: abs(x[1] - min_ref_pos))
-                return [(datetime.utcnow(), candidates[0][0])]
-        
-        # Otherwise just pick the first (should only be one anyway)
-        return [(datetime.utcnow(), candidates[0][0])]
+    val = _latest_from_raw_html(html)
+    if val is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
+        for strategy in (_latest_from_dom, _latest_from_text):
+            val = strategy(soup)
+            if val is not None:
+                break
+    if val is None:
+        val = _latest_near_keywords(html)
+    if val is not None:
+        return [(datetime.utcnow(), val)]
 
     # Final fallback: Try the hub table
     rows = fetch_history_argentina_cds_5y_wgb()
     if rows:
         return rows[-1:]
     
-    # If we got here and the HTML contains the expected markers but no value was found,
-    # the page might be JavaScript-rendered. Try one more time with a very simple search.
-    if has_summary_banner and has_summary_value_number:
-        # Last resort: find ANY span with summary-value-number class, regardless of structure
-        all_summary_spans = soup.find_all('span', class_=lambda x: x and 'summary-value-number' in str(x))
-        for span in all_summary_spans:
-            val_text = span.get_text(strip=True)
-            # Skip placeholders
-            if val_text in ('----', '---', '--', '-', ''):
-                continue
-            try:
-                val = float(val_text.replace(",", ""))
-                if 500 <= val <= 10000:
-                    return [(datetime.utcnow(), val)]
-            except ValueError:
-                continue
-    
     # Final attempt: Use Playwright to render JavaScript if available
     playwright_val = _try_playwright()
     if playwright_val is not None:
@@ -381,6 +384,11 @@ class WGBCDSProvider(SeriesProvider):
     Supports series code "CDS_ARG_5Y_USD" to fetch Argentina 5-year CDS spreads.
     """
     
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(("CDS_ARG_5Y_USD",))
+    
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
@@ -1,8 +1,11 @@
 """Yahoo Finance FX data provider."""
 
 from datetime import datetime
-from typing import List, Tuple, Optional
-from .base import SeriesProvider, ProviderError
+from typing import Dict, List, Tuple, Optional, FrozenSet
+
+import pandas as pd
+
+from .base import SeriesProvider, ProviderError, parquet_cache
 
 # Lazy import to avoid hard dependency if not used
 def _yf():
@@ -14,7 +17,28 @@ YF_MAP = {
 }
 
 
+def _download_kwargs(start: Optional[str], end: Optional[str]) -> dict:
+    """yf.download range arguments; a broad period if start not provided."""
+    kwargs = {"period": "max" if not start else None}
+    if start and end:
+        kwargs.update(start=start, end=end)
+    return kwargs
+
+
+def _close_rows(close: pd.Series) -> List[Tuple[datetime, float]]:
+    """Convert a yfinance Close column into (naive UTC datetime, rate) rows."""
+    close = close.dropna()
+    # yfinance index can be tz-aware; normalize to naive UTC
+    idx = close.index if close.index.tz is None else close.index.tz_convert(None)
+    return list(zip(idx.to_pydatetime().tolist(), close.to_numpy(dtype=float).tolist()))
+
+
 class YahooFXProvider(SeriesProvider):
+    @classmethod
+    def supported_codes(cls) -> FrozenSet[str]:
+        return frozenset(YF_MAP)
+    
+    @parquet_cache
     def fetch_timeseries(
         self,
         series_code: str,
@@ -25,22 +49,57 @@ class YahooFXProvider(SeriesProvider):
         if not ticker:
             raise ProviderError(f"YahooFXProvider: unknown series_code={series_code}")
         yf = _yf()
-        # Use a broad period if start not provided
-        period = "max" if not start else None
-        kwargs = {}
-        if start and end:
-            kwargs = {"start": start, "end": end}
-        data = yf.download(ticker, period=period, **kwargs, progress=False, interval="1d")
+        data = yf.download(ticker, **_download_kwargs(start, end), progress=False, interval="1d")
         if data is None or data.empty:
             raise ProviderError("YahooFXProvider: empty dataframe")
-        out: List[Tuple[datetime, float]] = []
-        # Use 'Close' as rate
-        for ts, row in data.iterrows():
-            val = row.get("Close")
-            if val is None:
-                continue
-            # yfinance ts can be pandas.Timestamp with tz; normalize to naive UTC
-            dt = datetime.utcfromtimestamp(ts.to_pydatetime().timestamp())
-            out.append((dt, float(val)))
+        # Use 'Close' as rate; recent yfinance returns (field, ticker) columns
+        close = data["Close"]
+        if isinstance(close, pd.DataFrame):
+            close = close.iloc[:, 0]
+        return _close_rows(close)
+    
+    def fetch_many(
+        self,
+        series_codes: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict[str, List[Tuple[datetime, float]]]:
+        """Fetch several FX series with one bulk yf.download call.
+        
+        yfinance fans the tickers out over its own thread pool, so N series
+        cost one call instead of N. A single series goes through
+        fetch_timeseries to keep the Parquet cache.
+        
+        Args:
+            series_codes: Series identifiers to fetch
+            start: Start date in YYYY-MM-DD format (optional)
+            end: End date in YYYY-MM-DD format (optional)
+            
+        Returns:
+            Dict mapping each series code to its [(timestamp, value)] rows
+            
+        Raises:
+            ProviderError: If any series is unknown or comes back empty
+        """
+        if len(set(series_codes)) <= 1:
+            return super().fetch_many(series_codes, start=start, end=end)
+        tickers = {}
+        for code in series_codes:
+            if code not in YF_MAP:
+                raise ProviderError(f"YahooFXProvider: unknown series_code={code}")
+            tickers[code] = YF_MAP[code]
+        yf = _yf()
+        data = yf.download(
+            sorted(set(tickers.values())), **_download_kwargs(start, end),
+            group_by="ticker", threads=True, progress=False, interval="1d",
+        )
+        out: Dict[str, List[Tuple[datetime, float]]] = {}
+        for code, ticker in tickers.items():
+            # group_by="ticker" puts the ticker on the outer column level
+            if data is None or ticker not in data.columns.get_level_values(0):
+                raise ProviderError(f"YahooFXProvider: no data for {ticker}")
+            rows = _close_rows(data[ticker]["Close"])
+            if not rows:
+                raise ProviderError(f"YahooFXProvider: empty dataframe for {ticker}")
+            out[code] = rows
         return out
-
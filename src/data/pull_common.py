@@ -1,9 +1,10 @@
 """Common utilities for data pulling."""
 
-import requests
 from datetime import datetime
 from typing import List, Tuple, Any
 
+from .providers.base import get_session, parse_json
+
 
 def fetch_json(url: str) -> dict[str, Any]:
     """Fetch JSON data from a URL.
@@ -17,9 +18,9 @@ def fetch_json(url: str) -> dict[str, Any]:
     Raises:
         requests.RequestException: If the request fails
     """
-    response = requests.get(url, timeout=30)
+    response = get_session().get(url, timeout=30)
     response.raise_for_status()
-    return response.json()
+    return parse_json(response)
 
 
 def to_rows(datetimes: List[datetime], values: List[float]) -> List[Tuple[datetime, float]]:
@@ -1,13 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import yaml
-from src.data.db import upsert_timeseries
-from src.data.providers.eod_bonds import fetch_quotes_for_universe
-from src.models.embi_local import compute_embi_local
+from src.config.series_registry import REGISTRY
+from src.data.db import connect, upsert_series_meta, upsert_timeseries
+from src.data.providers.base import FETCH_MANY_WORKERS
+from src.models.bond_spread import load_bonds
+from src.models.embi_local import compute_embi_local, price_asof
 
 def _load_meta(p="src/data/bonds/arg_usd_bonds.yaml"):
-    import pathlib
-    with open(pathlib.Path(p), "r") as f:
-        return yaml.safe_load(f)
+    return load_bonds(p)
 
 def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/arg_usd_bonds.yaml"):
     print("=" * 60)
@@ -33,7 +33,7 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
     print(f"\n[2/5] Fetching bond quotes (start={start or 'full history'})")
     print("  Attempting to fetch quotes for each bond:")
     
-    # Call fetch_quotes_for_universe but also track individual errors
+    # Fetch each bond separately to track individual errors
     quotes = {}
     errors = []
     from src.data.providers.eod_bonds import fetch_bond_eod_by_isin, EODBondError, EOD_TOKEN
@@ -45,7 +45,11 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
     
     print(f"  ✅ EODHD API token found")
     
-    # Try each bond individually to get error details
+    # Try each bond individually to get error details. The fetches are I/O bound,
+    # so issue them concurrently and report in metadata order
+    with ThreadPoolExecutor(max_workers=FETCH_MANY_WORKERS) as pool:
+        futures = {b["isin"]: pool.submit(fetch_bond_eod_by_isin, b["isin"], start=start)
+                   for b in bonds_meta if b.get("isin")}
     for b in bonds_meta:
         isin = b.get("isin")
         ticker = (b.get("ticker") or isin).upper()
@@ -56,7 +60,7 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
         
         try:
             print(f"    {ticker} ({isin}): Fetching...", end=" ", flush=True)
-            rows = fetch_bond_eod_by_isin(isin, start=start)
+            rows = futures[isin].result()
             if rows:
                 quotes[ticker] = rows
                 print(f"✅ {len(rows)} quotes")
@@ -100,12 +104,12 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
             print("    - Verify EODHD API documentation for correct endpoint format")
         return 0
     
-    # Show quote date ranges
+    # Show quote date ranges (fetch_bond_eod_by_isin returns rows sorted by date,
+    # so the endpoints are the first and last rows)
     for ticker, rows in quotes.items():
         if rows:
-            dates = [ts for ts, _ in rows]
-            min_date = min(dates).strftime("%Y-%m-%d")
-            max_date = max(dates).strftime("%Y-%m-%d")
+            min_date = rows[0][0].strftime("%Y-%m-%d")
+            max_date = rows[-1][0].strftime("%Y-%m-%d")
             print(f"    {ticker}: {len(rows)} quotes from {min_date} to {max_date}")
     
     # Check minimum bonds requirement
@@ -115,7 +119,7 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
         print(f"  ✅ Met minimum bond requirement: {len(used)} >= {min_bonds}")
     
     # Determine asof date
-    asof = max(ts for rows in quotes.values() for ts,_ in rows)
+    asof = max(rows[-1][0] for rows in quotes.values())
     print(f"\n[3/5] Computing EMBI as of: {asof.strftime('%Y-%m-%d')}")
     
     # Compute EMBI
@@ -145,12 +149,7 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
         w = detail.get("w", 0.0)
         
         # Find the bond price used
-        bond_price = None
-        if ticker in quotes and quotes[ticker]:
-            for ts, px in reversed(quotes[ticker]):
-                if ts <= asof:
-                    bond_price = px
-                    break
+        bond_price = price_asof(quotes[ticker], asof) if quotes.get(ticker) else None
         
         total_weighted_spread += w * spr_bps
         total_weight += w
@@ -172,7 +171,9 @@ def refresh_embi_resilient(start=None, min_bonds=2, meta_path="src/data/bonds/ar
     
     # Store result
     print(f"\n[5/5] Storing EMBI result to database")
-    upsert_timeseries("EMBI_ARG_LOCAL", [(res["asof"], res["embi_local_bps"])])
+    with connect() as conn:
+        upsert_series_meta(conn, [REGISTRY["EMBI_ARG_LOCAL"]])
+        upsert_timeseries(conn, "EMBI_ARG_LOCAL", [(res["asof"], res["embi_local_bps"])])
     print(f"  ✅ Stored EMBI_ARG_LOCAL = {final_embi:.1f} bps as of {asof.strftime('%Y-%m-%d')}")
     
     return 1
@@ -1,11 +1,13 @@
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from statistics import fmean
 from typing import Dict, List, Tuple
 
+from src.data.providers.base import FETCH_MANY_WORKERS
 from src.data.providers.eubond_csv import load_eubond_csv, filter_argentina, build_bond_meta
 from src.data.providers.eod_bonds import fetch_eubond_eod
-from src.data.providers.eod_gbond import fetch_gbond_series
+from src.data.providers.eod_gbond import GBondProvider
 from src.models.synthetic_usd_spread import (
     pick_latest_on_or_before, approx_ytm_from_price,
     implied_usd_yield, to_spread_bps
@@ -66,16 +68,16 @@ def refresh_embi_synth_usd(start="2024-01-01"):
 
     # fetch UST & Bund (10Y as a baseline proxy)
     print(f"\n[3/6] Fetching benchmark yields (start={start}):")
-    print(f"  Fetching US 10Y Treasury (US10Y)...", end=" ", flush=True)
-    us10 = fetch_gbond_series("US10Y", start)
-    print(f"✅ {len(us10)} data points")
+    # Both tenors are requested at once
+    benchmarks = GBondProvider().fetch_many(["US10Y", "DE10Y"], start=start)
+    us10 = benchmarks["US10Y"]
+    de10 = benchmarks["DE10Y"]
+    print(f"  US 10Y Treasury (US10Y): ✅ {len(us10)} data points")
     if us10:
         latest_us = us10[-1][1] * 100  # convert to percentage
         print(f"    Latest US10Y: {latest_us:.2f}%")
     
-    print(f"  Fetching German 10Y Bund (DE10Y)...", end=" ", flush=True)
-    de10 = fetch_gbond_series("DE10Y", start)
-    print(f"✅ {len(de10)} data points")
+    print(f"  German 10Y Bund (DE10Y): ✅ {len(de10)} data points")
     if de10:
         latest_de = de10[-1][1] * 100  # convert to percentage
         print(f"    Latest DE10Y: {latest_de:.2f}%")
@@ -83,12 +85,16 @@ def refresh_embi_synth_usd(start="2024-01-01"):
     # pull quotes for each bond
     print(f"\n[4/6] Fetching EUBOND quotes for each bond:")
     per_bond: Dict[str, List[Tuple[datetime, float, float]]] = {}
+    # EODHD serves one symbol per /eod request, so issue them concurrently on the
+    # shared session instead of paying each round trip in turn
+    with ThreadPoolExecutor(max_workers=FETCH_MANY_WORKERS) as pool:
+        futures = {m["vendor_code"]: pool.submit(fetch_eubond_eod, m["vendor_code"], start=start) for m in meta}
     for m in meta:
         code = m["vendor_code"]
         name = m.get("name", "?")
         print(f"  {code} ({name}): Fetching...", end=" ", flush=True)
         try:
-            rows = fetch_eubond_eod(code, start=start)
+            rows = futures[code].result()
             # rows: [(ts, close_px, maybe_yield)]
             # convert to [(ts, y_eur)]
             out=[]
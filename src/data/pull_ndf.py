@@ -71,10 +71,30 @@ def refresh_ndf_curve(start: Optional[str] = None, end: Optional[str] = None) ->
         from datetime import datetime, timedelta
         start = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
     
+    # One spot fetch and one vectorized pass for the whole curve
+    try:
+        curve = provider.fetch_curve(start=start, end=end)
+    except ProviderError as e:
+        print(f"    ERROR: Provider error for NDF curve: {e}")
+        return 0
+    except Exception as e:
+        print(f"    ERROR: Unexpected error for NDF curve: {type(e).__name__}: {e}")
+        return 0
+    
     total = 0
-    for series_id in NDF_SERIES:
-        count = pull_ndf_series(series_id, start=start, end=end)
-        total += count
+    with connect() as conn:
+        specs = [REGISTRY[sid] for sid in NDF_SERIES if sid in REGISTRY]
+        if specs:
+            upsert_series_meta(conn, specs)
+        for series_id in NDF_SERIES:
+            series = curve.get(series_id)
+            if series is None or series.empty:
+                print(f"    WARNING: No data returned for {series_id}")
+                continue
+            upsert_timeseries(conn, series_id, series)
+            total += len(series)
+            print(f"    ✓ Stored {len(series)} record(s) for {series_id}")
+            print(f"    Latest: {series.index[-1].date().isoformat()}, Value: {series.iloc[-1]:.2f} ARS/USD")
     
     print(f"✓ NDF refresh completed: {total} total record(s) inserted")
     return total
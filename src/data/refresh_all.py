@@ -2,6 +2,8 @@
 
 import sys
 
+from .provider_router import clear_fetch_cache
+from .providers.base import clear_provider_cache
 from .pull_fx import main as pull_fx_main
 from .pull_reserves import main as pull_reserves_main
 from .pull_cpi import main as pull_cpi_main
@@ -18,6 +20,11 @@ def main():
     print("Refreshing all data series...")
     print("=" * 60)
     
+    # Each run starts from fresh provider data: drop the in-process memo and
+    # the Parquet copies that parquet_cache would otherwise serve for a TTL
+    clear_fetch_cache()
+    clear_provider_cache()
+    
     pullers = [
         ("FX (USD/ARS)", pull_fx_main),
         ("Reserves", pull_reserves_main),
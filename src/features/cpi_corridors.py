@@ -6,7 +6,7 @@ from typing import Optional
 import duckdb
 from pydantic import BaseModel
 
-from ..data.db import connect
+from ..data.db import connect, get_latest
 
 
 class CPICorridorResult(BaseModel):
@@ -80,6 +80,42 @@ def corridor(
     }
 
 
+# Scalar query for the latest core CPI 3m annualized rate (usable as a subquery)
+CORE_CPI_3M_ANN_QUERY = """
+    SELECT power(value / prev_value, 3.0 / NULLIF(date_diff('day', prev_ts, ts) / 30.0, 0)) - 1
+    FROM (
+        SELECT 
+            ts, 
+            value, 
+            LAG(ts) OVER w AS prev_ts, 
+            LAG(value) OVER w AS prev_value
+        FROM fact_series 
+        WHERE series_id = 'CPI_CORE'
+        WINDOW w AS (ORDER BY ts)
+    )
+    ORDER BY ts DESC 
+    LIMIT 1
+"""
+
+
+def latest_core_cpi_3m_ann(conn: duckdb.DuckDBPyConnection) -> Optional[float]:
+    """Get the 3-month annualized rate from the latest two core CPI readings.
+    
+    Computed in DuckDB with LAG so only a scalar crosses back into Python;
+    months are approximated as 30 days.
+    
+    Args:
+        conn: DuckDB connection
+        
+    Returns:
+        3-month annualized rate as decimal, or None if fewer than two readings
+    """
+    result = conn.execute(CORE_CPI_3M_ANN_QUERY).fetchone()
+    if not result or result[0] is None:
+        return None
+    return result[0]
+
+
 def _get_latest_core_cpi(conn: duckdb.DuckDBPyConnection) -> Optional[tuple[datetime, float]]:
     """Get latest core CPI value from database.
     
@@ -89,16 +125,9 @@ def _get_latest_core_cpi(conn: duckdb.DuckDBPyConnection) -> Optional[tuple[date
     Returns:
         Tuple of (timestamp, value) or None if not found
     """
-    query = """
-        SELECT ts, value 
-        FROM fact_series 
-        WHERE series_id = 'CPI_CORE'
-        ORDER BY ts DESC 
-        LIMIT 1
-    """
-    result = conn.execute(query).fetchone()
-    if result:
-        return result[0], result[1]
+    ts, value = get_latest(conn, "CPI_CORE")
+    if ts is not None:
+        return ts, value
     return None
 
 
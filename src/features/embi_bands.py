@@ -6,7 +6,7 @@ from typing import Optional
 import duckdb
 from pydantic import BaseModel
 
-from ..data.db import connect
+from ..data.db import connect, get_latest
 
 
 class EMBIBandResult(BaseModel):
@@ -75,20 +75,8 @@ def compute(
     
     try:
         # Get latest EMBI value
-        embi_query = """
-            SELECT ts, value 
-            FROM fact_series 
-            WHERE series_id = 'EMBI_AR'
-            ORDER BY ts DESC 
-            LIMIT 1
-        """
-        embi_result = conn.execute(embi_query).fetchone()
-        
-        current_embi = None
-        latest_ts = datetime.now()
-        
-        if embi_result:
-            latest_ts, current_embi = embi_result
+        embi_ts, current_embi = get_latest(conn, "EMBI_AR")
+        latest_ts = embi_ts if embi_ts is not None else datetime.now()
         
         # Calculate bands from policy score
         bands = _policy_score_to_bands(policy_score)
@@ -6,7 +6,7 @@ from typing import Optional
 import duckdb
 from pydantic import BaseModel
 
-from ..data.db import connect
+from ..data.db import connect, get_latest
 
 
 class FXGapResult(BaseModel):
@@ -95,16 +95,6 @@ def compute(conn: Optional[duckdb.DuckDBPyConnection] = None) -> Optional[FXGapR
 
 def _get_latest_single(conn: duckdb.DuckDBPyConnection, series_id: str) -> tuple[Optional[datetime], Optional[float]]:
     """Get latest (ts, value) for a single series id."""
-    query = """
-        SELECT ts, value 
-        FROM fact_series 
-        WHERE series_id = ?
-        ORDER BY ts DESC 
-        LIMIT 1
-    """
-    row = conn.execute(query, [series_id]).fetchone()
-    if not row:
-        return None, None
-    ts, value = row
+    ts, value = get_latest(conn, series_id)
     return ts, float(value) if value is not None else None
 
@@ -6,7 +6,7 @@ from typing import Optional
 import duckdb
 from pydantic import BaseModel
 
-from ..data.db import connect
+from ..data.db import connect, get_latest
 
 
 class ReservesMomentumResult(BaseModel):
@@ -33,20 +33,11 @@ def compute(conn: Optional[duckdb.DuckDBPyConnection] = None) -> Optional[Reserv
     
     try:
         # Get latest reserves value
-        latest_query = """
-            SELECT ts, value 
-            FROM fact_series 
-            WHERE series_id = 'RESERVES_USD'
-            ORDER BY ts DESC 
-            LIMIT 1
-        """
-        latest_result = conn.execute(latest_query).fetchone()
+        latest_ts, latest_value = get_latest(conn, "RESERVES_USD")
         
-        if not latest_result:
+        if latest_ts is None:
             return None
         
-        latest_ts, latest_value = latest_result
-        
         # Calculate date 28 days ago
         date_4w_ago = latest_ts - timedelta(days=28)
         
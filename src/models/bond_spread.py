@@ -1,6 +1,10 @@
 from datetime import datetime, date
+from functools import lru_cache
 from typing import List, Tuple, Dict
-import math, yaml
+import math, os, yaml
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 def years_to_maturity(asof: datetime, maturity: date) -> float:
     return (maturity - asof.date()).days / 365.25
@@ -30,10 +34,22 @@ def approx_ytm(clean_price: float, coupon: float, freq: int, ytm_guess: float =
         if y< -0.99: y=0.0001
     return max(y,0.0)
 
-def load_meta(path: str) -> Dict[str,dict]:
+@lru_cache(maxsize=8)
+def _parse_bonds(path: str, mtime_ns: int) -> List[dict]:
     with open(path,"r") as f:
-        arr=yaml.safe_load(f)
-    return {x["ticker"].upper(): x for x in arr}
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+def load_bonds(path: str) -> List[dict]:
+    """Parse a bond metadata YAML file.
+    
+    The parse is memoized on (path, mtime), so repeated refreshes reuse it
+    until the file changes. Treat the returned entries as read-only.
+    """
+    path = str(path)
+    return _parse_bonds(path, os.stat(path).st_mtime_ns)
+
+def load_meta(path: str) -> Dict[str,dict]:
+    return {x["ticker"].upper(): x for x in load_bonds(path)}
 
 def bond_spread_bps(asof: datetime, px: float, meta: dict, ust_curve_fn) -> float:
     ytm = approx_ytm(px, meta["coupon"], meta["freq"])
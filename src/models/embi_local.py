@@ -1,8 +1,15 @@
+from bisect import bisect_right
 from datetime import datetime
-from typing import Dict, List, Tuple
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from .bond_spread import load_meta, bond_spread_bps
 from src.data.db import connect, upsert_timeseries
 
+def price_asof(rows: List[Tuple[datetime,float]], asof: datetime) -> Optional[float]:
+    """Last price on/ before asof from date-sorted (ts, price) rows, or None."""
+    i = bisect_right(rows, asof, key=itemgetter(0))
+    return rows[i-1][1] if i else None
+
 def compute_embi_local(asof: datetime, quotes: Dict[str, List[Tuple[datetime,float]]], meta_path: str) -> dict:
     meta=load_meta(meta_path)
     curve=fetch_ust_curve(asof.date().isoformat())
@@ -11,10 +18,7 @@ def compute_embi_local(asof: datetime, quotes: Dict[str, List[Tuple[datetime,flo
     for ticker, rows in quotes.items():
         if ticker not in meta or not rows: continue
         # use last price on/ before asof
-        px=None
-        for ts, p in reversed(rows):
-            if ts<=asof:
-                px=p; break
+        px=price_asof(rows, asof)
         if px is None: continue
         spr, ytm, ust, ttm = bond_spread_bps(asof, px, meta[ticker], ust_fn)
         w = meta[ticker].get("weight", 0.25)
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from src.data.providers.bcra import detalle_rows, filter_detalle, parse_detalle
+
+
+def test_parse_detalle_matches_row_loop():
+    # Vectorized parse agrees with per-row fromisoformat/float and sorts by date
+    detalle = [
+        {"fecha": "2024-01-03", "valor": 3},
+        {"fecha": "2024-01-01", "valor": "1.5"},
+        {"fecha": "", "valor": 9},
+        {"fecha": "2024-01-02", "valor": None},
+    ]
+    expected = sorted(
+        (datetime.fromisoformat(r["fecha"]), float(r["valor"]))
+        for r in detalle
+        if r["fecha"] and r["valor"] is not None
+    )
+    rows = detalle_rows(parse_detalle(detalle))
+    assert rows == expected
+    assert all(type(ts) is datetime for ts, _ in rows)
+
+
+def test_filter_detalle_inclusive_by_day():
+    # ISO prefix comparison keeps both endpoints, including timestamped fechas
+    detalle = [
+        {"fecha": "2024-01-01", "valor": 1},
+        {"fecha": "2024-01-02T00:00:00", "valor": 2},
+        {"fecha": "2024-01-03", "valor": 3},
+        {"fecha": None, "valor": 4},
+    ]
+    kept = filter_detalle(detalle, "2024-01-02", "2024-01-03")
+    assert [row["valor"] for row in kept] == [2, 3]
+    assert filter_detalle(detalle, None, None) is detalle
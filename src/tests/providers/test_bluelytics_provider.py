@@ -1,4 +1,7 @@
+import json
+
 import pytest
+from src.config.settings import get_settings
 from src.data.providers.bluelytics import BluelyticsProvider
 
 
@@ -12,3 +15,22 @@ def test_bluelytics_fetch_smoke(monkeypatch):
         assert True  # network may be blocked; interface shouldn't crash test run
 
 
+
+
+def test_bluelytics_historical_range(monkeypatch):
+    # Offline: fake one response per day; 404 days are dropped, output is sorted.
+    class FakeResponse:
+        def __init__(self, day):
+            self.status_code = 404 if day.endswith("-02") else 200
+            self.content = json.dumps({"blue": {"value_avg": float(day[-2:])}}).encode()
+
+        def json(self):
+            return json.loads(self.content)
+
+    def fake_get(self, url, timeout=None):
+        return FakeResponse(url.rsplit("=", 1)[1])
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+    monkeypatch.setattr(get_settings(), "PROVIDER_CACHE_TTL", 0)
+    rows = BluelyticsProvider().fetch_timeseries("USDARS_BLUE", start="2024-01-01", end="2024-01-04")
+    assert [(d.day, v) for d, v in rows] == [(1, 1.0), (3, 3.0), (4, 4.0)]
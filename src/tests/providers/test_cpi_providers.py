@@ -0,0 +1,72 @@
+import pytest
+
+from src.data.providers import fred_cpi, indec
+
+
+def test_indec_series_id_resolved_once(monkeypatch):
+    # /search runs once; later calls within the TTL reuse the id
+    calls = []
+
+    def search():
+        calls.append(1)
+        return "101.1_TEST"
+
+    monkeypatch.setattr(indec, "_search_first_id", search)
+    monkeypatch.setattr(indec, "_series_id_cache", None)
+    assert indec._resolve_series_id() == "101.1_TEST"
+    assert indec._resolve_series_id() == "101.1_TEST"
+    assert len(calls) == 1
+
+    # Expired entries trigger a fresh search
+    monkeypatch.setattr(indec, "SERIES_ID_TTL", 0)
+    indec._resolve_series_id()
+    assert len(calls) == 2
+
+
+def test_fred_series_map_cached():
+    assert fred_cpi._series_map() is fred_cpi._series_map()
+    assert set(fred_cpi._series_map()) == {"CPI_NATIONAL_INDEX", "CPI_NATIONAL_YOY", "CPI_NATIONAL_MOM"}
+
+
+def test_fred_build_params_uses_module_key(monkeypatch):
+    # The key is read once at import; a missing key fails on first use, not at import
+    monkeypatch.setattr(fred_cpi, "FRED_API_KEY", "k")
+    params = fred_cpi._build_params("X", None, "2024-12-31")
+    assert params == {
+        "series_id": "X",
+        "api_key": "k",
+        "file_type": "json",
+        "observation_start": "2016-01-01",
+        "observation_end": "2024-12-31",
+    }
+    monkeypatch.setattr(fred_cpi, "FRED_API_KEY", "")
+    with pytest.raises(fred_cpi.ProviderError):
+        fred_cpi._build_params("X", None, None)
+
+
+def test_imf_fetch_index_falls_back_without_end(monkeypatch):
+    # Each backend is tried in order until one answers, whether or not end is given
+    from types import SimpleNamespace
+
+    from src.data.providers import imf_cpi
+
+    tried = []
+
+    class FakeClient:
+        def __init__(self, source):
+            self.source = source
+
+        def data(self, *args, **kwargs):
+            tried.append(self.source)
+            raise RuntimeError("unavailable")
+
+        def get(self, url, params):
+            tried.append(self.source)
+            obs = [SimpleNamespace(period="2024-02", value=2.0), SimpleNamespace(period="2024-01", value=1.0)]
+            return SimpleNamespace(data=[SimpleNamespace(obs=obs)])
+
+    monkeypatch.setattr(imf_cpi, "_client", FakeClient)
+    monkeypatch.delenv("IMF_CPI_SOURCE", raising=False)
+    rows = imf_cpi.IMFProviderCPI()._fetch_index("2024-01-01", None)
+    assert tried == ["IMF_DATA", None]
+    assert [v for _, v in rows] == [1.0, 2.0]
@@ -0,0 +1,37 @@
+import json
+from datetime import datetime
+
+from src.data.providers import eod_bonds
+
+BODY = json.dumps([
+    {"date": "2024-01-03", "close": 61.0},
+    {"date": "2024-01-02", "close": 60.0},
+    {"date": "2024-01-04", "close": 90.0},   # one-day jump, dropped
+    {"date": "2024-01-05", "close": 2.0},    # implausible price, dropped
+    {"date": "2024-01-08", "close": None},
+]).encode()
+
+
+class FakeResponse:
+    status_code = 200
+    content = BODY
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def test_fetch_bond_eod_by_isin_sorted_and_filtered(monkeypatch):
+    seen = []
+
+    class FakeSession:
+        def get(self, url, params=None, timeout=None):
+            seen.append(url)
+            return FakeResponse()
+
+    monkeypatch.setattr(eod_bonds, "EOD_TOKEN", "token")
+    monkeypatch.setattr(eod_bonds, "get_session", lambda: FakeSession())
+
+    rows = eod_bonds.fetch_bond_eod_by_isin("XS2202881995", start="2024-01-01")
+
+    assert seen == [f"{eod_bonds.EOD_BASE}/eod/XS2202881995.BOND"]
+    assert rows == [(datetime(2024, 1, 2), 60.0), (datetime(2024, 1, 3), 61.0)]
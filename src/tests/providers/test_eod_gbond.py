@@ -0,0 +1,38 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.data.providers import eod_gbond
+
+BODY = json.dumps([
+    {"date": "2024-01-03", "close": 4.1},
+    {"date": "2024-01-02", "close": None, "price": 4.0},
+    {"date": "2024-01-04", "close": ""},
+]).encode()
+
+
+class FakeResponse:
+    status_code = 200
+    content = BODY
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    def get(self, url, params=None, timeout=None):
+        return FakeResponse()
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    monkeypatch.setattr(eod_gbond, "get_session", lambda: FakeSession())
+
+
+def test_fetch_gbond_series_parses_yields(fake_session):
+    # Falls back to price when close is missing; yields come back as decimals
+    rows = eod_gbond.fetch_gbond_series("US10Y", "2024-01-01")
+    assert [ts for ts, _ in rows] == [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+    assert [y for _, y in rows] == pytest.approx([0.04, 0.041])
+
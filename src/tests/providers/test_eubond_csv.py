@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from src.data.providers.eubond_csv import build_bond_meta, filter_argentina, load_eubond_csv, parse_coupon_maturity
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Argentina 5.5% 2030", (5.5, "2030-12-31")),
+    ("ARGENTINA 0.125 % 09/07/30 ", (0.125, "2030-07-09")),
+    ("Argentina 01/02/30 4.5%", (4.5, "2030-02-01")),
+    ("Arg 7% 1% 2029", (7.0, "2029-12-31")),
+    ("Argentina 2038", (None, "2038-12-31")),
+    ("Argentina Bond", (None, None)),
+    ("", (None, None)),
+])
+def test_parse_coupon_maturity(name, expected):
+    assert parse_coupon_maturity(name) == expected
+
+
+def test_parse_four_digit_year_in_date():
+    # dd/mm/yyyy keeps the full year instead of truncating to its first two digits
+    assert parse_coupon_maturity("Republic of Argentina 3.375% 15/01/2023") == (3.375, "2023-01-15")
+
+
+def test_filter_argentina_matches_any_text_column():
+    # Match on any descriptive column, case-insensitive; keep EUR lines only
+    df = pd.DataFrame({
+        "code": ["A", "B", "C", "D"],
+        "name": ["Republic of ARGENTINA 2030", "Brazil 2030", None, "Argentina 2035"],
+        "country": ["AR", "BR", "Argentina", "AR"],
+        "currency": ["eur", "EUR", "EUR", "USD"],
+    })
+    assert filter_argentina(df)["code"].tolist() == ["A", "C"]
+
+
+def test_build_bond_meta_columns():
+    # Blank codes are skipped; missing currency defaults to EUR
+    df = pd.DataFrame({"code": [" ARG1 ", ""], "name": ["Argentina 5% 2030", "Argentina 2031"]})
+    meta = build_bond_meta(df)
+    assert [m["vendor_code"] for m in meta] == ["ARG1"]
+    assert meta[0]["currency"] == "EUR"
+    assert (meta[0]["coupon"], meta[0]["maturity"], meta[0]["freq"]) == (5.0, "2030-12-31", 1)
+
+
+def test_load_eubond_csv_normalizes_and_prunes(tmp_path):
+    # Headers are normalized and columns nobody reads are skipped
+    path = tmp_path / "eubond.csv"
+    path.write_text(
+        "Code,Name,Country,Currency,Exchange,Extra Col\n"
+        "ARG1,Argentina 5% 2030,Argentina,EUR,EUBOND,1\n"
+        "BRA1,Brazil 5% 2030,Brazil,EUR,EUBOND,2\n"
+    )
+    df = load_eubond_csv(str(path))
+    assert list(df.columns) == ["code", "name", "country", "currency"]
+    assert [m["vendor_code"] for m in build_bond_meta(filter_argentina(df))] == ["ARG1"]
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from src.data.providers.base import ProviderError, SeriesProvider
+
+
+class FakeProvider(SeriesProvider):
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def fetch_timeseries(self, series_code, start=None, end=None):
+        # Every code waits for the others, so this only passes if they run concurrently
+        self.barrier.wait()
+        if series_code == "BAD":
+            raise ProviderError("boom")
+        return [(start, series_code)]
+
+
+def test_fetch_many_runs_codes_concurrently():
+    result = FakeProvider(3).fetch_many(["A", "B", "C"], start="2024-01-01")
+    assert list(result) == ["A", "B", "C"]
+    assert result["B"] == [("2024-01-01", "B")]
+
+
+def test_fetch_many_raises_provider_error():
+    with pytest.raises(ProviderError):
+        FakeProvider(2).fetch_many(["A", "BAD"])
+
+
+def test_fetch_arrays_unpacks_rows():
+    # Rows become parallel datetime64/float64 arrays, in the provider's order
+    from datetime import datetime
+
+    import numpy as np
+
+    class RowsProvider(SeriesProvider):
+        def fetch_timeseries(self, series_code, start=None, end=None):
+            return [(datetime(2024, 1, 2), 2.0), (datetime(2024, 1, 1), 1.5)]
+
+    ts, values = RowsProvider().fetch_arrays("X")
+    assert ts.dtype == np.dtype("datetime64[ns]")
+    assert list(ts) == [np.datetime64("2024-01-02"), np.datetime64("2024-01-01")]
+    assert values.dtype == np.float64 and values.tolist() == [2.0, 1.5]
+
+    class EmptyProvider(SeriesProvider):
+        def fetch_timeseries(self, series_code, start=None, end=None):
+            return []
+
+    ts, values = EmptyProvider().fetch_arrays("X")
+    assert len(ts) == 0 and len(values) == 0
@@ -0,0 +1,145 @@
+import requests
+
+from src.data.providers import http_cache
+
+
+def test_cached_session_without_requests_cache(monkeypatch):
+    # Missing optional dependency degrades to a plain session
+    monkeypatch.setattr(http_cache, "requests_cache", None)
+    session = http_cache.cached_session()
+    assert type(session) is requests.Session
+
+
+def test_bcra_providers_share_session_setup(monkeypatch):
+    # Warning filters and retry adapters are set up once at import, not per instance
+    import urllib3
+    from src.data.providers.base import get_session
+    from src.data.providers.bcra import BCRAProvider
+    from src.data.providers.bcra_policy import BCRAPolicyProvider
+
+    def fail(*args, **kwargs):
+        raise AssertionError("disable_warnings called per instance")
+
+    monkeypatch.setattr(urllib3, "disable_warnings", fail)
+    BCRAProvider()
+    BCRAPolicyProvider()
+    assert get_session() is get_session()
+
+
+def test_parse_cached_reuses_rows_for_same_validator():
+    # A revalidated (304) replay carries the same ETag, so it is not parsed again
+    from src.data.providers.base import clear_parsed_cache, parse_cached
+
+    calls = []
+
+    def parse(resp):
+        calls.append(resp.url)
+        return [("2024-01-01", 1.0)]
+
+    resp = requests.Response()
+    resp.url = "https://example.test/series/5"
+    resp.headers["ETag"] = '"v1"'
+    clear_parsed_cache()
+    first = parse_cached(resp, parse)
+    first.append("mutated")
+    assert parse_cached(resp, parse) == [("2024-01-01", 1.0)]
+    assert len(calls) == 1
+
+    # New validator or none at all: parse again
+    resp.headers["ETag"] = '"v2"'
+    parse_cached(resp, parse)
+    del resp.headers["ETag"]
+    parse_cached(resp, parse)
+    assert len(calls) == 3
+    clear_parsed_cache()
+
+
+def test_cached_session_per_host_expiry(monkeypatch):
+    # Slow-moving hosts get their own expiry; the default still revalidates
+    captured = {}
+
+    class FakeRequestsCache:
+        @staticmethod
+        def CachedSession(**kwargs):
+            captured.update(kwargs)
+            return requests.Session()
+
+    monkeypatch.setattr(http_cache, "requests_cache", FakeRequestsCache)
+    http_cache.cached_session()
+    assert captured["expire_after"] == 0
+    assert captured["urls_expire_after"].items() >= http_cache.URLS_EXPIRE_AFTER.items()
+    assert "api.stlouisfed.org" in captured["urls_expire_after"]
+    assert captured["urls_expire_after"][http_cache.WGB_HOST].total_seconds() == 900
+    assert captured["key_fn"] is http_cache.cache_key
+
+
+def test_cache_key_ignores_c_only_for_tradingeconomics(monkeypatch):
+    # "c" is the TradingEconomics key; on other hosts it is a real parameter
+    seen = {}
+
+    class FakeRequestsCache:
+        @staticmethod
+        def create_key(request, ignored_parameters=None, **kwargs):
+            seen[request.url] = ignored_parameters
+            return request.url
+
+    monkeypatch.setattr(http_cache, "requests_cache", FakeRequestsCache)
+    te = requests.Request("GET", "https://api.tradingeconomics.com/markets", params={"c": "key"}).prepare()
+    other = requests.Request("GET", "https://example.org/x", params={"c": "1"}).prepare()
+    http_cache.cache_key(te, ignored_parameters=http_cache.IGNORED_PARAMS)
+    http_cache.cache_key(other, ignored_parameters=http_cache.IGNORED_PARAMS)
+    assert "c" in seen[te.url]
+    assert "c" not in seen[other.url]
+    assert set(http_cache.IGNORED_PARAMS) <= set(seen[other.url])
+
+
+def test_shared_session_retry_policy():
+    # Every provider goes through one adapter: GET-only retries honouring Retry-After
+    from src.data.providers.base import get_session
+
+    retry = get_session().get_adapter("https://api.bcra.gob.ar/").max_retries
+    assert retry.total == 5
+    assert retry.allowed_methods == frozenset(["GET"])
+    assert retry.respect_retry_after_header
+    assert 429 in retry.status_forcelist
+
+
+def test_fetch_json_reuses_shared_session(monkeypatch):
+    # pull_common.fetch_json rides the pooled, retrying provider session
+    from src.data import pull_common
+    from src.data.providers.base import get_session
+
+    class Resp:
+        content = b'{"ok": true}'
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"ok": True}
+
+    seen = []
+    monkeypatch.setattr(get_session(), "get", lambda url, **kwargs: seen.append((url, kwargs)) or Resp())
+    assert pull_common.fetch_json("https://example.org/x") == {"ok": True}
+    assert pull_common.fetch_json("https://example.org/y") == {"ok": True}
+    assert [u for u, _ in seen] == ["https://example.org/x", "https://example.org/y"]
+    assert all(kw["timeout"] == 30 for _, kw in seen)
+
+def test_wgb_challenge_page_evicted_from_cache(monkeypatch):
+    # A Cloudflare challenge served with 200 must not stay cached for the TTL
+    from types import SimpleNamespace
+
+    from src.data.providers import wgb_cds
+
+    deleted = []
+    pages = iter(["<title>Just a moment...</title>", "<table>ok</table>"])
+
+    class FakeSession:
+        cache = SimpleNamespace(delete=lambda urls: deleted.extend(urls))
+
+        def get(self, url, **kwargs):
+            return SimpleNamespace(status_code=200, text=next(pages), url=url, headers={})
+
+    monkeypatch.setattr(wgb_cds, "get_session", lambda: FakeSession())
+    assert wgb_cds._polite_get(wgb_cds.WGB_HIST_URL, base_sleep=0) == "<table>ok</table>"
+    assert deleted == [wgb_cds.WGB_HIST_URL]
@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import pytest
+
+from src.data.providers import bcra, ndf_argentina
+
+
+@pytest.fixture(autouse=True)
+def clear_ndf_memos():
+    # Spot rows are memoized per TTL window; isolate each test
+    ndf_argentina._cached_spot_rows.cache_clear()
+    yield
+    ndf_argentina._cached_spot_rows.cache_clear()
+
+
+def test_synthetic_ndf_reads_cds_embi_once(monkeypatch):
+    # One state lookup per series, not one per spot row
+    calls = []
+
+    def latest():
+        calls.append(1)
+        return (1300.0, None)
+
+    spot = [(datetime(2024, 1, d), 1000.0) for d in range(1, 11)]
+    monkeypatch.setattr(ndf_argentina, "_get_latest_cds_embi", latest)
+    monkeypatch.setattr(ndf_argentina, "USE_STATE_CALIBRATION", True)
+    monkeypatch.setattr(bcra.BCRAProvider, "fetch_timeseries", lambda self, *a, **k: spot)
+
+    rows = ndf_argentina._fetch_synthetic_ndf("NDF_12M")
+    assert len(calls) == 1
+    assert len(rows) == len(spot)
+    # CDS above the stressed threshold: 1.5x the 12M base spread
+    expected = 1000.0 * (1 + ndf_argentina.BASE_SPREAD_BPS["12M"] * 1.5 / 10000.0)
+    assert rows[0][1] == expected
+
+
+def test_synthetic_ndf_matches_scalar_pricing(monkeypatch):
+    # The batch path prices every row like the single-shot helper
+    spot = [(datetime(2024, 1, 1), 900.0), (datetime(2024, 1, 2), 1000.0)]
+    monkeypatch.setattr(ndf_argentina, "_get_latest_cds_embi", lambda: (None, 1650.0))
+    monkeypatch.setattr(ndf_argentina, "USE_STATE_CALIBRATION", True)
+    monkeypatch.setattr(bcra.BCRAProvider, "fetch_timeseries", lambda self, *a, **k: spot)
+
+    rows = ndf_argentina._fetch_synthetic_ndf("NDF_3M")
+    expected = [(ts, ndf_argentina._construct_synthetic_ndf("3M", spot_rate=v, days=90)) for ts, v in spot]
+    assert [ts for ts, _ in rows] == [ts for ts, _ in expected]
+    assert [v for _, v in rows] == pytest.approx([v for _, v in expected])
+
+
+def test_state_multiplier_checks_most_stressed_first(monkeypatch):
+    monkeypatch.setattr(ndf_argentina, "USE_STATE_CALIBRATION", True)
+    assert ndf_argentina._get_state_multiplier(1300.0, None) == 1.5
+    assert ndf_argentina._get_state_multiplier(1100.0, 1700.0) == 1.25
+    assert ndf_argentina._get_state_multiplier(500.0, 900.0) == 1.0
+    assert ndf_argentina._get_state_multiplier(None, None) == 1.0
+
+
+def test_latest_cds_embi_single_query(monkeypatch):
+    # Both levels come from one query against fact_series
+    from contextlib import contextmanager
+
+    import duckdb
+
+    from src.config.series_registry import SeriesSpec
+    from src.data import db
+
+    conn = duckdb.connect(":memory:")
+    db.create_schema(conn)
+    ids = ["CDS_ARG_5Y_USD", "EMBI_ARG_LOCAL", "EMBI_ARG_SYNTH_USD"]
+    db.upsert_series_meta(conn, [SeriesSpec(name=s, code=s, freq="D", source="T", units="bps") for s in ids])
+
+    @contextmanager
+    def connect():
+        yield conn
+
+    monkeypatch.setattr(db, "connect", connect)
+    assert ndf_argentina._get_latest_cds_embi() == (None, None)
+
+    db.upsert_timeseries(conn, "CDS_ARG_5Y_USD", [(datetime(2024, 1, 1), 900.0), (datetime(2024, 1, 2), 950.0)])
+    db.upsert_timeseries(conn, "EMBI_ARG_LOCAL", [(datetime(2024, 1, 1), 1500.0)])
+    db.upsert_timeseries(conn, "EMBI_ARG_SYNTH_USD", [(datetime(2024, 1, 3), 1450.0)])
+    assert ndf_argentina._get_latest_cds_embi() == (950.0, 1450.0)
+    conn.close()
+
+
+def test_tenor_params_cover_every_series():
+    assert set(ndf_argentina._TENOR_PARAMS) == {i["tenor"] for i in ndf_argentina.NDF_SERIES_MAP.values()}
+    days, t_frac, spread = ndf_argentina._TENOR_PARAMS["12M"]
+    assert (days, t_frac) == (365, 1.0)
+    assert spread == ndf_argentina.BASE_SPREAD_BPS["12M"] / 10000.0
+
+
+def test_scalar_ndf_skips_state_lookup_when_disabled(monkeypatch):
+    def fail():
+        raise AssertionError("state lookup with calibration disabled")
+
+    monkeypatch.setattr(ndf_argentina, "_get_latest_cds_embi", fail)
+    monkeypatch.setattr(ndf_argentina, "USE_STATE_CALIBRATION", False)
+    base = ndf_argentina._construct_synthetic_ndf("12M", spot_rate=1000.0, days=365, apply_state_calibration=False)
+    assert ndf_argentina._construct_synthetic_ndf("12M", spot_rate=1000.0, days=365) == base
+
+
+def test_spot_fetched_once_across_tenors(monkeypatch):
+    # The four tenors share one BCRA spot fetch within the TTL window
+    from src.config.settings import get_settings
+
+    calls = []
+
+    def fetch(self, series_code, start=None, end=None):
+        calls.append(series_code)
+        return [(datetime(2024, 1, 1), 1000.0)]
+
+    monkeypatch.setattr(get_settings(), "PROVIDER_CACHE_TTL", 3600)
+    monkeypatch.setattr(ndf_argentina, "USE_STATE_CALIBRATION", False)
+    monkeypatch.setattr(bcra.BCRAProvider, "fetch_timeseries", fetch)
+    for code in ndf_argentina.NDF_SERIES_MAP:
+        assert len(ndf_argentina._fetch_synthetic_ndf(code)) == 1
+    assert calls == ["USDARS_OFFICIAL"]
+
+
+def test_fetch_curve_matches_per_tenor_series(monkeypatch):
+    # One broadcast over the spot history prices each tenor like the single-series path
+    spot = [(datetime(2024, 1, 1), 900.0), (datetime(2024, 1, 2), 1000.0)]
+    monkeypatch.setattr(ndf_argentina, "TE_API_KEY", "")
+    monkeypatch.setattr(ndf_argentina, "_get_latest_cds_embi", lambda: (1100.0, None))
+    monkeypatch.setattr(ndf_argentina, "USE_STATE_CALIBRATION", True)
+    monkeypatch.setattr(bcra.BCRAProvider, "fetch_timeseries", lambda self, *a, **k: spot)
+
+    curve = ndf_argentina.NDFArgentinaProvider().fetch_curve()
+    assert set(curve) == set(ndf_argentina.NDF_SERIES_MAP)
+    for code, series in curve.items():
+        rows = ndf_argentina._fetch_synthetic_ndf(code)
+        assert list(series.index.to_pydatetime()) == [ts for ts, _ in rows]
+        assert series.tolist() == [v for _, v in rows]
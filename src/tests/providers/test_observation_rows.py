@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from src.data.providers.base import observation_rows, pct_change_rows
+
+
+def test_observation_rows_parses_periods_and_sorts():
+    # Year and year-month periods resolve to the first day; output is date-sorted
+    rows = observation_rows(["2024-03-15", "2024-03", "2024"], ["3.5", 2, 1.0])
+    assert rows == [
+        (datetime(2024, 1, 1), 1.0),
+        (datetime(2024, 3, 1), 2.0),
+        (datetime(2024, 3, 15), 3.5),
+    ]
+    assert all(type(ts) is datetime and type(v) is float for ts, v in rows)
+    assert observation_rows([], []) == []
+
+
+def test_observation_rows_keeps_ordered_input():
+    # Already-chronological input (with ties) comes back unchanged
+    rows = observation_rows(["2024-01", "2024-02", "2024-02", "2024-03"], [1, 2, 3, 4])
+    assert [v for _, v in rows] == [1.0, 2.0, 3.0, 4.0]
+    assert all(type(ts) is datetime for ts, _ in rows)
+
+
+def test_pct_change_rows_matches_loop():
+    # Vectorized change agrees with the per-row loop, skipping zero bases
+    seq = [(datetime(2024, m, 1), v) for m, v in zip(range(1, 7), [100.0, 0.0, 5.0, 110.0, 121.0, 121.0])]
+    expected = [
+        (seq[i][0], (seq[i][1] / seq[i - 1][1] - 1) * 100)
+        for i in range(1, len(seq))
+        if seq[i - 1][1] != 0
+    ]
+    assert pct_change_rows(seq, 1) == expected
+    assert pct_change_rows(seq, 6) == []
+
+
+def test_observation_rows_pct_lag_matches_two_pass():
+    # Fused change agrees with building the level rows first
+    dates = ["2024-03", "2024-01", "2024-02", "2024-04"]
+    values = [110.0, 100.0, 0.0, 121.0]
+    levels = observation_rows(dates, values)
+    assert observation_rows(dates, values, pct_lag=1) == pct_change_rows(levels, 1)
+    assert observation_rows(dates, values, pct_lag=4) == []
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from src.config.settings import get_settings
+from src.data.providers.base import clear_provider_cache, parquet_cache
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = 0
+
+    @parquet_cache
+    def fetch_timeseries(self, series_code, start=None, end=None):
+        self.calls += 1
+        return [(datetime(2024, 1, 1), 1.5), (datetime(2024, 1, 2), 2.5)]
+
+
+def test_parquet_cache_reuses_ranged_results(monkeypatch, tmp_path):
+    # Second ranged call is served from Parquet; latest-value calls always fetch
+    monkeypatch.setattr(get_settings(), "DATA_PATH", str(tmp_path))
+    monkeypatch.setattr(get_settings(), "PROVIDER_CACHE_TTL", 3600)
+    p = CountingProvider()
+
+    first = p.fetch_timeseries("X", start="2024-01-01")
+    second = p.fetch_timeseries("X", start="2024-01-01")
+    assert second == first
+    assert all(type(ts) is datetime for ts, _ in second)
+    assert p.calls == 1
+
+    p.fetch_timeseries("X")
+    p.fetch_timeseries("X")
+    assert p.calls == 3
+
+
+def test_parquet_cache_disabled_with_zero_ttl(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "DATA_PATH", str(tmp_path))
+    monkeypatch.setattr(get_settings(), "PROVIDER_CACHE_TTL", 0)
+    p = CountingProvider()
+    p.fetch_timeseries("X", start="2024-01-01")
+    p.fetch_timeseries("X", start="2024-01-01")
+    assert p.calls == 2
+    assert not (tmp_path / "provider_cache").exists()
+
+
+def test_clear_provider_cache_forces_refetch(monkeypatch, tmp_path):
+    # Refresh runs clear the Parquet copies so ranged calls go back to the source
+    monkeypatch.setattr(get_settings(), "DATA_PATH", str(tmp_path))
+    monkeypatch.setattr(get_settings(), "PROVIDER_CACHE_TTL", 3600)
+    p = CountingProvider()
+    p.fetch_timeseries("X", start="2024-01-01")
+    clear_provider_cache()
+    assert not (tmp_path / "provider_cache").exists()
+    p.fetch_timeseries("X", start="2024-01-01")
+    assert p.calls == 2
+    clear_provider_cache()  # nothing to delete is fine
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+import src.data.providers as providers
+
+
+def test_base_import_does_not_load_providers():
+    # Fresh interpreter so modules imported by other tests don't leak in
+    code = (
+        "import sys; import src.data.providers.base; "
+        "print(any(m in sys.modules for m in ('src.data.providers.yahoo_fx', 'src.data.providers.bcra')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_provider_attribute():
+    from src.data.providers.bluelytics import BluelyticsProvider
+
+    assert providers.BluelyticsProvider is BluelyticsProvider
+    assert "BCRAProvider" in dir(providers)
+    with pytest.raises(AttributeError):
+        providers.NotAProvider
+
+
+def test_router_import_does_not_load_sdmx():
+    # sdmx is only needed once the IMF fallback is actually queried
+    code = "import sys; import src.data.provider_router; print('sdmx' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
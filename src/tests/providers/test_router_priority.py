@@ -1,15 +1,73 @@
 import os
 import pytest
-from src.data.provider_router import fetch_series
+from src.data import provider_router
+from src.data.provider_router import clear_fetch_cache, fetch_series, refresh_provider_order
 
 def test_provider_order_env_parsing(monkeypatch):
-    monkeypatch.setenv("PREFERRED_PROVIDERS", "BCRA,INDEC,YAHOOFX")
+    monkeypatch.setenv("PREFERRED_PROVIDERS", "BCRA, INDEC,YAHOOFX,NOPE")
+    refresh_provider_order()
+    assert provider_router.PROVIDER_ORDER == ("BCRA", "INDEC", "YAHOOFX", "NOPE")
+    assert [name for name, _ in provider_router.PROVIDER_CHAIN] == ["BCRA", "INDEC", "YAHOOFX"]
     # The call shouldn't crash even if external API is unreachable; expect ProviderError or list
     try:
         _ = fetch_series("USDARS_OFFICIAL", start="2024-01-01")
     except Exception:
         assert True
+    # Restore the default order for later tests
+    monkeypatch.undo()
+    refresh_provider_order()
+
+def test_code_dispatch_skips_providers_without_the_code(monkeypatch):
+    # Known codes go only to providers declaring them, plus open-ended ones
+    monkeypatch.setenv("PREFERRED_PROVIDERS", "BCRA,FRED_CPI,INDEC,YAHOOFX,EOD_BONDS")
+    refresh_provider_order()
+    chains = provider_router.CODE_CHAINS
+    assert [name for name, _ in chains["CPI_NATIONAL_INDEX"]] == ["FRED_CPI", "INDEC", "EOD_BONDS"]
+    assert [name for name, _ in chains["USDARS_OFFICIAL"]] == ["BCRA", "YAHOOFX", "EOD_BONDS"]
+    assert [name for name, _ in provider_router.OPEN_CHAIN] == ["EOD_BONDS"]
+    monkeypatch.undo()
+    refresh_provider_order()
 
 def test_unknown_series_raises():
     with pytest.raises(Exception):
         fetch_series("UNKNOWN_SERIES")
+
+def test_fetch_series_memoizes_results(monkeypatch):
+    # Second call within the TTL is served without hitting the provider
+    calls = []
+
+    class FakeProvider:
+        def fetch_timeseries(self, series_code, start=None, end=None):
+            calls.append(series_code)
+            return [("2024-01-01", 1.0)]
+
+    monkeypatch.setattr(provider_router, "CODE_CHAINS", {})
+    monkeypatch.setattr(provider_router, "OPEN_CHAIN", (("FAKE", FakeProvider),))
+    monkeypatch.setattr(provider_router, "_INSTANCES", {})
+    clear_fetch_cache()
+    first = fetch_series("X", start="2024-01-01")
+    first.append("mutated")
+    assert fetch_series("X", start="2024-01-01") == [("2024-01-01", 1.0)]
+    assert calls == ["X"]
+    clear_fetch_cache()
+
+def test_providers_instantiated_on_first_use(monkeypatch):
+    # Import builds no instances; the chain creates each provider once
+    created = []
+
+    class FakeProvider:
+        def __init__(self):
+            created.append(self)
+
+        def fetch_timeseries(self, series_code, start=None, end=None):
+            return [("2024-01-01", 1.0)]
+
+    monkeypatch.setattr(provider_router, "CODE_CHAINS", {})
+    monkeypatch.setattr(provider_router, "OPEN_CHAIN", (("FAKE", FakeProvider),))
+    monkeypatch.setattr(provider_router, "_INSTANCES", {})
+    clear_fetch_cache()
+    assert created == []
+    fetch_series("X", start="2024-01-01")
+    fetch_series("Y", start="2024-01-01")
+    assert len(created) == 1
+    clear_fetch_cache()
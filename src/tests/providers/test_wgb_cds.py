@@ -0,0 +1,173 @@
+import pytest
+
+from src.data.providers import wgb_cds
+
+
+def _serve(monkeypatch, html):
+    monkeypatch.setattr(wgb_cds, "_polite_get", lambda url: html)
+    monkeypatch.setattr(wgb_cds, "fetch_history_argentina_cds_5y_wgb", lambda: [])
+    monkeypatch.setattr(wgb_cds, "_try_playwright", lambda: None)
+
+
+def test_latest_regex_hit_skips_html_parse(monkeypatch):
+    # The raw-HTML pattern answers before any parse tree is built
+    def no_soup(*args, **kwargs):
+        raise AssertionError("BeautifulSoup should not run")
+
+    _serve(monkeypatch, '<span class="summary-value-number" '
+                        'data-async-variable="jsGlobalResult|result.ultimoValore">1030.95</span>')
+    monkeypatch.setattr(wgb_cds, "BeautifulSoup", no_soup)
+    assert [v for _, v in wgb_cds.fetch_latest_argentina_cds_5y_wgb()] == [1030.95]
+
+
+@pytest.mark.parametrize("parser", ["lxml", "html.parser"])
+def test_latest_falls_through_placeholder_to_text(monkeypatch, parser):
+    # A JS placeholder in the number span falls through to the page text, with
+    # either tree builder (html.parser is the fallback when lxml is missing)
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(wgb_cds, "HTML_PARSER", parser)
+    _serve(monkeypatch, '<div class="summary-banner"><div class="summary-value borsaInverso">'
+                        '<span class="summary-amount"><span class="summary-value-number">----</span>'
+                        '</span></div></div><p>Argentina 5 Years CDS 1785.10 bps</p>')
+    assert [v for _, v in wgb_cds.fetch_latest_argentina_cds_5y_wgb()] == [1785.10]
+
+
+def test_latest_near_keywords_bounded_window():
+    # Only numbers near the first keyword count
+    html = "Argentina spread 1050.25 " + "x" * 2000 + " 1075.50"
+    assert wgb_cds._latest_near_keywords(html) == 1050.25
+    assert wgb_cds._latest_near_keywords("x" * 10 + " 1050.25") is None
+
+
+def test_read_tables_parses_matching_fragment_only():
+    html = (
+        "<table><tr><th>Country</th><th>Yield</th></tr><tr><td>Chile</td><td>5.1</td></tr></table>"
+        "<table><tr><th>Date</th><th>CDS</th></tr><tr><td>2024-01-02</td><td>1,050.5</td></tr></table>"
+    )
+    tables = wgb_cds._read_tables(html, "date")
+    assert len(tables) == 1
+    assert list(tables[0].columns) == ["Date", "CDS"]
+    # No fragment mentions the keyword: the whole page is parsed
+    assert len(wgb_cds._read_tables(html, "argentina")) == 2
+    assert wgb_cds._read_tables("<p>no tables</p>", "date") == []
+
+
+def test_table_series_matches_per_row_parse():
+    import pandas as pd
+
+    dates = pd.Series(["2024-01-02", "Jan 03, 2024", "n/a", "2024-01-04", "2024-01-05"])
+    values = pd.Series(["1,050.5", "1040 bps", "1000", "-", 1030.25])
+    expected = []
+    for d, v in zip(dates, values):
+        try:
+            ts = pd.to_datetime(d).to_pydatetime()
+        except Exception:
+            continue
+        bps = wgb_cds._to_float_bps(v)
+        if bps is not None:
+            expected.append((ts, bps))
+    series = wgb_cds._table_series(dates, values)
+    assert list(zip(series.index.to_pydatetime().tolist(), series.tolist())) == sorted(expected)
+
+
+def test_history_filters_by_date_range(monkeypatch):
+    # Rows come back sorted and inclusive of both end days
+    html = (
+        "<table><tr><th>Date</th><th>CDS</th></tr>"
+        "<tr><td>2024-01-03 15:00</td><td>1030</td></tr>"
+        "<tr><td>2024-01-01</td><td>1010</td></tr>"
+        "<tr><td>2024-01-02</td><td>1020</td></tr>"
+        "<tr><td>2024-01-04</td><td>1040</td></tr></table>"
+    )
+    monkeypatch.setattr(wgb_cds, "_polite_get", lambda url: html)
+    rows = wgb_cds.fetch_history_argentina_cds_5y_wgb(start="2024-01-02", end="2024-01-03")
+    assert [v for _, v in rows] == [1020.0, 1030.0]
+    assert [v for _, v in wgb_cds.fetch_history_argentina_cds_5y_wgb()] == [1010.0, 1020.0, 1030.0, 1040.0]
+
+
+def test_requests_negotiate_compression():
+    assert "gzip" in wgb_cds.HEADERS["Accept-Encoding"]
+
+
+def test_latest_near_keywords_keyword_in_head_value_in_body():
+    # The first keyword is in <head>; the value sits far away next to a later mention
+    html = (
+        "<html><head><title>Argentina 5 Years CDS</title></head><body>"
+        + "<p>filler</p>" * 300
+        + '<div id="ultimoValore">Last: 1045.30 bps</div></body></html>'
+    )
+    assert wgb_cds._latest_near_keywords(html) == 1045.30
+
+
+def test_latest_near_keywords_ranks_by_ultimovalore_or_argentina():
+    # Every keyword opens a window, but CDS alone does not anchor the ranking
+    html = "x" * 1000 + " CDS 1099.5 " + "x" * 1000 + " ultimoValore 1010.5"
+    assert wgb_cds._latest_near_keywords(html) == 1010.5
+    assert wgb_cds._latest_near_keywords("x" * 1000 + " CDS 1099.5 ") == 1099.5
+
+
+def test_playwright_browser_reused_across_calls(monkeypatch):
+    # One browser launch per thread; each call gets its own context, closed afterwards
+    import sys
+    from types import ModuleType, SimpleNamespace
+
+    launched, closed, registered = [], [], []
+
+    class FakeContext:
+        def new_page(self):
+            elem = SimpleNamespace(inner_text=lambda: "1030.95")
+            return SimpleNamespace(
+                goto=lambda *a, **k: None,
+                wait_for_selector=lambda *a, **k: None,
+                query_selector=lambda sel: elem,
+            )
+
+        def close(self):
+            closed.append(1)
+
+    class FakeBrowser:
+        def is_connected(self):
+            return True
+
+        def new_context(self):
+            return FakeContext()
+
+    def launch(headless):
+        launched.append(headless)
+        return FakeBrowser()
+
+    pw = SimpleNamespace(chromium=SimpleNamespace(launch=launch))
+    sync_api = ModuleType("playwright.sync_api")
+    sync_api.sync_playwright = lambda: SimpleNamespace(start=lambda: pw)
+    monkeypatch.setitem(sys.modules, "playwright", ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
+    monkeypatch.setattr(wgb_cds, "_playwright_local", wgb_cds.threading.local())
+    monkeypatch.setattr(wgb_cds.atexit, "register", lambda *args: registered.append(args))
+
+    assert wgb_cds._try_playwright() == 1030.95
+    assert wgb_cds._try_playwright() == 1030.95
+    assert launched == [True]
+    assert len(closed) == 2
+    assert len(registered) == 1
+
+
+def test_polite_get_honours_retry_after(monkeypatch):
+    # A non-200 with Retry-After sleeps at least that long; an excessive one gives up
+    from types import SimpleNamespace
+
+    responses = iter([
+        SimpleNamespace(status_code=403, text="", url="u", headers={"Retry-After": "7"}),
+        SimpleNamespace(status_code=200, text="<table></table>", url="u", headers={}),
+    ])
+    sleeps = []
+    session = SimpleNamespace(get=lambda url, **kwargs: next(responses))
+    monkeypatch.setattr(wgb_cds, "get_session", lambda: session)
+    monkeypatch.setattr(wgb_cds.time, "sleep", sleeps.append)
+    assert wgb_cds._polite_get("u", base_sleep=0) == "<table></table>"
+    assert sleeps and sleeps[0] >= 7
+
+    responses = iter([SimpleNamespace(status_code=403, text="", url="u", headers={"Retry-After": "3600"})])
+    with pytest.raises(wgb_cds.WGBCDSProviderError):
+        wgb_cds._polite_get("u")
+    assert len(sleeps) == 1
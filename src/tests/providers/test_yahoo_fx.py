@@ -0,0 +1,42 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from src.data.providers import yahoo_fx
+from src.data.providers.yahoo_fx import YahooFXProvider
+
+
+def test_yahoo_fx_rows_from_multiindex_close(monkeypatch):
+    # (field, ticker) columns, tz-aware index, a NaN close that is dropped
+    idx = pd.DatetimeIndex(["2024-01-02 03:00", "2024-01-03 03:00", "2024-01-04 03:00"], tz="America/Argentina/Buenos_Aires")
+    cols = pd.MultiIndex.from_tuples([("Close", "ARS=X"), ("Open", "ARS=X")])
+    data = pd.DataFrame([[800.0, 1.0], [np.nan, 1.0], [810.5, 1.0]], index=idx, columns=cols)
+    monkeypatch.setattr(yahoo_fx, "_yf", lambda: SimpleNamespace(download=lambda *a, **k: data))
+
+    rows = YahooFXProvider().fetch_timeseries("USDARS_OFFICIAL")
+
+    assert rows == [(datetime(2024, 1, 2, 6), 800.0), (datetime(2024, 1, 4, 6), 810.5)]
+    assert all(type(ts) is datetime and type(v) is float for ts, v in rows)
+
+
+def test_yahoo_fx_fetch_many_single_download(monkeypatch):
+    # Two codes cost one yf.download; rows are split per ticker
+    monkeypatch.setitem(yahoo_fx.YF_MAP, "EURARS", "EURARS=X")
+    idx = pd.DatetimeIndex(["2024-01-02", "2024-01-03"], tz="UTC")
+    cols = pd.MultiIndex.from_tuples([("ARS=X", "Close"), ("EURARS=X", "Close")])
+    data = pd.DataFrame([[800.0, 880.0], [805.0, np.nan]], index=idx, columns=cols)
+    calls = []
+
+    def download(tickers, **kwargs):
+        calls.append((tickers, kwargs["group_by"]))
+        return data
+
+    monkeypatch.setattr(yahoo_fx, "_yf", lambda: SimpleNamespace(download=download))
+
+    out = YahooFXProvider().fetch_many(["USDARS_OFFICIAL", "EURARS"], start="2024-01-01", end="2024-01-05")
+
+    assert calls == [(["ARS=X", "EURARS=X"], "ticker")]
+    assert out["USDARS_OFFICIAL"] == [(datetime(2024, 1, 2), 800.0), (datetime(2024, 1, 3), 805.0)]
+    assert out["EURARS"] == [(datetime(2024, 1, 2), 880.0)]
@@ -0,0 +1,29 @@
+"""Unit tests for bond metadata and price lookups."""
+
+import os
+from datetime import datetime
+
+from src.models.bond_spread import load_bonds, load_meta
+from src.models.embi_local import price_asof
+
+
+def test_load_bonds_reuses_parse_until_file_changes(tmp_path):
+    """Test the YAML parse is memoized and refreshed when the file changes."""
+    path = tmp_path / "bonds.yaml"
+    path.write_text("- {ticker: gd30, coupon: 0.75}\n")
+
+    first = load_bonds(path)
+    assert load_bonds(path) is first
+    assert load_meta(path)["GD30"]["coupon"] == 0.75
+
+    path.write_text("- {ticker: gd30, coupon: 1.75}\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+    assert load_meta(path)["GD30"]["coupon"] == 1.75
+
+
+def test_price_asof_bisects_sorted_quotes():
+    """Test the last price on or before asof is found, and None before the first quote."""
+    rows = [(datetime(2024, 1, d), float(d)) for d in (2, 3, 5)]
+    assert price_asof(rows, datetime(2024, 1, 4)) == 3.0
+    assert price_asof(rows, datetime(2024, 1, 5)) == 5.0
+    assert price_asof(rows, datetime(2024, 1, 1)) is None
@@ -0,0 +1,26 @@
+"""Unit tests for CPI corridors feature."""
+
+from datetime import datetime
+
+import duckdb
+
+from src.config.series_registry import SeriesSpec
+from src.data.db import create_schema, upsert_series_meta, upsert_timeseries
+from src.features.cpi_corridors import latest_core_cpi_3m_ann
+
+
+def test_latest_core_cpi_3m_ann():
+    """Test the in-database 3m annualization of the latest two core CPI readings."""
+    conn = duckdb.connect(":memory:")
+    create_schema(conn)
+    upsert_series_meta(conn, [SeriesSpec(name="CPI_CORE", code="CPI_CORE", freq="M", source="T", units="Index")])
+    assert latest_core_cpi_3m_ann(conn) is None
+
+    upsert_timeseries(conn, "CPI_CORE", [(datetime(2024, 1, 1), 100.0)])
+    assert latest_core_cpi_3m_ann(conn) is None
+
+    upsert_timeseries(conn, "CPI_CORE", [(datetime(2024, 2, 1), 103.0), (datetime(2023, 12, 1), 90.0)])
+    # 31 days apart, months approximated as 30 days
+    expected = (103.0 / 100.0) ** (3 / (31 / 30.0)) - 1
+    assert abs(latest_core_cpi_3m_ann(conn) - expected) < 1e-12
+    conn.close()
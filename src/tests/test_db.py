@@ -0,0 +1,136 @@
+"""Unit tests for DuckDB upsert helpers."""
+
+from datetime import datetime
+
+import duckdb
+import pytest
+
+from src.config.series_registry import SeriesSpec
+from src.data.db import (
+    append_timeseries,
+    create_schema,
+    get_latest,
+    upsert_series_meta,
+    upsert_timeseries,
+)
+
+
+@pytest.fixture
+def conn():
+    """In-memory DuckDB connection with the project schema."""
+    c = duckdb.connect(":memory:")
+    create_schema(c)
+    upsert_series_meta(c, [SeriesSpec(name="S", code="S", freq="D", source="T", units="U")])
+    yield c
+    c.close()
+
+
+def test_upsert_series_meta_updates_existing(conn):
+    """Test re-upserting a spec updates its metadata."""
+    upsert_series_meta(conn, [
+        SeriesSpec(name="S2", code="S", freq="M", source="T", units="U"),
+        SeriesSpec(name="X", code="X", freq="D", source="T", units="U"),
+    ])
+    rows = conn.execute("SELECT series_id, name, freq FROM dim_series ORDER BY series_id").fetchall()
+    assert rows == [("S", "S2", "M"), ("X", "X", "D")]
+
+
+def test_upsert_series_meta_duplicate_codes_last_wins(conn):
+    """Test duplicate codes within one batch keep the last spec."""
+    upsert_series_meta(conn, [
+        SeriesSpec(name="A", code="Y", freq="D", source="T", units="U"),
+        SeriesSpec(name="B", code="Y", freq="M", source="T", units="U"),
+    ])
+    assert conn.execute("SELECT name, freq FROM dim_series WHERE series_id = 'Y'").fetchall() == [("B", "M")]
+
+
+def test_upsert_timeseries_inserts_and_updates(conn):
+    """Test batch upsert inserts new rows and overwrites existing timestamps."""
+    upsert_timeseries(conn, "S", [(datetime(2024, 1, 1), 1.0), (datetime(2024, 1, 2), 2.0)])
+    upsert_timeseries(conn, "S", [(datetime(2024, 1, 2), 5.0), (datetime(2024, 1, 3), 3.0)])
+    rows = conn.execute("SELECT ts, value FROM fact_series WHERE series_id = 'S' ORDER BY ts").fetchall()
+    assert rows == [
+        (datetime(2024, 1, 1), 1.0),
+        (datetime(2024, 1, 2), 5.0),
+        (datetime(2024, 1, 3), 3.0),
+    ]
+
+
+def test_upsert_timeseries_duplicate_timestamps_last_wins(conn):
+    """Test duplicate timestamps within one batch keep the last value."""
+    upsert_timeseries(conn, "S", [(datetime(2024, 1, 1), 1.0), (datetime(2024, 1, 1), 7.0)])
+    rows = conn.execute("SELECT value FROM fact_series").fetchall()
+    assert rows == [(7.0,)]
+
+
+def test_upsert_timeseries_empty_is_noop(conn):
+    """Test empty input does not touch the table."""
+    upsert_timeseries(conn, "S", [])
+    assert conn.execute("SELECT COUNT(*) FROM fact_series").fetchone()[0] == 0
+
+
+def test_get_latest_tracks_newest_observation(conn):
+    """Test latest_series follows the newest ts, even across backfills."""
+    assert get_latest(conn, "S") == (None, None)
+
+    upsert_timeseries(conn, "S", [(datetime(2024, 3, 1), 3.0)])
+    upsert_timeseries(conn, "S", [(datetime(2024, 1, 1), 1.0)])
+    assert get_latest(conn, "S") == (datetime(2024, 3, 1), 3.0)
+
+    upsert_timeseries(conn, "S", [(datetime(2024, 3, 1), 4.0)])
+    assert get_latest(conn, "S") == (datetime(2024, 3, 1), 4.0)
+
+
+def test_get_latest_falls_back_without_latest_table(conn):
+    """Test databases without latest_series still answer from fact_series."""
+    upsert_timeseries(conn, "S", [(datetime(2024, 1, 1), 1.0)])
+    conn.execute("DROP TABLE latest_series")
+    assert get_latest(conn, "S") == (datetime(2024, 1, 1), 1.0)
+
+
+def test_upsert_timeseries_rejects_unknown_series(conn):
+    """Test rows for a series missing from dim_series are rejected."""
+    with pytest.raises(ValueError):
+        upsert_timeseries(conn, "MISSING", [(datetime(2024, 1, 1), 1.0)])
+    assert conn.execute("SELECT COUNT(*) FROM fact_series").fetchone()[0] == 0
+
+
+def test_append_timeseries_new_rows(conn):
+    """Test the appender path writes sorted rows and updates latest_series."""
+    append_timeseries(conn, "S", [(datetime(2024, 1, 2), 2.0), (datetime(2024, 1, 1), 1.0)])
+    rows = conn.execute("SELECT ts, value FROM fact_series ORDER BY ts").fetchall()
+    assert rows == [(datetime(2024, 1, 1), 1.0), (datetime(2024, 1, 2), 2.0)]
+    assert get_latest(conn, "S") == (datetime(2024, 1, 2), 2.0)
+
+
+def test_append_timeseries_overlap_falls_back_to_upsert(conn):
+    """Test overlapping timestamps are upserted rather than failing."""
+    append_timeseries(conn, "S", [(datetime(2024, 1, 1), 1.0)])
+    append_timeseries(conn, "S", [(datetime(2024, 1, 1), 5.0), (datetime(2024, 1, 2), 2.0)])
+    rows = conn.execute("SELECT ts, value FROM fact_series ORDER BY ts").fetchall()
+    assert rows == [(datetime(2024, 1, 1), 5.0), (datetime(2024, 1, 2), 2.0)]
+
+
+def test_append_timeseries_overlap_inside_transaction(conn):
+    """Test an overlapping append does not abort an explicit transaction."""
+    append_timeseries(conn, "S", [(datetime(2024, 1, 1), 1.0)])
+    conn.begin()
+    append_timeseries(conn, "S", [(datetime(2024, 1, 1), 5.0), (datetime(2024, 1, 2), 2.0)])
+    conn.commit()
+    rows = conn.execute("SELECT ts, value FROM fact_series ORDER BY ts").fetchall()
+    assert rows == [(datetime(2024, 1, 1), 5.0), (datetime(2024, 1, 2), 2.0)]
+
+
+def test_upsert_timeseries_accepts_series(conn):
+    """Test a timestamp-indexed Series upserts like the equivalent tuples."""
+    import pandas as pd
+
+    series = pd.Series(
+        [2.0, 1.0, 3.0],
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-01", "2024-01-02"]),
+    )
+    upsert_timeseries(conn, "S", series)
+    rows = conn.execute("SELECT ts, value FROM fact_series ORDER BY ts").fetchall()
+    assert rows == [(datetime(2024, 1, 1), 1.0), (datetime(2024, 1, 2), 3.0)]
+    append_timeseries(conn, "S", pd.Series([], dtype="float64"))
+    assert get_latest(conn, "S") == (datetime(2024, 1, 2), 3.0)
@@ -0,0 +1,48 @@
+"""Unit tests for the resilient EMBI refresh."""
+
+from datetime import datetime
+
+from src.config.settings import get_settings
+from src.data import pull_embi_resilient
+from src.data.db import connect, create_schema
+from src.data.providers import eod_bonds
+
+BONDS = [
+    {"ticker": "gd30", "isin": "XS1", "weight": 0.5},
+    {"ticker": "al30", "isin": "US2", "weight": 0.5},
+    {"ticker": "bad", "isin": "XX3", "weight": 0.0},
+]
+
+
+def test_refresh_embi_resilient_fetches_per_bond(monkeypatch, tmp_path):
+    """Test per-bond fetch errors are isolated and the index is stored as of the latest quote."""
+    monkeypatch.setattr(get_settings(), "DUCKDB_PATH", str(tmp_path / "macro.duckdb"))
+    with connect() as conn:
+        create_schema(conn)
+
+    def fetch(isin, start=None):
+        if isin == "XX3":
+            raise eod_bonds.EODBondError("EOD HTTP 404")
+        last = 3 if isin == "XS1" else 2
+        return [(datetime(2024, 1, d), 50.0 + d) for d in range(1, last + 1)]
+
+    seen = {}
+
+    def compute(asof, quotes, meta_path):
+        seen.update(asof=asof, quotes=quotes)
+        return {"asof": asof, "embi_local_bps": 1200.0, "details": [
+            {"ticker": "GD30", "spr_bps": 1200.0, "ytm": 0.1, "ust": 0.04, "ttm": 6.0, "w": 1.0},
+        ]}
+
+    monkeypatch.setattr(eod_bonds, "EOD_TOKEN", "token")
+    monkeypatch.setattr(eod_bonds, "fetch_bond_eod_by_isin", fetch)
+    monkeypatch.setattr(pull_embi_resilient, "_load_meta", lambda p: BONDS)
+    monkeypatch.setattr(pull_embi_resilient, "compute_embi_local", compute)
+
+    assert pull_embi_resilient.refresh_embi_resilient(min_bonds=2) == 1
+
+    assert sorted(seen["quotes"]) == ["AL30", "GD30"]
+    assert seen["asof"] == datetime(2024, 1, 3)
+    with connect() as conn:
+        rows = conn.execute("SELECT ts, value FROM fact_series WHERE series_id = 'EMBI_ARG_LOCAL'").fetchall()
+    assert rows == [(datetime(2024, 1, 3), 1200.0)]
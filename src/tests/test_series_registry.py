@@ -0,0 +1,18 @@
+"""Unit tests for the series registry."""
+
+import pytest
+
+from src.config.series_registry import REGISTRY, get_series_spec, list_all_series
+
+
+def test_list_all_series_sorted_and_complete():
+    """Test the precomputed listing covers the registry in sorted order."""
+    names = list_all_series()
+    assert names == tuple(sorted(REGISTRY))
+    assert list_all_series() is names
+
+
+def test_registry_is_read_only():
+    """Test the registry cannot be mutated at runtime."""
+    with pytest.raises(TypeError):
+        REGISTRY["NEW"] = get_series_spec("EMBI_AR")
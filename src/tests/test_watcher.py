@@ -0,0 +1,47 @@
+"""Unit tests for the state watcher."""
+
+from datetime import datetime
+
+import duckdb
+import pytest
+
+from src.app.watcher import get_state_inputs
+from src.config.series_registry import SeriesSpec
+from src.data.db import create_schema, upsert_series_meta, upsert_timeseries
+from src.features.cpi_corridors import latest_core_cpi_3m_ann
+from src.features.fx_gap import compute as compute_fx_gap
+from src.features.reserves_momentum import compute as compute_reserves_momentum
+
+SERIES = ["EMBI_AR", "CPI_CORE", "RESERVES_USD", "USDARS_PARALLEL", "USDARS_OFFICIAL"]
+
+
+@pytest.fixture
+def conn():
+    """In-memory DuckDB connection with the series the watcher reads."""
+    c = duckdb.connect(":memory:")
+    create_schema(c)
+    upsert_series_meta(c, [SeriesSpec(name=s, code=s, freq="D", source="T", units="U") for s in SERIES])
+    yield c
+    c.close()
+
+
+def test_get_state_inputs_empty(conn):
+    """Test all inputs are None when there is no data."""
+    assert all(v is None for v in get_state_inputs(conn).values())
+
+
+def test_get_state_inputs_matches_features(conn):
+    """Test the single-query inputs agree with the individual feature computations."""
+    upsert_timeseries(conn, "EMBI_AR", [(datetime(2024, 1, 1), 1500.0), (datetime(2024, 3, 1), 1300.0)])
+    upsert_timeseries(conn, "CPI_CORE", [(datetime(2024, 1, 1), 100.0), (datetime(2024, 2, 1), 103.0)])
+    upsert_timeseries(conn, "RESERVES_USD", [(datetime(2024, 1, 1), 20000.0), (datetime(2024, 3, 1), 21000.0)])
+    upsert_timeseries(conn, "USDARS_PARALLEL", [(datetime(2024, 3, 1), 1200.0)])
+    upsert_timeseries(conn, "USDARS_OFFICIAL", [(datetime(2024, 3, 1), 1000.0)])
+
+    inputs = get_state_inputs(conn)
+
+    assert inputs["fx_gap"] == pytest.approx(compute_fx_gap(conn=conn).gap)
+    assert inputs["reserves_mom_4w"] == pytest.approx(compute_reserves_momentum(conn=conn).value)
+    assert inputs["core_cpi_3m_ann"] == pytest.approx(latest_core_cpi_3m_ann(conn))
+    assert inputs["embi_level"] == 1300.0
+    assert inputs["embi_trend_30d"] == -200.0